@@ -0,0 +1,288 @@
+"""Benchmarks for the create.py pipeline on synthetic registration exports.
+
+Usage: python bench.py [--sizes N ...] [--rows N] [--output bench_output.txt]
+
+The stage suite builds an Odoo-shaped export per size, once with each waiver column name,
+and times each engine's ``create.build_teams`` stages (load, forward fill, filter, link
+extraction, DOB formatting, JSON build) plus the HTML write with ``create.StageProfile``,
+then reruns it under tracemalloc for per-stage peak memory. Results go to stdout and to
+``bench_output.txt`` as fixed-width lines that diff cleanly between runs.
+"""
+import argparse
+import csv
+import importlib.util
+import os
+import platform
+import random
+import string
+import tempfile
+import time
+import tracemalloc
+
+import pandas as pd
+
+import create
+
+DRIVE_ID_CHARS = string.ascii_letters + string.digits + "-_"
+SUITE_SIZES = [1_000, 10_000, 100_000]
+SUITE_ENGINES = ['csv', 'pandas']
+BENCH_OUTPUT = "bench_output.txt"
+# The stage suite runs every size once per waiver column name Odoo exports
+STUDIO_WAIVER_HTML_COL = 'x_studio_teams/x_studio_players/x_studio_waiver_html'
+SUITE_WAIVER_COLUMNS = [create.WAIVER_HTML_COL, STUDIO_WAIVER_HTML_COL]
+
+CATEGORIES = ["Publica", "Senior", "Junior", "Juvenil", "Mini"]
+SEXES = ["Masculino", "Femenino"]
+GRADES = [f"{n}th Grade" for n in range(5, 13)]
+STAFF_TYPES = ["Head Coach", "Assistant Coach", "Team Manager"]
+
+
+def drive_id(rng):
+    return "".join(rng.choice(DRIVE_ID_CHARS) for _ in range(33))
+
+
+def doc_html(rng, label):
+    """One cert/waiver cell in one of the shapes Odoo exports produce."""
+    kind = rng.random()
+    file_id = drive_id(rng)
+    if kind < 0.55:
+        return (
+            f'<a href="https://drive.google.com/file/d/{file_id}/view?usp=sharing" '
+            f'target="_blank">{label}.pdf</a>'
+        )
+    if kind < 0.80:
+        return (
+            f'<img src="https://drive.google.com/uc?export=view&amp;id={file_id}" alt="{label}">'
+            f'<a href="https://drive.google.com/open?id={file_id}">{label}.jpg</a>'
+        )
+    if kind < 0.88:
+        return f"<a href='https://docs.google.com/document/d/{file_id}/edit'>{label}</a>"
+    if kind < 0.93:
+        return f'<a href="https://example.org/uploads/{label}.pdf">{label}.pdf</a>'
+    if kind < 0.96:
+        return f'<a href="https://drive.google.com/open?id=%20{file_id}">{label}</a>'
+    return None
+
+
+def synthetic_players(rows, seed=7):
+    """Filtered player rows with only the HTML columns extraction reads."""
+    rng = random.Random(seed)
+    return pd.DataFrame({
+        create.CERT_HTML_COL: [doc_html(rng, f"cert_{i}") for i in range(rows)],
+        create.WAIVER_HTML_COL: [doc_html(rng, f"waiver_{i}") for i in range(rows)],
+    })
+
+
+def export_header(waiver_col=create.WAIVER_HTML_COL):
+    """Columns of a registration export; Odoo names the waiver column either way."""
+    return [
+        'Nombre del Colegio', 'id', 'x_studio_payment_proof', 'x_studio_teams/x_name',
+        'x_studio_teams/x_studio_sex', 'x_studio_teams/x_studio_category',
+        'x_studio_teams/x_studio_staff/email', 'x_studio_teams/x_studio_staff/name',
+        'x_studio_teams/x_studio_staff/x_studio_staff_type', 'x_studio_teams/x_studio_players/x_name',
+        'x_studio_teams/x_studio_players/x_studio_date_of_birth',
+        'x_studio_teams/x_studio_players/x_studio_jersey_number',
+        create.CERT_HTML_COL, 'x_studio_teams/x_studio_players/x_studio_grade', waiver_col,
+    ]
+
+
+def iter_synthetic_export(players, seed=7, waiver_col=create.WAIVER_HTML_COL):
+    """Rows of an ``x_school`` export with Odoo's nested child-row layout.
+
+    A school's first row also carries its first team, staff member and player; later rows
+    leave the parent cells blank. Staff line up with players row by row, and a team with
+    more staff than players gets staff-only rows, which create.py has to skip.
+    """
+    rng = random.Random(seed)
+    header = export_header(waiver_col)
+    written = 0
+    school_n = 0
+    while written < players:
+        school_n += 1
+        school = f"Colegio Sintetico {school_n}"
+        school_cells = {
+            'Nombre del Colegio': school,
+            'id': f"__export__.x_school_{school_n}_{rng.getrandbits(32):08x}",
+            'x_studio_payment_proof': doc_html(rng, f"proof_{school_n}") or "",
+        }
+        for _ in range(rng.randint(1, 4)):
+            if written >= players:
+                break
+            category, sex = rng.choice(CATEGORIES), rng.choice(SEXES)
+            team_cells = {
+                'x_studio_teams/x_name': f"{school} - {category} - {sex}",
+                'x_studio_teams/x_studio_sex': sex,
+                'x_studio_teams/x_studio_category': category,
+            }
+            roster = min(rng.randint(8, 15), players - written)
+            staff = rng.randint(1, 3) if rng.random() < 0.97 else roster + rng.randint(1, 2)
+            for i in range(max(roster, staff)):
+                row = dict.fromkeys(header, "")
+                row.update(school_cells)
+                row.update(team_cells)
+                school_cells = team_cells = {}
+                if i < staff:
+                    row.update({
+                        'x_studio_teams/x_studio_staff/name': f"Staff {school_n}-{i}",
+                        'x_studio_teams/x_studio_staff/x_studio_staff_type': STAFF_TYPES[min(i, 2)],
+                    })
+                if i < roster:
+                    written += 1
+                    row.update({
+                        'x_studio_teams/x_studio_players/x_name': f"Player {written}",
+                        'x_studio_teams/x_studio_players/x_studio_date_of_birth':
+                            f"20{rng.randint(5, 14):02d}-{rng.randint(1, 12):02d}-{rng.randint(1, 28):02d}",
+                        'x_studio_teams/x_studio_players/x_studio_jersey_number': rng.randint(0, 99),
+                        'x_studio_teams/x_studio_players/x_studio_grade': rng.choice(GRADES),
+                        create.CERT_HTML_COL: doc_html(rng, f"cert_{written}") or "",
+                        waiver_col: doc_html(rng, f"waiver_{written}") or "",
+                    })
+                yield row.values()
+
+
+def write_synthetic_export(path, players, seed=7, waiver_col=create.WAIVER_HTML_COL):
+    """Write ``players`` player rows (plus staff-only rows) as an export CSV."""
+    with open(path, "w", newline="", encoding="utf-8") as f:
+        writer = csv.writer(f)
+        writer.writerow(export_header(waiver_col))
+        writer.writerows(iter_synthetic_export(players, seed, waiver_col))
+
+
+def timed(fn, *args):
+    start = time.perf_counter()
+    result = fn(*args)
+    return result, time.perf_counter() - start
+
+
+def measured(fn, *args):
+    """Result, seconds and peak traced allocation in bytes."""
+    tracemalloc.start()
+    try:
+        result, seconds = timed(fn, *args)
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+    return result, seconds, peak
+
+
+def run_pipeline(engine, path, html_path, profile):
+    """``create.build_teams`` with its own stages, plus writing the page."""
+    teams_json = create.build_teams(path, engine, profile)
+    write_html(teams_json, html_path, profile)
+    return teams_json
+
+
+def write_html(teams_json, html_path, stage):
+    with stage('Write HTML'):
+        with open(html_path, "w", encoding="utf-8") as f:
+            f.write(create.render_dashboard(create.render_teams_script(teams_json)))
+
+
+def bench_stages(sizes, engines, report, trace_memory=True):
+    report("Stage suite (seconds, player rows/s, peak traced MB above the stage's start)")
+    report(f"  {'engine':<7} {'waiver column':<21} {'rows':>9}  {'stage':<28} {'seconds':>9} {'rows/s':>12} {'peak MB':>9}")
+    with tempfile.TemporaryDirectory() as tmp:
+        html_path = os.path.join(tmp, "dashboard.html")
+        for rows in sizes:
+            for waiver_col in SUITE_WAIVER_COLUMNS:
+                path = os.path.join(tmp, f"export_{rows}.csv")
+                write_synthetic_export(path, rows, waiver_col=waiver_col)
+                waiver_name = waiver_col.rsplit('/', 1)[-1]
+                for engine in engines:
+                    timings = create.StageProfile(trace_memory=False)
+                    run_pipeline(engine, path, html_path, timings)
+                    peak_by_stage = {}
+                    if trace_memory:
+                        peaks = create.StageProfile()
+                        try:
+                            run_pipeline(engine, path, html_path, peaks)
+                        finally:
+                            tracemalloc.stop()
+                        peak_by_stage = {stage['stage']: stage['peak_delta_bytes'] for stage in peaks.stages}
+                    totals = [
+                        *((stage['stage'], stage['seconds']) for stage in timings.stages),
+                        ('total', sum(stage['seconds'] for stage in timings.stages)),
+                    ]
+                    for name, seconds in totals:
+                        peak = peak_by_stage.get(name, max(peak_by_stage.values(), default=None))
+                        peak_text = f"{peak / 1e6:9.1f}" if peak is not None else f"{'-':>9}"
+                        rate = f"{rows / seconds:12,.0f}" if seconds else f"{'-':>12}"
+                        report(f"  {engine:<7} {waiver_name:<21} {rows:>9,}  {name:<28} {seconds:9.3f} {rate} {peak_text}")
+
+
+def load_players_all_columns(path):
+    """The original load: every column, inferred dtypes."""
+    df = pd.read_csv(path)
+    df[create.FFILL_COLUMNS] = df[create.FFILL_COLUMNS].ffill()
+    return df.dropna(subset=[create.PLAYER_NAME_COL]).copy()
+
+
+def bench_load(rows, report):
+    loaders = [
+        ("all columns, inferred", load_players_all_columns),
+        ("usecols + dtypes     ", create.load_players),
+    ]
+    if importlib.util.find_spec('pyarrow') is not None:
+        loaders.append(("usecols + pyarrow    ", lambda path: create.load_players(path, 'pyarrow')))
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "export.csv")
+        write_synthetic_export(path, rows)
+        report(f"Load players ({rows:,} rows, {os.path.getsize(path) / 1e6:.1f} MB export)")
+        for label, loader in loaders:
+            df, seconds, peak = measured(loader, path)
+            frame_mb = df.memory_usage(deep=True).sum() / 1e6
+            report(f"  {label}: {seconds:8.3f} s  peak {peak / 1e6:8.1f} MB  frame {frame_mb:8.1f} MB")
+            del df
+    if len(loaders) == 2:
+        report("  (pyarrow not installed; skipped the pyarrow engine)")
+
+
+def bench_extraction(rows, report):
+    df_players = synthetic_players(rows)
+    per_cell, per_cell_s = timed(create.extract_links_per_cell, df_players)
+    vectorized, vectorized_s = timed(create.extract_links_vectorized, df_players)
+
+    mismatched = (per_cell.astype(object) != vectorized.astype(object)).any(axis=1).sum()
+    report(f"Extract links ({rows:,} rows)")
+    report(f"  per-cell apply : {per_cell_s:8.3f} s  ({rows / per_cell_s:,.0f} rows/s)")
+    report(f"  vectorized     : {vectorized_s:8.3f} s  ({rows / vectorized_s:,.0f} rows/s)")
+    report(f"  speedup        : {per_cell_s / vectorized_s:8.1f}x")
+    report(f"  mismatched rows: {mismatched}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--sizes", type=int, nargs="+", default=SUITE_SIZES, metavar="N",
+        help="player rows per synthetic export in the stage suite (default: 1000 10000 100000; up to 1000000)",
+    )
+    parser.add_argument(
+        "--engines", nargs="+", choices=SUITE_ENGINES, default=SUITE_ENGINES,
+        help="create.py engines to run through the stage suite (default: csv pandas)",
+    )
+    parser.add_argument(
+        "--rows", type=int, default=100_000,
+        help="synthetic player rows for the extraction and load comparisons (default: 100000; 0 skips them)",
+    )
+    parser.add_argument("--no-memory", action="store_true", help="skip the tracemalloc pass of the stage suite")
+    parser.add_argument("--output", default=BENCH_OUTPUT, help=f"results file (default: {BENCH_OUTPUT})")
+    args = parser.parse_args()
+
+    lines = []
+
+    def report(line):
+        print(line)
+        lines.append(line)
+
+    report(f"create.py benchmarks  python {platform.python_version()}  pandas {pd.__version__}  {platform.machine()}")
+    bench_stages(args.sizes, args.engines, report, trace_memory=not args.no_memory)
+    if args.rows:
+        bench_extraction(args.rows, report)
+        bench_load(args.rows, report)
+    with open(args.output, "w", encoding="utf-8") as f:
+        f.write("\n".join(lines) + "\n")
+
+
+if __name__ == "__main__":
+    main()
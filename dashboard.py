@@ -0,0 +1,4630 @@
+"""The Buzzer Beater dashboard generator: export parsing, TEAMS_DATA, the page template and
+the command line, run through ``create.py``."""
+import argparse
+import csv
+import datetime
+import hashlib
+import importlib.util
+import io
+import json
+import os
+import re
+import sys
+import time
+import unicodedata
+from collections import namedtuple
+from contextlib import contextmanager, redirect_stdout
+from functools import lru_cache
+from itertools import combinations, repeat
+from operator import itemgetter
+from html import escape, unescape
+from urllib.parse import parse_qs, urlparse
+
+import school_category_rules
+
+
+INPUT_CSV = "Registro Buzzer Beater - School (x_school) (9).csv"
+SCHOOLS_CSV = "School (x_school).csv"
+OUTPUT_HTML = "Tournament_Manager_Dashboard.html"
+
+STREAM_CHUNKSIZE = 50_000
+SCHOOL_COL = 'Nombre del Colegio'
+PLAYER_NAME_COL = 'x_studio_teams/x_studio_players/x_name'
+DOB_COL = 'x_studio_teams/x_studio_players/x_studio_date_of_birth'
+FFILL_COLUMNS = [
+    SCHOOL_COL,
+    'x_studio_teams/x_name',
+    'x_studio_teams/x_studio_sex',
+    'x_studio_teams/x_studio_category',
+]
+# Record ids, read when the export has them: the school's id fills down its block like the
+# school name, the team's id like the team name. Teams group by id when there is one.
+SCHOOL_ID_COL = 'id'
+TEAM_ID_COL = 'x_studio_teams/id'
+ID_COLUMNS = [SCHOOL_ID_COL, TEAM_ID_COL]
+EXPORT_FFILL_COLUMNS = FFILL_COLUMNS + ID_COLUMNS
+CERT_HTML_COL = 'x_studio_teams/x_studio_players/x_studio_certificado_de_nacimiento_html'
+WAIVER_HTML_COL = 'x_studio_teams/x_studio_players/x_waiver_html'
+
+# Only the columns the dashboard reads, with fixed dtypes instead of inference. The
+# repeated school/team/sex/category values are stored once each as categoricals.
+EXPORT_DTYPES = {
+    **{col: 'category' for col in FFILL_COLUMNS},
+    PLAYER_NAME_COL: object,
+    DOB_COL: object,
+    'x_studio_teams/x_studio_players/x_studio_jersey_number': 'float64',
+    'x_studio_teams/x_studio_players/x_studio_grade': object,
+    CERT_HTML_COL: object,
+    WAIVER_HTML_COL: object,
+}
+CSV_ENGINES = ('csv', 'pandas', 'pyarrow')
+
+# Header names each column goes by, matched case-insensitively and in this order (the same
+# names the page's importer accepts). The export is read through whichever one it has.
+EXPORT_COLUMN_ALIASES = {
+    SCHOOL_COL: [SCHOOL_COL, 'School', 'x_name'],
+    'x_studio_teams/x_name': ['x_studio_teams/x_name', 'Team'],
+    'x_studio_teams/x_studio_sex': ['x_studio_teams/x_studio_sex', 'Gender', 'Sexo'],
+    'x_studio_teams/x_studio_category': ['x_studio_teams/x_studio_category', 'Category', 'Categoria'],
+    PLAYER_NAME_COL: [PLAYER_NAME_COL, 'Player Name'],
+    DOB_COL: [DOB_COL, 'Date of Birth'],
+    'x_studio_teams/x_studio_players/x_studio_jersey_number': [
+        'x_studio_teams/x_studio_players/x_studio_jersey_number', 'Jersey #',
+    ],
+    'x_studio_teams/x_studio_players/x_studio_grade': ['x_studio_teams/x_studio_players/x_studio_grade', 'Grade'],
+    CERT_HTML_COL: [CERT_HTML_COL, 'Birth Certificate HTML'],
+    WAIVER_HTML_COL: [WAIVER_HTML_COL, 'x_studio_teams/x_studio_players/x_studio_waiver_html', 'Waiver HTML'],
+    SCHOOL_ID_COL: [SCHOOL_ID_COL],
+    TEAM_ID_COL: [TEAM_ID_COL, 'Team ID'],
+}
+# The delimiter is whichever of these appears most often outside quotes in the first
+# SNIFF_CHARS characters; ties go to the comma.
+CSV_DELIMITERS = (',', ';', '\t')
+SNIFF_CHARS = 8192
+QUOTED_FIELD_RE = re.compile(r'"(?:[^"]|"")*"?')
+# ``columns`` maps each canonical column the header has to its index
+ExportSchema = namedtuple('ExportSchema', ['delimiter', 'header', 'columns'])
+
+# Strings pandas' read_csv reads as NaN by default; the csv engine treats them the same way.
+PANDAS_NA_VALUES = frozenset([
+    '', '#N/A', '#N/A N/A', '#NA', '-1.#IND', '-1.#QNAN', '-NaN', '-nan', '1.#IND', '1.#QNAN',
+    '<NA>', 'N/A', 'NA', 'NULL', 'NaN', 'None', 'n/a', 'nan', 'null',
+])
+NAN = float('nan')
+
+LINK_COLUMNS = [
+    'Birth Certificate', 'Waiver', 'Birth Certificate Preview', 'Waiver Preview', 'Photo', 'Photo Full'
+]
+
+# 3. Extract and normalize Google Drive links from HTML cells
+HREF_RE = re.compile(r'href=[\'"]?([^\'" >]+)', re.IGNORECASE)
+IMG_SRC_RE = re.compile(r'<img[^>]*src=[\'"]([^\'"]+)[\'"]', re.IGNORECASE)
+DRIVE_ID_PATH_RE = re.compile(r"/file/d/([A-Za-z0-9_-]+)")
+GENERIC_DRIVE_D_RE = re.compile(r"/d/([A-Za-z0-9_-]+)")
+
+DRIVE_FILE_PREFIX = "https://drive.google.com/file/d/"
+DRIVE_VIEW_SUFFIX = "/view?usp=drive_link"
+DRIVE_PREVIEW_SUFFIX = "/preview"
+DRIVE_THUMBNAIL_PREFIX = "https://drive.google.com/thumbnail?id="
+DRIVE_THUMBNAIL_SUFFIX = "&sz=w400"
+
+
+# Parsing is memoized: the same HTML cell is read for its link, preview, photo and full
+# photo, and all Drive URLs of a cell are built from the ids parsed with it.
+DOC_CELL_CACHE_SIZE = 65_536
+DRIVE_ID_CACHE_SIZE = 65_536
+
+# href/href_id: first link in the cell; img/img_id: first <img src> (None when the cell has none)
+DocCell = namedtuple('DocCell', ['href', 'img', 'href_id', 'img_id'])
+EMPTY_DOC_CELL = DocCell("", None, "", "")
+
+
+@lru_cache(maxsize=DRIVE_ID_CACHE_SIZE)
+def extract_drive_file_id(url):
+    if not url:
+        return ""
+    parsed = urlparse(url.strip())
+    host = parsed.netloc.lower()
+    if "drive.google.com" not in host and "docs.google.com" not in host:
+        return ""
+
+    path_match = DRIVE_ID_PATH_RE.search(parsed.path)
+    if path_match:
+        return path_match.group(1)
+
+    d_match = GENERIC_DRIVE_D_RE.search(parsed.path)
+    if d_match:
+        return d_match.group(1)
+
+    query = parse_qs(parsed.query)
+    if query.get("id"):
+        return query["id"][0]
+    return ""
+
+
+@lru_cache(maxsize=DOC_CELL_CACHE_SIZE)
+def _parse_doc_cell(html_text):
+    href_match = HREF_RE.search(html_text)
+    href = unescape(href_match.group(1)).strip() if href_match else ""
+    img_match = IMG_SRC_RE.search(html_text)
+    img = unescape(img_match.group(1)).strip() if img_match else None
+    return DocCell(href, img, extract_drive_file_id(href), extract_drive_file_id(img or ""))
+
+
+def is_missing(value):
+    """``pd.isna`` for the scalars a CSV read produces (None and NaN)."""
+    return value is None or value != value
+
+
+def parse_doc_cell(html_string):
+    """Links and Drive ids of one cert/waiver cell, parsed once per distinct cell."""
+    if is_missing(html_string):
+        return EMPTY_DOC_CELL
+    return _parse_doc_cell(str(html_string))
+
+
+def parse_cache_stats():
+    """Hit/miss counters of the memoized parsers, for the end-of-run summary."""
+    return {
+        'HTML cells': _parse_doc_cell.cache_info(),
+        'Drive ids': extract_drive_file_id.cache_info(),
+    }
+
+
+def drive_preview_from_id(file_id):
+    if not file_id:
+        return ""
+    return f"{DRIVE_FILE_PREFIX}{file_id}{DRIVE_PREVIEW_SUFFIX}"
+
+
+def drive_thumbnail_from_id(file_id):
+    if not file_id:
+        return ""
+    return f"{DRIVE_THUMBNAIL_PREFIX}{file_id}{DRIVE_THUMBNAIL_SUFFIX}"
+
+
+def extract_url(html_string):
+    cell = parse_doc_cell(html_string)
+    if not cell.href_id:
+        return cell.href
+    return f"{DRIVE_FILE_PREFIX}{cell.href_id}{DRIVE_VIEW_SUFFIX}"
+
+
+def extract_preview_url(html_string):
+    return drive_preview_from_id(parse_doc_cell(html_string).href_id)
+
+
+# 4. Extract a reliable image URL for player thumbnails
+def extract_photo_url(html_string):
+    cell = parse_doc_cell(html_string)
+    if cell.img is not None:
+        # Drive thumbnail URLs render more consistently than raw uc links.
+        return drive_thumbnail_from_id(cell.img_id) or cell.img
+    return drive_thumbnail_from_id(cell.href_id)
+
+
+def extract_photo_full_url(html_string):
+    """Best-effort full image URL for modal view (without thumbnail downsizing)."""
+    return parse_doc_cell(html_string).img or ""
+
+
+# Use cert photo; fall back to waiver photo if cert has none
+def pick_photo(row):
+    if row['Photo_from_cert']:
+        return row['Photo_from_cert']
+    return row['Photo_from_waiver']
+
+
+def pick_photo_full(row):
+    if row['Photo_full_from_cert']:
+        return row['Photo_full_from_cert']
+    return row['Photo_full_from_waiver']
+
+
+def extract_links_per_cell(df_players):
+    """Reference extraction: one ``apply`` per derived column (kept for benchmarks)."""
+    import pandas as pd
+
+    links = pd.DataFrame(index=df_players.index)
+    links['Birth Certificate'] = df_players[CERT_HTML_COL].apply(extract_url)
+    links['Waiver'] = df_players[WAIVER_HTML_COL].apply(extract_url)
+    links['Birth Certificate Preview'] = df_players[CERT_HTML_COL].apply(extract_preview_url)
+    links['Waiver Preview'] = df_players[WAIVER_HTML_COL].apply(extract_preview_url)
+
+    # Extract photos from BOTH birth cert and waiver columns (some have photos in cert, some in waiver)
+    links['Photo_from_cert'] = df_players[CERT_HTML_COL].apply(extract_photo_url)
+    links['Photo_from_waiver'] = df_players[WAIVER_HTML_COL].apply(extract_photo_url)
+    links['Photo_full_from_cert'] = df_players[CERT_HTML_COL].apply(extract_photo_full_url)
+    links['Photo_full_from_waiver'] = df_players[WAIVER_HTML_COL].apply(extract_photo_full_url)
+
+    links['Photo'] = links.apply(pick_photo, axis=1)
+    links['Photo Full'] = links.apply(pick_photo_full, axis=1)
+    return links[LINK_COLUMNS]
+
+
+# Vectorized extraction: one regex sweep per HTML column finds the first href and
+# the first <img src> (same leftmost-match semantics as HREF_RE / IMG_SRC_RE), then
+# a second sweep splits the URLs the way urlparse does to pull out the Drive id.
+DOC_HTML_RE = re.compile(
+    r'^(?=(?:.*?href=[\'"]?([^\'" >]+))?)(?=(?:.*?<img[^>]*src=[\'"]([^\'"]+)[\'"])?)',
+    re.IGNORECASE | re.DOTALL,
+)
+URL_PARTS_RE = re.compile(r"^(?:[A-Za-z][A-Za-z0-9+.\-]*:)?//([^/?#]*)([^?#]*)(?:\?([^#]*))?")
+DRIVE_PATH_IDS_RE = re.compile(
+    r"^(?=(?:.*?/file/d/([A-Za-z0-9_-]+))?)(?=(?:.*?/d/([A-Za-z0-9_-]+))?)", re.DOTALL
+)
+QUERY_ID_RE = re.compile(r"(?:^|&)id=([^&]+)")
+# urlparse drops tabs/newlines and ;params, and parse_qs percent-decodes; URLs with
+# any of those characters go through extract_drive_file_id instead.
+URL_FALLBACK_RE = re.compile(r"[%+;\t\r\n]")
+
+
+def _clean_urls(raw):
+    """Vectorized ``unescape(...).strip()``; entity decoding only runs on cells with '&'."""
+    raw = raw.fillna("")
+    has_entity = raw.str.contains("&", regex=False)
+    if has_entity.any():
+        raw = raw.mask(has_entity, raw[has_entity].map(unescape))
+    return raw.str.strip()
+
+
+def _drive_ids(urls):
+    """Vectorized ``extract_drive_file_id`` over a Series of cleaned URLs."""
+    parts = urls.str.extract(URL_PARTS_RE)
+    host = parts[0].fillna("").str.lower()
+    is_drive = (
+        host.str.contains("drive.google.com", regex=False)
+        | host.str.contains("docs.google.com", regex=False)
+    )
+    path_ids = parts[1].where(is_drive).str.extract(DRIVE_PATH_IDS_RE)
+    ids = path_ids[0].fillna(path_ids[1])
+    from_query = is_drive & ids.isna()
+    if from_query.any():
+        query_ids = parts[2][from_query].fillna("").str.extract(QUERY_ID_RE, expand=False)
+        ids = ids.fillna(query_ids)
+    ids = ids.fillna("")
+
+    fallback = urls.str.contains(URL_FALLBACK_RE)
+    if fallback.any():
+        ids = ids.mask(fallback, urls[fallback].map(extract_drive_file_id))
+    return ids
+
+
+def _extract_doc_links(html):
+    """Document URL, preview URL, photo and full photo for one HTML column."""
+    found = html.fillna("").astype(str).str.extract(DOC_HTML_RE)
+    href = _clean_urls(found[0])
+    img = _clean_urls(found[1])
+    href_id = _drive_ids(href)
+    img_id = _drive_ids(img)
+    has_href_id = href_id != ""
+
+    doc_url = (DRIVE_FILE_PREFIX + href_id + DRIVE_VIEW_SUFFIX).where(has_href_id, href)
+    preview = (DRIVE_FILE_PREFIX + href_id + DRIVE_PREVIEW_SUFFIX).where(has_href_id, "")
+    img_photo = (DRIVE_THUMBNAIL_PREFIX + img_id + DRIVE_THUMBNAIL_SUFFIX).where(img_id != "", img)
+    href_photo = (DRIVE_THUMBNAIL_PREFIX + href_id + DRIVE_THUMBNAIL_SUFFIX).where(has_href_id, "")
+    photo = img_photo.where(found[1].notna(), href_photo)
+    return doc_url, preview, photo, img
+
+
+def extract_links_vectorized(df_players):
+    """Single-pass replacement for :func:`extract_links_per_cell` with identical output."""
+    import pandas as pd
+
+    cert_url, cert_preview, cert_photo, cert_photo_full = _extract_doc_links(df_players[CERT_HTML_COL])
+    waiver_url, waiver_preview, waiver_photo, waiver_photo_full = _extract_doc_links(df_players[WAIVER_HTML_COL])
+    return pd.DataFrame({
+        'Birth Certificate': cert_url,
+        'Waiver': waiver_url,
+        'Birth Certificate Preview': cert_preview,
+        'Waiver Preview': waiver_preview,
+        'Photo': cert_photo.where(cert_photo != "", waiver_photo),
+        'Photo Full': cert_photo_full.where(cert_photo_full != "", waiver_photo_full),
+    }, index=df_players.index)
+
+
+def normalize_header(name):
+    return name.lstrip("\ufeff").strip().lower()
+
+
+def sniff_delimiter(sample):
+    unquoted = QUOTED_FIELD_RE.sub("", sample)
+    return max(CSV_DELIMITERS, key=unquoted.count)
+
+
+def resolve_columns(header):
+    """``{canonical column: index}`` for every EXPORT_COLUMN_ALIASES entry ``header`` has."""
+    positions = {}
+    for i, name in enumerate(header):
+        positions.setdefault(normalize_header(name), i)
+    columns = {}
+    for column, aliases in EXPORT_COLUMN_ALIASES.items():
+        found = [positions[key] for key in map(normalize_header, aliases) if key in positions]
+        if found:
+            columns[column] = found[0]
+    return columns
+
+
+def detect_schema(file_path):
+    """The :class:`ExportSchema` of a csv file: delimiter sniffed from its start, header
+    without the byte order mark, and the canonical columns resolved once."""
+    with open(file_path, newline="", encoding="utf-8-sig") as f:
+        delimiter = sniff_delimiter(f.read(SNIFF_CHARS))
+        f.seek(0)
+        header = next(csv.reader(f, delimiter=delimiter), [])
+    return ExportSchema(delimiter, header, resolve_columns(header))
+
+
+def require_columns(schema, columns=EXPORT_DTYPES, label="Export"):
+    missing = [col for col in columns if col not in schema.columns]
+    if missing:
+        raise ValueError(f"{label} is missing columns: {', '.join(missing)}")
+
+
+def with_id_columns(df):
+    """Add the id columns the export lacks, empty, so every build sees the same frame."""
+    import pandas as pd
+
+    for col in ID_COLUMNS:
+        if col not in df:
+            df[col] = pd.Categorical([NAN] * len(df))
+    return df
+
+
+def read_export(source, engine='pandas', schema=None, **kwargs):
+    """Read the export's dashboard columns under their canonical names; ``engine='pyarrow'``
+    uses pandas' pyarrow parser.
+
+    ``schema`` is the :func:`detect_schema` of the source, needed when it is not a path.
+    With ``chunksize`` this is an iterator of such frames.
+    """
+    import pandas as pd
+
+    schema = detect_schema(source) if schema is None else schema
+    require_columns(schema)
+    if engine == 'pyarrow':
+        kwargs['engine'] = 'pyarrow'
+    names = {schema.header[i]: col for col, i in schema.columns.items()}
+    dtypes = {**EXPORT_DTYPES, **{col: 'category' for col in ID_COLUMNS}}
+    read = pd.read_csv(
+        source, sep=schema.delimiter, usecols=list(names),
+        dtype={name: dtypes[col] for name, col in names.items()}, **kwargs,
+    )
+    if 'chunksize' in kwargs:
+        return (with_id_columns(chunk.rename(columns=names)) for chunk in read)
+    return with_id_columns(read.rename(columns=names))
+
+
+def load_players(file_path, engine='pandas'):
+    df = read_export(file_path, engine)
+
+    # 1. Forward fill team and school information downwards
+    df[EXPORT_FFILL_COLUMNS] = df[EXPORT_FFILL_COLUMNS].ffill()
+
+    # 2. Filter rows that actually have a player (ignores extra staff rows)
+    return df.dropna(subset=[PLAYER_NAME_COL]).copy()
+
+
+def iter_player_chunks(file_path, chunksize):
+    """Like ``load_players`` but ``chunksize`` rows at a time.
+
+    The forward-fill values of the last row of each chunk carry into the next one, so a
+    team that straddles a chunk boundary keeps its school, name, sex and category.
+    """
+    carry = {}
+    for chunk in read_export(file_path, chunksize=chunksize):
+        filled = chunk[EXPORT_FFILL_COLUMNS].ffill()
+        for col, value in carry.items():
+            if value not in filled[col].cat.categories:
+                filled[col] = filled[col].cat.add_categories([value])
+        chunk[EXPORT_FFILL_COLUMNS] = filled.fillna(carry)
+        carry = chunk[EXPORT_FFILL_COLUMNS].iloc[-1].dropna().to_dict()
+        yield chunk.dropna(subset=[PLAYER_NAME_COL])
+
+
+def iter_team_blocks(file_path, chunksize):
+    """Team records, each yielded once its block of rows closes.
+
+    A team is held back only while it is the team of the last row read, since the next
+    chunk may continue it. A team whose rows reappear further down the export is yielded
+    again with the later players; ``stream_teams_json`` merges those by :func:`team_group_key`.
+    """
+    pending = None
+    next_record = 1
+    for df_players in iter_player_chunks(file_path, chunksize):
+        if df_players.empty:
+            continue
+        teams = build_teams_json(build_dashboard_frame(df_players), first_record=next_record)
+        next_record += len(df_players)
+        if pending is not None:
+            if team_group_key(teams[0]) == team_group_key(pending):
+                teams[0]['players'] = pending['players'] + teams[0]['players']
+            else:
+                yield pending
+        last_record = f"player_{next_record - 1:04d}"
+        pending = next(team for team in teams if team['players'][-1]['record_id'] == last_record)
+        for team in teams:
+            if team is not pending:
+                yield team
+    if pending is not None:
+        yield pending
+
+
+def stream_teams_json(file_path, chunksize):
+    """``build_teams_json`` for an export read in chunks; only the output itself grows."""
+    teams = {}
+    for block in iter_team_blocks(file_path, chunksize):
+        key = team_group_key(block)
+        if key in teams:
+            teams[key]['players'].extend(block['players'])
+        else:
+            teams[key] = block
+    # Record ids follow export row order, so a team's first one marks its first appearance
+    ordered = sorted(teams.values(), key=lambda team: int(RECORD_ID_RE.fullmatch(team['players'][0]['record_id']).group(1)))
+    return [{**team, 'source_idx': source_idx} for source_idx, team in enumerate(ordered)]
+
+
+def team_group_key(team):
+    """Teams group by team id when the export has one, otherwise by name."""
+    if not is_missing(team.get('team_id')):
+        return team['team_id']
+    return None if is_missing(team['team']) else team['team']
+
+
+def build_dashboard_frame(df_players, links=None, dob_display=None):
+    """Dashboard columns for the player rows; ``links``/``dob_display`` skip recomputing those."""
+    if links is None:
+        links = extract_links_vectorized(df_players)
+    df_players = df_players.join(links)
+
+    # 5. Clean up columns and rename them for the dashboard
+    dashboard_df = df_players[[
+        'Nombre del Colegio', 'x_studio_teams/x_name', 'x_studio_teams/x_studio_sex',
+        'x_studio_teams/x_studio_category', 'x_studio_teams/x_studio_players/x_name',
+        'x_studio_teams/x_studio_players/x_studio_date_of_birth',
+        'x_studio_teams/x_studio_players/x_studio_jersey_number',
+        'x_studio_teams/x_studio_players/x_studio_grade',
+        'Birth Certificate', 'Waiver', 'Birth Certificate Preview', 'Waiver Preview', 'Photo', 'Photo Full',
+        SCHOOL_ID_COL, TEAM_ID_COL,
+    ]].copy()
+
+    dashboard_df.columns = [
+        'School', 'Team', 'Gender', 'Category', 
+        'Player Name', 'Date of Birth', 'Jersey #', 'Grade',
+        'Birth Certificate', 'Waiver', 'Birth Certificate Preview', 'Waiver Preview', 'Photo', 'Photo Full',
+        'School ID', 'Team ID',
+    ]
+
+    # 6. Format the Date of Birth nicely
+    if dob_display is None:
+        dob_display = format_dob_display(dashboard_df['Date of Birth'])
+    dashboard_df['DOB_display'] = dob_display
+    return dashboard_df
+
+
+def format_dob_display(dob):
+    """Dates of birth as 'March 04, 2010'; values pandas cannot parse are kept as they are."""
+    import pandas as pd
+
+    return pd.to_datetime(dob, errors='coerce').dt.strftime('%B %d, %Y').fillna(dob)
+
+
+def format_jersey(jersey):
+    """Jersey numbers as display strings ('—' when missing), without a per-row loop."""
+    import pandas as pd
+
+    present = jersey.notna()
+    if pd.api.types.is_numeric_dtype(jersey):
+        numbers = jersey[present].astype('int64').astype(str)
+    else:
+        numbers = jersey[present].map(lambda value: str(int(value)))
+    return numbers.reindex(jersey.index, fill_value='—')
+
+
+# 7. Build the data structure for the template
+def build_teams_json(dashboard_df, first_record=1, blocks=None):
+    """Team/player records for TEAMS_DATA, grouped by team (:func:`team_group_key`) in order
+    of first appearance.
+
+    Player dicts come straight from the column arrays; record ids keep following the
+    export row order, not the team order, starting at ``first_record``. ``blocks`` (a
+    block number per row) keeps teams of different blocks apart even when their keys match.
+    """
+    import numpy as np
+    import pandas as pd
+
+    players = pd.DataFrame({
+        'record_id': [f"player_{n:04d}" for n in range(first_record, first_record + len(dashboard_df))],
+        'name': dashboard_df['Player Name'].to_numpy(),
+        'dob': dashboard_df['Date of Birth'].to_numpy(),
+        'dob_display': dashboard_df['DOB_display'].to_numpy(),
+        'jersey': format_jersey(dashboard_df['Jersey #']).to_numpy(),
+        'grade': dashboard_df['Grade'].to_numpy(),
+        'cert_url': dashboard_df['Birth Certificate'].to_numpy(),
+        'waiver_url': dashboard_df['Waiver'].to_numpy(),
+        'cert_preview': dashboard_df['Birth Certificate Preview'].to_numpy(),
+        'waiver_preview': dashboard_df['Waiver Preview'].to_numpy(),
+        'photo': dashboard_df['Photo'].to_numpy(),
+        'photo_full': dashboard_df['Photo Full'].to_numpy(),
+    }).to_dict('records')
+
+    team_ids = dashboard_df['Team ID'].astype(object)
+    group_keys = team_ids.where(team_ids.notna(), dashboard_df['Team'].astype(object))
+    team_codes, _ = pd.factorize(group_keys, use_na_sentinel=False)
+    if blocks is not None and len(team_codes):
+        team_codes, _ = pd.factorize(np.asarray(blocks) * (team_codes.max() + 1) + team_codes)
+    row_order = np.argsort(team_codes, kind='stable')
+    team_sizes = np.bincount(team_codes)
+    team_starts = np.concatenate(([0], np.cumsum(team_sizes)[:-1]))
+    team_rows = dashboard_df[['Team', 'School', 'Gender', 'Category', 'School ID', 'Team ID']].iloc[row_order[team_starts]]
+
+    teams_json = []
+    for source_idx, (team, start, size) in enumerate(zip(team_rows.to_dict('records'), team_starts, team_sizes)):
+        teams_json.append({
+            'source_idx': source_idx,
+            'team': team['Team'],
+            'school': team['School'],
+            'gender': team['Gender'],
+            'category': team['Category'],
+            'school_id': team['School ID'],
+            'team_id': team['Team ID'],
+            'players': [players[i] for i in row_order[start:start + size]],
+        })
+    return teams_json
+
+
+# Stdlib csv engine: the same TEAMS_DATA in one streaming pass, without importing pandas.
+# Forward-filled columns first, then player name, dob, jersey, grade, cert and waiver HTML,
+# then the school and team ids (empty when the export has no such column).
+CSV_ENGINE_COLUMNS = list(EXPORT_DTYPES) + ID_COLUMNS
+CSV_FFILL_INDEXES = [CSV_ENGINE_COLUMNS.index(col) for col in EXPORT_FFILL_COLUMNS]
+CSV_DOB_INDEX = CSV_ENGINE_COLUMNS.index(DOB_COL)
+CSV_CERT_INDEX = CSV_ENGINE_COLUMNS.index(CERT_HTML_COL)
+CSV_WAIVER_INDEX = CSV_ENGINE_COLUMNS.index(WAIVER_HTML_COL)
+# Dates pandas' default nanosecond Timestamps can hold; others go through pandas itself.
+TIMESTAMP_DATE_RANGE = (datetime.date(1677, 9, 22), datetime.date(2262, 4, 11))
+
+
+def _csv_dob_display(dob):
+    """``to_datetime(...).strftime('%B %d, %Y')`` for ISO dates, the raw value when pandas
+    would give NaT, and None when only pandas can tell (not an ISO date)."""
+    if is_missing(dob):
+        return dob
+    match = ISO_DATE_RE.fullmatch(dob)
+    if not match:
+        return None
+    try:
+        date = datetime.date(*map(int, match.groups()))
+    except ValueError:
+        return dob
+    if not TIMESTAMP_DATE_RANGE[0] <= date <= TIMESTAMP_DATE_RANGE[1]:
+        return None
+    return f"{MONTH_NAMES[date.month - 1]} {date.day:02d}, {date.year}"
+
+
+def iter_csv_players(schema, rows, carry=None):
+    """``load_players`` over csv rows: dashboard column values of each player row.
+
+    Cells pandas would read as NaN become NaN, short rows are padded and blank lines
+    skipped, as ``read_csv`` does. ``carry`` seeds the forward fill (as raw strings, in
+    ``EXPORT_FFILL_COLUMNS`` order).
+    """
+    require_columns(schema)
+    col_idx = [schema.columns.get(col) for col in CSV_ENGINE_COLUMNS]
+    width = len(schema.header)
+    ffill = [NAN if value in PANDAS_NA_VALUES else value for value in (carry or [""] * len(EXPORT_FFILL_COLUMNS))]
+    for row in rows:
+        if not row:
+            continue
+        if len(row) < width:
+            row = row + [""] * (width - len(row))
+        values = [NAN if i is None or row[i] in PANDAS_NA_VALUES else row[i] for i in col_idx]
+        for n, i in enumerate(CSV_FFILL_INDEXES):
+            if is_missing(values[i]):
+                values[i] = ffill[n]
+            else:
+                ffill[n] = values[i]
+        if not is_missing(values[len(FFILL_COLUMNS)]):
+            yield values
+
+
+def csv_player_links(cert_html, waiver_html):
+    """Document, preview and photo URLs of one player, as ``extract_links_vectorized`` gives them."""
+    return {
+        'cert_url': extract_url(cert_html),
+        'waiver_url': extract_url(waiver_html),
+        'cert_preview': extract_preview_url(cert_html),
+        'waiver_preview': extract_preview_url(waiver_html),
+        'photo': extract_photo_url(cert_html) or extract_photo_url(waiver_html),
+        'photo_full': extract_photo_full_url(cert_html) or extract_photo_full_url(waiver_html),
+    }
+
+
+def csv_teams_from_rows(schema, rows, carry=None):
+    """``build_teams_json`` for csv rows, extracting links and dates as players stream by."""
+    return csv_teams_from_players(iter_csv_players(schema, rows, carry))
+
+
+def csv_teams_from_players(player_rows, links=None, dob_display=None):
+    """TEAMS_DATA from :func:`iter_csv_players` values; ``links``/``dob_display`` (one entry
+    per player row) skip computing those."""
+    teams = {}
+    players = []
+    for n, (school, team, gender, category, name, dob, jersey, grade, cert_html, waiver_html,
+            school_id, team_id) in enumerate(player_rows):
+        player = {
+            'record_id': f"player_{n + 1:04d}",
+            'name': name,
+            'dob': dob,
+            'dob_display': _csv_dob_display(dob) if dob_display is None else dob_display[n],
+            'jersey': '—' if is_missing(jersey) else str(int(float(jersey))),
+            'grade': grade,
+            **(csv_player_links(cert_html, waiver_html) if links is None else links[n]),
+        }
+        players.append(player)
+        key = team_id if not is_missing(team_id) else None if is_missing(team) else team
+        if key not in teams:
+            teams[key] = {
+                'source_idx': len(teams), 'team': team, 'school': school, 'gender': gender,
+                'category': category, 'school_id': school_id, 'team_id': team_id, 'players': [],
+            }
+        teams[key]['players'].append(player)
+
+    if any(player['dob_display'] is None for player in players):
+        # Some dates are not ISO: let pandas parse the whole column, as the pandas engine does
+        import pandas as pd
+
+        dobs = pd.Series([player['dob'] for player in players], dtype=object)
+        for player, display in zip(players, format_dob_display(dobs)):
+            player['dob_display'] = display
+    return list(teams.values())
+
+
+def csv_teams_json(file_path):
+    """TEAMS_DATA for an export, read with the csv module."""
+    schema = detect_schema(file_path)
+    with open(file_path, newline="", encoding="utf-8-sig") as f:
+        reader = csv.reader(f, delimiter=schema.delimiter)
+        next(reader, None)
+        return csv_teams_from_rows(schema, reader)
+
+
+def profiled_csv_teams_json(file_path, profile):
+    """:func:`csv_teams_json` one stage at a time, so each can be timed; the stages hold
+    all rows in memory between them, which the streaming build never does."""
+    schema = detect_schema(file_path)
+    with profile("Load CSV") as stage:
+        with open(file_path, newline="", encoding="utf-8-sig") as f:
+            rows = list(csv.reader(f, delimiter=schema.delimiter))[1:]
+        stage['rows'] = len(rows)
+    with profile("Forward fill and filter rows", rows=len(rows)):
+        player_rows = list(iter_csv_players(schema, rows))
+    with profile("Extract links", rows=len(player_rows)):
+        links = [csv_player_links(row[CSV_CERT_INDEX], row[CSV_WAIVER_INDEX]) for row in player_rows]
+    with profile("Format DOB", rows=len(player_rows)):
+        dob_display = [_csv_dob_display(row[CSV_DOB_INDEX]) for row in player_rows]
+    with profile("Build data structure", rows=len(player_rows)):
+        return csv_teams_from_players(player_rows, links, dob_display)
+
+
+def build_teams(file_path, engine='csv', profile=None):
+    """TEAMS_DATA for an export with the chosen engine; only 'csv' avoids importing pandas.
+
+    ``profile`` (a :class:`StageProfile`) times each stage. The csv engine normally streams
+    rows through all stages at once; profiled, it runs them one after another.
+    """
+    profile = profile or StageProfile(enabled=False)
+    if engine == 'csv':
+        if profile.enabled:
+            return profiled_csv_teams_json(file_path, profile)
+        return csv_teams_json(file_path)
+
+    with profile("Import pandas"):
+        import pandas  # noqa: F401 -- timed here so "Load CSV" measures parsing only
+    with profile("Load CSV") as stage:
+        df = read_export(file_path, engine)
+        stage['rows'] = len(df)
+    with profile("Forward fill", rows=len(df)):
+        df[EXPORT_FFILL_COLUMNS] = df[EXPORT_FFILL_COLUMNS].ffill()
+    with profile("Filter rows", rows=len(df)):
+        df_players = df.dropna(subset=[PLAYER_NAME_COL]).copy()
+    with profile("Extract links", rows=len(df_players)):
+        links = extract_links_vectorized(df_players)
+    with profile("Format DOB", rows=len(df_players)):
+        dob_display = format_dob_display(df_players[DOB_COL])
+    with profile("Build data structure", rows=len(df_players)):
+        return build_teams_json(build_dashboard_frame(df_players, links, dob_display))
+
+
+# 8. Build player rows for the table view (all players flat)
+def make_link(url, label="View", button_class="btn btn-sm btn-outline-primary"):
+    if url:
+        return (
+            f'<a href="{url}" target="_blank" rel="noopener noreferrer" '
+            f'class="{button_class}">{label}</a>'
+        )
+    return '<span class="text-muted small">—</span>'
+
+
+def iter_table_rows(teams_json):
+    for team in teams_json:
+        gender_class = 'male-tag' if team['gender'] == 'Masculino' else 'female-tag'
+        for p in team['players']:
+            if p['photo']:
+                photo_html = f'<img src="{p["photo"]}" alt="{p["name"]}" class="mini-photo" onerror="this.style.display=\'none\'">'
+            else:
+                photo_html = '<div class="no-photo-mini">📷</div>'
+
+            cert_link = make_link(p['cert_url'], '📋 Open')
+            cert_preview_link = make_link(
+                p['cert_preview'],
+                '🔎 Preview',
+                'btn btn-sm btn-outline-warning'
+            )
+            waiver_link = make_link(p['waiver_url'], '✍️ Open')
+
+            yield f"""
+        <tr>
+            <td class="photo-cell">{photo_html}</td>
+            <td class="player-name-cell">
+                <span class="player-name">{p['name']}</span>
+                <span class="jersey-badge">#{p['jersey']}</span>
+            </td>
+            <td class="dob-cell">
+                <span class="dob-badge">{p['dob_display']}</span>
+            </td>
+            <td class="doc-cell">{cert_link} {cert_preview_link}</td>
+            <td class="doc-cell">{waiver_link}</td>
+            <td class="school-cell">{team['school']}</td>
+            <td class="team-cell"><span class="gender-tag {gender_class}">{team['gender'][:1]}</span> {team['team']}</td>
+            <td>{p['grade']}</td>
+            <td><span class="category-tag">{team['category']}</span></td>
+        </tr>"""
+
+
+def write_player_table(teams_json, path):
+    """Stream the flat all-players table (not used by the dashboard) to ``path``."""
+    with open(path, "w", encoding="utf-8") as f:
+        f.write('<table class="table">\n    <thead>\n        <tr>')
+        f.writelines(
+            f'<th>{label}</th>'
+            for label in ('Photo', 'Player', 'DOB', 'Birth Certificate', 'Waiver', 'School', 'Team', 'Grade', 'Category')
+        )
+        f.write('</tr>\n    </thead>\n    <tbody>')
+        f.writelines(iter_table_rows(teams_json))
+        f.write('\n    </tbody>\n</table>\n')
+
+
+# 9. Serialize TEAMS_DATA for the page
+DATA_FORMATS = ('full', 'compact', 'columnar')
+
+# Compact and columnar modes write each Drive URL template once; a document whose URLs all follow
+# the templates keeps only its file id under the id key.
+DRIVE_URL_TEMPLATES = {
+    'view': [DRIVE_FILE_PREFIX, DRIVE_VIEW_SUFFIX],
+    'preview': [DRIVE_FILE_PREFIX, DRIVE_PREVIEW_SUFFIX],
+    'thumbnail': [DRIVE_THUMBNAIL_PREFIX, DRIVE_THUMBNAIL_SUFFIX],
+    'uc': ["https://drive.google.com/uc?export=view&id=", ""],
+}
+COMPACT_DOCUMENTS = {
+    'cert_id': {'cert_url': 'view', 'cert_preview': 'preview'},
+    'waiver_id': {'waiver_url': 'view', 'waiver_preview': 'preview'},
+    'photo_id': {'photo': 'thumbnail'},
+    'photo_full_id': {'photo_full': 'uc'},
+}
+COMPACT_URL_FIELDS = {field for fields in COMPACT_DOCUMENTS.values() for field in fields}
+# Player text that repeats across many players; compact mode writes each distinct value once
+# in a table and stores its index on the player.
+COMPACT_TABLE_FIELDS = ('eligibility_reason',)
+# The photo is usually the cert's own file; repeated ids are written as '=<id key>'.
+COMPACT_ID_REF = '='
+MONTH_NAMES = [
+    'January', 'February', 'March', 'April', 'May', 'June',
+    'July', 'August', 'September', 'October', 'November', 'December',
+]
+ISO_DATE_RE = re.compile(r"(\d{4})-(\d{2})-(\d{2})")
+
+RECORD_VIEW_JS = """// Compact/columnar TEAMS_DATA: players are thin views over the embedded data. Drive URLs and
+// dob_display are rebuilt, and dropped empty or null fields read as '', only when accessed.
+function makeRecordViewProto(payload, read) {
+    const fileId = (view, idKey) => {
+        const id = read(view, idKey);
+        return id && id[0] === '=' ? read(view, id.slice(1)) : id;
+    };
+    const derived = {};
+    Object.entries(payload.documents).forEach(([idKey, fields]) => {
+        Object.entries(fields).forEach(([field, template]) => {
+            const [prefix, suffix] = payload.urls[template];
+            derived[field] = view => {
+                const id = fileId(view, idKey);
+                return id ? prefix + id + suffix : '';
+            };
+        });
+    });
+    // dob_display is only kept when it is not the plain "Month DD, YYYY" form of an ISO dob.
+    derived.dob_display = view => {
+        const m = /^(\\d{4})-(\\d{2})-(\\d{2})$/.exec(read(view, 'dob') || '');
+        return m ? `${payload.month_names[Number(m[2]) - 1]} ${m[3]}, ${m[1]}` : '';
+    };
+
+    const proto = {};
+    payload.player_fields.forEach(field => {
+        const derive = derived[field];
+        Object.defineProperty(proto, field, {
+            get() {
+                const value = read(this, field);
+                if (value !== undefined) return value;
+                return derive ? derive(this) : '';
+            },
+        });
+    });
+    return proto;
+}
+"""
+
+COMPACT_DECODER_JS = """function decodeCompactTeams(payload) {
+    const tables = payload.tables || {};
+    const playerProto = makeRecordViewProto(payload, (view, key) => {
+        const value = view._record[key];
+        return tables[key] && value !== undefined ? tables[key][value] : value;
+    });
+    payload.teams.forEach(team => {
+        team.players = team.players.map(record => {
+            const player = Object.create(playerProto);
+            player._record = record;
+            return player;
+        });
+    });
+    return payload.teams;
+}
+"""
+
+# Columnar players double as ALL_PLAYERS entries: one view object per player, with the
+# team fields read through the player's team index instead of being copied in.
+COLUMNAR_DECODER_JS = """function decodeColumn(column) {
+    if (!column || Array.isArray(column)) return column;
+    return column.codes.map(code => column.values[code]);
+}
+
+function decodeColumnarTeams(payload) {
+    const cols = {};
+    Object.entries(payload.players).forEach(([key, column]) => {
+        cols[key] = decodeColumn(column);
+    });
+    const teamCols = {};
+    Object.entries(payload.teams).forEach(([key, column]) => {
+        teamCols[key] = decodeColumn(column);
+    });
+
+    const teamOf = cols.team;
+    const teamStart = [];
+    teamOf.forEach((t, i) => {
+        if (teamStart[t] === undefined) teamStart[t] = i;
+    });
+
+    const playerProto = makeRecordViewProto(payload, (view, key) => {
+        const column = cols[key];
+        const value = column ? column[view._i] : undefined;
+        return value === null ? undefined : value;
+    });
+    const teamField = key => ({ get() { return teamCols[key][teamOf[this._i]]; } });
+    Object.defineProperties(playerProto, {
+        school: teamField('school'),
+        team: teamField('team'),
+        category: teamField('category'),
+        gender: teamField('gender'),
+        team_source_idx: teamField('source_idx'),
+        player_idx: { get() { return this._i - teamStart[teamOf[this._i]]; } },
+    });
+
+    const teamKeys = Object.keys(teamCols);
+    const teams = teamCols.source_idx.map((_, t) => {
+        const team = { players: [] };
+        teamKeys.forEach(key => {
+            team[key] = teamCols[key][t];
+        });
+        return team;
+    });
+    const views = teamOf.map((t, i) => {
+        const player = Object.create(playerProto);
+        player._i = i;
+        teams[t].players.push(player);
+        return player;
+    });
+    return { teams, views };
+}
+"""
+
+PLAYER_INDEX_JS = """// ── INIT ──
+const TEAM_BY_SOURCE_IDX = {};
+TEAMS_DATA.forEach(team => {
+    TEAM_BY_SOURCE_IDX[team.source_idx] = team;
+});
+
+const ALL_PLAYERS = [];
+TEAMS_DATA.forEach(team => {
+    team.players.forEach((p, playerIdx) => {
+        ALL_PLAYERS.push({
+            record_id: p.record_id,
+            name: p.name,
+            dob: p.dob,
+            dob_display: p.dob_display,
+            school: team.school,
+            team: team.team,
+            category: team.category,
+            gender: team.gender,
+            team_source_idx: team.source_idx,
+            player_idx: playerIdx,
+        });
+    });
+});
+const TEAMS_READY = Promise.resolve();"""
+
+COLUMNAR_INDEX_JS = """// ── INIT ──
+const TEAM_BY_SOURCE_IDX = {};
+TEAMS_DATA.forEach(team => {
+    TEAM_BY_SOURCE_IDX[team.source_idx] = team;
+});
+
+// The player views already expose school/team/category/gender/team_source_idx/player_idx.
+const ALL_PLAYERS = TEAMS_COLUMNS.views;
+const TEAMS_READY = Promise.resolve();"""
+
+
+def script_json(value, **kwargs):
+    """JSON for an inline <script>; '</' is escaped so data cannot close the tag."""
+    return json.dumps(value, ensure_ascii=False, **kwargs).replace('</', '<\\/')
+
+
+def _document_id(player, fields):
+    """Drive file id shared by every URL field of one document, or '' if any deviates."""
+    first_field = next(iter(fields))
+    prefix, suffix = DRIVE_URL_TEMPLATES[fields[first_field]]
+    url = player.get(first_field)
+    if not isinstance(url, str) or len(url) <= len(prefix) + len(suffix):
+        return ""
+    if not (url.startswith(prefix) and url.endswith(suffix)):
+        return ""
+    file_id = url[len(prefix):len(url) - len(suffix)]
+    for field, template in fields.items():
+        prefix, suffix = DRIVE_URL_TEMPLATES[template]
+        if player.get(field) != prefix + file_id + suffix:
+            return ""
+    return file_id
+
+
+def _iso_dob_display(dob):
+    match = ISO_DATE_RE.fullmatch(dob) if isinstance(dob, str) else None
+    if not match:
+        return None
+    year, month, day = match.groups()
+    if not 1 <= int(month) <= 12:
+        return None
+    return f"{MONTH_NAMES[int(month) - 1]} {day}, {year}"
+
+
+def compact_player(player, tables=None):
+    """Minified player record; with ``tables`` ({field: {value: index}}), the values of
+    those fields are replaced by their index, growing the tables as needed."""
+    compact = {
+        key: value for key, value in player.items()
+        if key not in COMPACT_URL_FIELDS and value != "" and value is not None
+    }
+    for field, table in (tables or {}).items():
+        if isinstance(compact.get(field), str):
+            compact[field] = table.setdefault(compact[field], len(table))
+    if 'dob_display' in compact and compact['dob_display'] == _iso_dob_display(player.get('dob')):
+        del compact['dob_display']
+    seen_ids = {}
+    for id_key, fields in COMPACT_DOCUMENTS.items():
+        file_id = _document_id(player, fields)
+        if file_id:
+            compact[id_key] = COMPACT_ID_REF + seen_ids[file_id] if file_id in seen_ids else file_id
+            seen_ids.setdefault(file_id, id_key)
+            continue
+        for field in fields:
+            if player.get(field, "") != "":
+                compact[field] = player[field]
+    return compact
+
+
+def compact_teams_payload(teams_json):
+    player_fields = list(dict.fromkeys(key for team in teams_json for p in team['players'] for key in p))
+    tables = {field: {} for field in COMPACT_TABLE_FIELDS}
+    teams = [
+        {**team, 'players': [compact_player(p, tables) for p in team['players']]}
+        for team in teams_json
+    ]
+    return {
+        'urls': DRIVE_URL_TEMPLATES,
+        'documents': COMPACT_DOCUMENTS,
+        'month_names': MONTH_NAMES,
+        'player_fields': player_fields,
+        'tables': {field: list(table) for field, table in tables.items() if table},
+        'teams': teams,
+    }
+
+
+TEAM_COLUMNS = ['source_idx', 'team', 'school', 'gender', 'category']
+
+
+def _column(values):
+    """One JSON column; low-cardinality text becomes a value table plus integer codes."""
+    distinct = {}
+    codes = [distinct.setdefault(value, len(distinct)) for value in values]
+    if len(distinct) * 4 <= len(values) and all(value is None or isinstance(value, str) for value in distinct):
+        return {'values': list(distinct), 'codes': codes}
+    return values
+
+
+def columnar_teams_payload(teams_json):
+    """Struct-of-arrays TEAMS_DATA: one array per field, players pointing at teams by index."""
+    rows = [(team_idx, compact_player(p)) for team_idx, team in enumerate(teams_json) for p in team['players']]
+    player_keys = list(dict.fromkeys(key for _, record in rows for key in record))
+    team_keys = list(dict.fromkeys(TEAM_COLUMNS + [key for team in teams_json for key in team if key != 'players']))
+    players = {'team': [team_idx for team_idx, _ in rows]}
+    for key in player_keys:
+        players[key] = _column([record.get(key) for _, record in rows])
+    return {
+        'urls': DRIVE_URL_TEMPLATES,
+        'documents': COMPACT_DOCUMENTS,
+        'month_names': MONTH_NAMES,
+        'player_fields': list(dict.fromkeys(key for team in teams_json for p in team['players'] for key in p)),
+        'teams': {key: _column([team.get(key) for team in teams_json]) for key in team_keys},
+        'players': players,
+    }
+
+
+def teams_payload(teams_json, data_format='full'):
+    if data_format == 'columnar':
+        return columnar_teams_payload(teams_json)
+    if data_format == 'compact':
+        return compact_teams_payload(teams_json)
+    return teams_json
+
+
+def _decoded_column(column):
+    return [column['values'][code] for code in column['codes']] if isinstance(column, dict) else column
+
+
+def decoded_teams(payload, data_format='full'):
+    """TEAMS_DATA as the page reads it back from a :func:`teams_payload` (after ``json_safe``).
+
+    Compact and columnar players become plain records of every ``player_fields`` entry,
+    with URLs and dob_display rebuilt and dropped fields as '', the same values the
+    page's record views return (a compact null stays null; a columnar null counts as
+    dropped). Split pages cache and patch their data in this form.
+    """
+    if data_format == 'full':
+        return payload
+    missing = object()
+    derived = {
+        field: (id_key, payload['urls'][template])
+        for id_key, fields in payload['documents'].items() for field, template in fields.items()
+    }
+
+    def record(read):
+        def file_id(id_key):
+            value = read(id_key)
+            return read(value[1:]) if isinstance(value, str) and value[:1] == COMPACT_ID_REF else value
+
+        player = {}
+        for field in payload['player_fields']:
+            value = read(field)
+            if value is missing and field in derived:
+                id_key, (prefix, suffix) = derived[field]
+                file = file_id(id_key)
+                value = prefix + file + suffix if file and file is not missing else ''
+            elif value is missing and field == 'dob_display':
+                value = _iso_dob_display(read('dob')) or ''
+            player[field] = '' if value is missing else value
+        return player
+
+    if data_format == 'compact':
+        tables = payload.get('tables', {})
+
+        def compact_read(player):
+            def read(key):
+                value = player.get(key, missing)
+                return tables[key][value] if key in tables and value is not missing else value
+            return read
+
+        return [
+            {**team, 'players': [record(compact_read(player)) for player in team['players']]}
+            for team in payload['teams']
+        ]
+
+    columns = {key: _decoded_column(column) for key, column in payload['players'].items()}
+    team_columns = {key: _decoded_column(column) for key, column in payload['teams'].items()}
+    teams = [
+        {'players': [], **{key: values[t] for key, values in team_columns.items()}}
+        for t in range(len(team_columns['source_idx']))
+    ]
+    for i, t in enumerate(columns['team']):
+        def read(key, i=i):
+            value = columns[key][i] if key in columns else None
+            return missing if value is None else value
+        teams[t]['players'].append(record(read))
+    return teams
+
+
+def build_search_index(teams_json):
+    """Sorted search tokens and, per token, the ``source_idx`` of every team it occurs in.
+
+    Team names, school names and player names are folded with :func:`normalize_key`, the
+    page's ``foldSearchText``, so the page answers each keystroke with prefix lookups.
+    """
+    postings = {}
+    for team in teams_json:
+        texts = [team['team'], team['school'], *(player['name'] for player in team['players'])]
+        for text in texts:
+            for token in normalize_key(text).split():
+                teams = postings.setdefault(token, [])
+                if not teams or teams[-1] != team['source_idx']:
+                    teams.append(team['source_idx'])
+    tokens = sorted(postings)
+    return {'tokens': tokens, 'teams': [postings[token] for token in tokens]}
+
+
+def render_search_index_script(teams_json):
+    index = script_json(build_search_index(teams_json), separators=(',', ':'))
+    return f"const SEARCH_INDEX = {index};"
+
+
+def render_teams_script(teams_json, data_format='full', id_map=None, diagnostics=None, duplicates=None):
+    """TEAMS_DATA plus the TEAM_BY_SOURCE_IDX / ALL_PLAYERS indexes, as embedded in the page.
+
+    ``id_map`` (old → new record ids) lets the page move review tags saved under old ids;
+    ``diagnostics`` are the :func:`school_category_diagnostics` rows for the review board
+    and ``duplicates`` the :func:`find_duplicate_clusters` clusters.
+    """
+    payload = teams_payload(teams_json, data_format)
+    migration = "\n".join([
+        render_id_migration_script(id_map),
+        render_diagnostics_script(diagnostics),
+        render_duplicates_script(duplicates),
+        render_search_index_script(teams_json),
+    ])
+    if data_format == 'columnar':
+        return (
+            f"{RECORD_VIEW_JS}\n{COLUMNAR_DECODER_JS}\n"
+            f"const TEAMS_COLUMNS = decodeColumnarTeams({script_json(payload, separators=(',', ':'))});\n"
+            f"const TEAMS_DATA = TEAMS_COLUMNS.teams;\n{migration}\n\n{COLUMNAR_INDEX_JS}"
+        )
+    if data_format == 'compact':
+        data = (
+            f"{RECORD_VIEW_JS}\n{COMPACT_DECODER_JS}\n"
+            f"const TEAMS_DATA = decodeCompactTeams({script_json(payload, separators=(',', ':'))});"
+        )
+    else:
+        data = f"const TEAMS_DATA = {script_json(payload, indent=2)};"
+    return f"{data}\n{migration}\n\n{PLAYER_INDEX_JS}"
+
+
+# 10. Split layout: immutable app shell assets plus a content-hashed data file
+SPLIT_DECODE_JS = {
+    'full': "{ teams: payload, views: null }",
+    'compact': "{ teams: decodeCompactTeams(payload), views: null }",
+    'columnar': "decodeColumnarTeams(payload)",
+}
+
+SPLIT_LOADER_JS = """const TEAMS_DATA = [];
+const TEAM_BY_SOURCE_IDX = {};
+const ALL_PLAYERS = [];
+// Built from the loaded teams (build_search_index in dashboard.py does the same for inline pages).
+let SEARCH_INDEX = null;
+// v2 holds decoded records in every format (v1 held the raw payload)
+const SNAPSHOT_STORAGE_KEY = 'bb_teams_snapshot_v2';
+
+function fetchJson(url) {
+    return fetch(url).then(response => {
+        if (!response.ok) throw new Error(`HTTP ${response.status}`);
+        return response.json();
+    });
+}
+
+function rememberSnapshot(version, teams) {
+    try {
+        localStorage.setItem(SNAPSHOT_STORAGE_KEY, JSON.stringify({ version, teams }));
+    } catch (err) {
+        // Over quota or storage disabled: the next visit just downloads the snapshot again.
+    }
+    return teams;
+}
+
+function decodePayload(payload) {
+    return %s;
+}
+
+function plainTeams(teams, playerFields) {
+    // Compact/columnar players are views; deltas patch, and the cache keeps, plain records
+    // of the same values (decoded_teams in dashboard.py).
+    if (!playerFields) return teams;
+    return teams.map(team => ({
+        ...team,
+        players: team.players.map(p => Object.fromEntries(playerFields.map(field => [field, p[field]]))),
+    }));
+}
+
+function applyTeamsPatch(teams, patch) {
+    // Same steps as apply_patch in dashboard.py.
+    const players = new Map();
+    teams.forEach(team => team.players.forEach(p => players.set(p.record_id, p)));
+    patch.delete_players.forEach(id => players.delete(id));
+    patch.upsert_players.forEach(p => players.set(p.record_id, p));
+    const teamKey = team => team.team_id ?? team.team;
+    const oldTeams = new Map(teams.map(team => [teamKey(team), team]));
+    const upserts = new Map(patch.upsert_teams.map(team => [teamKey(team), team]));
+    return patch.team_order.map((name, sourceIdx) => {
+        const old = oldTeams.get(name);
+        const base = upserts.get(name) || old;
+        if (!base) throw new Error(`patch names unknown team ${name}`);
+        const roster = patch.rosters[name] || old.players.map(p => p.record_id);
+        const { players: _players, source_idx: _sourceIdx, ...fields } = base;
+        return {
+            source_idx: sourceIdx,
+            ...fields,
+            players: roster.map(id => {
+                if (!players.has(id)) throw new Error(`patch names unknown player ${id}`);
+                return players.get(id);
+            }),
+        };
+    });
+}
+
+function loadTeamsPayload(dataset) {
+    // The cached copy is brought up to date through the delta chain named in the shell;
+    // any gap or failure falls back to the full content-hashed snapshot.
+    const version = dataset.version;
+    const deltas = JSON.parse(dataset.deltas || '{}');
+    const snapshot = () => fetchJson(dataset.teams).then(payload => {
+        const decoded = decodePayload(payload);
+        rememberSnapshot(version, plainTeams(decoded.teams, payload.player_fields));
+        return decoded;
+    });
+    let cached = null;
+    try {
+        cached = JSON.parse(localStorage.getItem(SNAPSHOT_STORAGE_KEY));
+    } catch (err) {
+        cached = null;
+    }
+    if (!cached || !cached.version || !cached.teams || !version) return snapshot();
+    if (cached.version === version) return Promise.resolve({ teams: cached.teams, views: null });
+
+    const chain = [];
+    for (let at = cached.version; at !== version; at = deltas[at].to) {
+        if (!deltas[at] || chain.length >= Object.keys(deltas).length) return snapshot();
+        chain.push(deltas[at].file);
+    }
+    return chain
+        .reduce((ready, file) => ready.then(teams => fetchJson(file).then(patch => applyTeamsPatch(teams, patch))),
+                Promise.resolve(cached.teams))
+        .then(teams => ({ teams: rememberSnapshot(version, teams), views: null }))
+        .catch(() => snapshot());
+}
+
+// Split layout: this script is cached immutably; the team data comes from the
+// content-hashed JSON file named by the script tag's data-teams attribute, or from
+// the locally cached copy patched forward with the published deltas.
+const TEAMS_READY = loadTeamsPayload(document.currentScript.dataset)
+    .then(decoded => {
+        decoded.teams.forEach(team => {
+            TEAMS_DATA.push(team);
+            TEAM_BY_SOURCE_IDX[team.source_idx] = team;
+        });
+        SEARCH_INDEX = buildSearchIndex(TEAMS_DATA);
+        if (decoded.views) {
+            decoded.views.forEach(p => ALL_PLAYERS.push(p));
+            return;
+        }
+        TEAMS_DATA.forEach(team => {
+            team.players.forEach((p, playerIdx) => {
+                ALL_PLAYERS.push({
+                    record_id: p.record_id,
+                    name: p.name,
+                    dob: p.dob,
+                    dob_display: p.dob_display,
+                    school: team.school,
+                    team: team.team,
+                    category: team.category,
+                    gender: team.gender,
+                    team_source_idx: team.source_idx,
+                    player_idx: playerIdx,
+                });
+            });
+        });
+    });"""
+
+# Netlify _headers: hashed assets never change, the shell is revalidated on every visit.
+# Netlify only reads _headers from the publish directory, so the rules name the split
+# directory's path under it ({prefix}) and live in a marked block beside other rules.
+SPLIT_HEADERS = """{prefix}app.*
+  Cache-Control: public, max-age=31536000, immutable
+{prefix}data.*
+  Cache-Control: public, max-age=31536000, immutable
+{prefix}delta.*
+  Cache-Control: public, max-age=31536000, immutable
+{prefix}index.html
+  Cache-Control: no-cache
+{prefix}
+  Cache-Control: no-cache
+"""
+SPLIT_HEADERS_BLOCK = "# create.py --split {prefix}\n{rules}# end create.py --split {prefix}\n"
+HASHED_ASSET_RE = re.compile(
+    r"\b(?:app\.[0-9a-f]{12}\.(?:js|css)|data\.[0-9a-f]{12}\.json|delta\.[0-9a-f]{12}\.[0-9a-f]{12}\.json)\b"
+)
+SPLIT_VERSIONS = "versions.json"
+# How many past versions can still catch up through deltas instead of the full snapshot
+DELTA_HISTORY = 5
+
+
+def content_hash(text):
+    return hashlib.sha256(text.encode('utf-8')).hexdigest()[:12]
+
+
+def json_safe(value):
+    """NaN from missing cells as None, so files written for JSON.parse stay valid JSON."""
+    if isinstance(value, float) and value != value:
+        return None
+    if isinstance(value, dict):
+        return {key: json_safe(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [json_safe(item) for item in value]
+    return value
+
+
+def update_delta_chain(out_dir, payload, data_format, version):
+    """Write the previous version -> ``version`` delta and return the chain to publish.
+
+    ``versions.json`` remembers the current version and the deltas leading to it. Deltas
+    patch the :func:`decoded_teams` records of the JSON-safe ``payload``, the form the page
+    caches in every format; a format change, or a missing previous snapshot, starts a new
+    chain.
+    """
+    versions_path = os.path.join(out_dir, SPLIT_VERSIONS)
+    versions = {}
+    if os.path.exists(versions_path):
+        with open(versions_path, encoding="utf-8") as f:
+            versions = json.load(f)
+    previous = versions.get('version')
+    deltas = versions.get('deltas', {}) if versions.get('format') == data_format else {}
+    previous_path = os.path.join(out_dir, f"data.{previous}.json")
+
+    if versions.get('format') != data_format:
+        deltas = {}
+    elif previous != version and os.path.exists(previous_path):
+        with open(previous_path, encoding="utf-8") as f:
+            old_teams = decoded_teams(json.load(f), data_format)
+        patch = build_patch(old_teams, decoded_teams(payload, data_format))
+        delta_name = f"delta.{previous}.{version}.json"
+        with open(os.path.join(out_dir, delta_name), "w", encoding="utf-8") as f:
+            json.dump({'from': previous, 'to': version, **patch}, f, ensure_ascii=False, separators=(',', ':'))
+        deltas[previous] = {'to': version, 'file': delta_name}
+    elif previous != version:
+        deltas = {}
+
+    deltas.pop(version, None)
+    deltas = dict(list(deltas.items())[-DELTA_HISTORY:])
+    with open(versions_path, "w", encoding="utf-8") as f:
+        json.dump({'format': data_format, 'version': version, 'deltas': deltas}, f, indent=2)
+    return deltas
+
+
+def split_url_prefix(out_dir, publish_root):
+    """URL path of ``out_dir`` on a site published from ``publish_root``, e.g. '/site/'."""
+    relative = os.path.relpath(os.path.abspath(out_dir), os.path.abspath(publish_root))
+    if relative == os.curdir:
+        return "/"
+    if relative == os.pardir or relative.startswith(os.pardir + os.sep):
+        raise ValueError(f"{out_dir} is not inside the publish directory {publish_root}")
+    return "/" + relative.replace(os.sep, "/") + "/"
+
+
+def write_split_headers(out_dir, publish_root):
+    """Write the split directory's cache rules into ``publish_root``/_headers.
+
+    Only the block for this directory is replaced, so hand-written rules and other split
+    directories' blocks stay.
+    """
+    prefix = split_url_prefix(out_dir, publish_root)
+    block = SPLIT_HEADERS_BLOCK.format(prefix=prefix, rules=SPLIT_HEADERS.format(prefix=prefix))
+    path = os.path.join(publish_root, '_headers')
+    existing = ""
+    if os.path.exists(path):
+        with open(path, encoding="utf-8") as f:
+            existing = f.read()
+    start, end = block.splitlines(keepends=True)[0], block.splitlines(keepends=True)[-1]
+    if start in existing and end in existing[existing.index(start):]:
+        head, rest = existing.split(start, 1)
+        text = head + block + rest.split(end, 1)[1]
+    else:
+        text = existing + ("\n" if existing and not existing.endswith("\n") else "") + block
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(text)
+    return path
+
+
+def render_split_loader_script(data_format='full'):
+    decoders = {
+        'full': "",
+        'compact': f"{RECORD_VIEW_JS}\n{COMPACT_DECODER_JS}\n",
+        'columnar': f"{RECORD_VIEW_JS}\n{COLUMNAR_DECODER_JS}\n",
+    }[data_format]
+    return decoders + SPLIT_LOADER_JS % SPLIT_DECODE_JS[data_format]
+
+
+def write_split_dashboard(out_dir, teams_json, data_format='full', id_map=None, diagnostics=None, duplicates=None,
+                          publish_root=None):
+    """Write index.html + app.<hash>.css/js + data.<hash>.json into ``out_dir``.
+
+    Files from the previous generation stay in place so pages that are mid-load keep
+    working; anything older is removed, except the deltas still in the chain. The cache
+    rules go into the ``_headers`` file of ``publish_root`` (default: ``out_dir`` itself).
+    """
+    html = render_dashboard(render_split_loader_script(data_format))
+    style_open, style_close = html.index('<style>'), html.index('</style>')
+    script_open, script_close = html.index('<script>\n'), html.rindex('</script>')
+    css = html[style_open + len('<style>'):style_close]
+    js = html[script_open + len('<script>\n'):script_close]
+    payload = json_safe(teams_payload(teams_json, data_format))
+    data = json.dumps(payload, ensure_ascii=False, separators=(',', ':'))
+
+    css_name = f"app.{content_hash(css)}.css"
+    js_name = f"app.{content_hash(js)}.js"
+    version = content_hash(data)
+    data_name = f"data.{version}.json"
+    os.makedirs(out_dir, exist_ok=True)
+    write_split_headers(out_dir, out_dir if publish_root is None else publish_root)
+    deltas = update_delta_chain(out_dir, payload, data_format, version)
+    shell = (
+        html[:style_open]
+        + f'<link rel="stylesheet" href="{css_name}">'
+        + html[style_close + len('</style>'):script_open]
+        + f'<script>{render_id_migration_script(id_map)}\n{render_diagnostics_script(diagnostics)}\n'
+        + f'{render_duplicates_script(duplicates)}</script>\n'
+        + f'<script src="{js_name}" data-teams="{data_name}" data-version="{version}" '
+        + f'data-deltas="{escape(json.dumps(deltas, separators=(",", ":")))}" defer></script>'
+        + html[script_close + len('</script>'):]
+    )
+
+    shell_path = os.path.join(out_dir, 'index.html')
+    keep = {css_name, js_name, data_name, *(delta['file'] for delta in deltas.values())}
+    if os.path.exists(shell_path):
+        with open(shell_path, encoding='utf-8') as f:
+            keep.update(HASHED_ASSET_RE.findall(f.read()))
+
+    for name, content in ((css_name, css), (js_name, js), (data_name, data)):
+        path = os.path.join(out_dir, name)
+        if not os.path.exists(path):
+            with open(path, "w", encoding="utf-8") as f:
+                f.write(content)
+    for name in os.listdir(out_dir):
+        if HASHED_ASSET_RE.fullmatch(name) and name not in keep:
+            os.remove(os.path.join(out_dir, name))
+    with open(shell_path, "w", encoding="utf-8") as f:
+        f.write(shell)
+    return data_name
+
+
+# 11. Build cache: skip unchanged runs, re-extract only the school blocks that changed
+CACHE_DIR = ".buzzer_cache"
+CACHE_MANIFEST = "manifest.json"
+RECORD_ID_RE = re.compile(r"player_(\d+)")
+
+
+def file_hash(path):
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def read_school_blocks(file_path):
+    """Split the raw export into school blocks (a row naming a school starts a new one).
+
+    Each block carries the forward-fill state it inherits from the rows above it, and its
+    hash covers that state, so a block is only reused when it would fill the same way.
+    """
+    schema = detect_schema(file_path)
+    require_columns(schema)
+    with open(file_path, newline="", encoding="utf-8-sig") as f:
+        reader = csv.reader(f, delimiter=schema.delimiter)
+        next(reader, None)
+        ffill_idx = [schema.columns.get(col) for col in EXPORT_FFILL_COLUMNS]
+        school_idx = ffill_idx[0]
+        blocks = []
+        state = [""] * len(ffill_idx)
+        rows = []
+        carry = list(state)
+        for row in reader:
+            if not row:
+                continue
+            row += [""] * (len(schema.header) - len(row))
+            if row[school_idx] not in PANDAS_NA_VALUES and rows:
+                blocks.append((carry, rows))
+                carry, rows = list(state), []
+            rows.append(row)
+            for i, col_idx in enumerate(ffill_idx):
+                if col_idx is not None and row[col_idx] not in PANDAS_NA_VALUES:
+                    state[i] = row[col_idx]
+        if rows:
+            blocks.append((carry, rows))
+
+    hashed = []
+    for carry, rows in blocks:
+        digest = hashlib.sha256(json.dumps([carry, rows], ensure_ascii=False).encode("utf-8")).hexdigest()
+        hashed.append({'hash': digest, 'carry': carry, 'rows': rows})
+    return schema, hashed
+
+
+def build_block_teams(schema, blocks, engine='csv'):
+    """Run the pipeline once over several blocks; TEAMS_DATA per block, numbered from 1.
+
+    Each block is preceded by a player-less row holding its carry-in values, and the
+    forward fill runs per block, so every block fills exactly as it does in the full file.
+    """
+    if engine == 'csv':
+        return [csv_teams_from_rows(schema, block['rows'], block['carry']) for block in blocks]
+
+    ffill_idx = [schema.columns.get(col) for col in EXPORT_FFILL_COLUMNS]
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(schema.header)
+    block_ids = []
+    for block_id, block in enumerate(blocks):
+        carry_row = [""] * len(schema.header)
+        for value, col_idx in zip(block['carry'], ffill_idx):
+            if col_idx is not None:
+                carry_row[col_idx] = value
+        writer.writerow(carry_row)
+        writer.writerows(block['rows'])
+        block_ids.extend([block_id] * (len(block['rows']) + 1))
+
+    import pandas as pd
+
+    df = read_export(io.BytesIO(buffer.getvalue().encode("utf-8")), engine, schema._replace(delimiter=','))
+    block_of = pd.Series(block_ids, index=df.index)
+    df[EXPORT_FFILL_COLUMNS] = df[EXPORT_FFILL_COLUMNS].groupby(block_of, sort=False).ffill()
+    df_players = df.dropna(subset=[PLAYER_NAME_COL]).copy()
+    dashboard_df = build_dashboard_frame(df_players)
+
+    # One build for all blocks, then each team goes back to its block with record ids
+    # renumbered from 1 within the block, as a build of the block alone would number them
+    player_blocks = block_of[dashboard_df.index].to_numpy()
+    block_starts = {}
+    for position, block_id in enumerate(player_blocks.tolist()):
+        block_starts.setdefault(block_id, position)
+    teams_by_block = [[] for _ in blocks]
+    for team in build_teams_json(dashboard_df, blocks=player_blocks):
+        position = int(RECORD_ID_RE.fullmatch(team['players'][0]['record_id']).group(1)) - 1
+        block_id = player_blocks[position]
+        offset = block_starts[block_id]
+        for player in team['players']:
+            number = int(RECORD_ID_RE.fullmatch(player['record_id']).group(1)) - offset
+            player['record_id'] = f"player_{number:04d}"
+        block_teams = teams_by_block[block_id]
+        block_teams.append({**team, 'source_idx': len(block_teams)})
+    return teams_by_block
+
+
+def splice_block_teams(teams_by_block):
+    """Merge per-block TEAMS_DATA into one, as if the whole export had been built at once.
+
+    Teams merge by :func:`team_group_key` in order of first appearance; record ids are
+    shifted by the number of players in earlier blocks so they keep following export row order.
+    """
+    teams = {}
+    offset = 0
+    for block_teams in teams_by_block:
+        block_players = 0
+        for team in block_teams:
+            key = team_group_key(team)
+            merged = teams.setdefault(key, {**team, 'players': []})
+            for player in team['players']:
+                local_number = int(RECORD_ID_RE.fullmatch(player['record_id']).group(1))
+                merged['players'].append({**player, 'record_id': f"player_{offset + local_number:04d}"})
+            block_players += len(team['players'])
+        offset += block_players
+    return [{**team, 'source_idx': source_idx} for source_idx, team in enumerate(teams.values())]
+
+
+def build_blocks(schema, blocks, engine='csv', workers=1):
+    """``build_block_teams`` spread over a process pool, results in block order.
+
+    Blocks are dealt out as contiguous batches, a few per worker so one large school does
+    not leave the other processes idle.
+    """
+    if workers <= 1 or len(blocks) <= 1:
+        return build_block_teams(schema, blocks, engine)
+    batch_size = max(1, -(-len(blocks) // (workers * 4)))
+    batches = [blocks[i:i + batch_size] for i in range(0, len(blocks), batch_size)]
+    from concurrent.futures import ProcessPoolExecutor
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        results = pool.map(build_block_teams, repeat(schema), batches, repeat(engine))
+        return [block_teams for batch in results for block_teams in batch]
+
+
+def parallel_teams_json(file_path, engine='csv', workers=1):
+    """TEAMS_DATA built school block by school block on ``workers`` processes."""
+    schema, blocks = read_school_blocks(file_path)
+    return splice_block_teams(build_blocks(schema, blocks, engine, workers))
+
+
+class BuildCache:
+    """``.buzzer_cache/``: a manifest of the last build plus per-block TEAMS_DATA files."""
+
+    def __init__(self, cache_dir, input_path, options):
+        self.cache_dir = cache_dir
+        self.input_path = input_path
+        self.key = {
+            'input_hash': file_hash(input_path),
+            'generator_hash': file_hash(os.path.abspath(__file__)),
+            'rules_hash': file_hash(school_category_rules.__file__),
+            'options': options,
+        }
+        self.manifest = {}
+        self.block_hashes = None
+        self.stats = None
+        manifest_path = os.path.join(cache_dir, CACHE_MANIFEST)
+        if os.path.exists(manifest_path):
+            with open(manifest_path, encoding="utf-8") as f:
+                self.manifest = json.load(f)
+
+    def is_fresh(self):
+        """True when input, generator and options match the last build and its outputs are intact."""
+        if any(self.manifest.get(key) != value for key, value in self.key.items()):
+            return False
+        outputs = self.manifest.get('outputs', {})
+        return bool(outputs) and all(
+            os.path.exists(path) and file_hash(path) == digest for path, digest in outputs.items()
+        )
+
+    def _block_path(self, digest):
+        return os.path.join(self.cache_dir, "blocks", f"{digest}.json")
+
+    def build_teams(self, engine='csv', workers=1):
+        """TEAMS_DATA for the input, re-extracting only blocks missing from the cache."""
+        schema, blocks = read_school_blocks(self.input_path)
+        teams_by_block = [None] * len(blocks)
+        stale = []
+        generator_changed = self.manifest.get('generator_hash') != self.key['generator_hash']
+        for i, block in enumerate(blocks):
+            path = self._block_path(block['hash'])
+            if not generator_changed and os.path.exists(path):
+                with open(path, encoding="utf-8") as f:
+                    teams_by_block[i] = json.load(f)
+            else:
+                stale.append(i)
+
+        if stale:
+            os.makedirs(os.path.join(self.cache_dir, "blocks"), exist_ok=True)
+            rebuilt = build_blocks(schema, [blocks[i] for i in stale], engine, workers)
+            for i, block_teams in zip(stale, rebuilt):
+                teams_by_block[i] = block_teams
+                with open(self._block_path(blocks[i]['hash']), "w", encoding="utf-8") as f:
+                    # dumps, not dump: only dumps uses the C encoder
+                    f.write(json.dumps(block_teams, ensure_ascii=False))
+
+        self.block_hashes = [block['hash'] for block in blocks]
+        self.stats = {'blocks': len(blocks), 'rebuilt': len(stale)}
+        return splice_block_teams(teams_by_block)
+
+    def save(self, outputs):
+        """Record this build and drop cached blocks the input no longer has.
+
+        Builds that bypassed the block cache (``--stream``) leave the blocks as they are.
+        """
+        os.makedirs(self.cache_dir, exist_ok=True)
+        manifest = {**self.key, 'blocks': self.block_hashes, 'outputs': {path: file_hash(path) for path in outputs}}
+        with open(os.path.join(self.cache_dir, CACHE_MANIFEST), "w", encoding="utf-8") as f:
+            json.dump(manifest, f, ensure_ascii=False, indent=2)
+        if self.block_hashes is None:
+            return
+        live = {f"{digest}.json" for digest in self.block_hashes}
+        blocks_dir = os.path.join(self.cache_dir, "blocks")
+        for name in os.listdir(blocks_dir):
+            if name not in live:
+                os.remove(os.path.join(blocks_dir, name))
+
+
+# 12. --profile: wall time, traced peak memory and throughput per stage
+class StageProfile:
+    """Collects one entry per ``with profile(name, rows=...)`` block.
+
+    ``rows`` can also be filled in inside the block through the dict it yields. When
+    disabled, blocks cost nothing and nothing is recorded. Without ``trace_memory`` the
+    stages are timed untraced and their peak fields are None.
+    """
+
+    def __init__(self, enabled=True, trace_memory=True):
+        self.enabled = enabled
+        self.trace_memory = trace_memory
+        self.stages = []
+        if enabled and trace_memory:
+            import tracemalloc
+
+            if not tracemalloc.is_tracing():
+                tracemalloc.start()
+
+    @contextmanager
+    def __call__(self, name, rows=None):
+        stage = {'rows': rows}
+        if not self.enabled:
+            yield stage
+            return
+        if self.trace_memory:
+            import tracemalloc
+
+            tracemalloc.reset_peak()
+            start_bytes = tracemalloc.get_traced_memory()[0]
+        start = time.perf_counter()
+        yield stage
+        seconds = time.perf_counter() - start
+        peak_bytes = tracemalloc.get_traced_memory()[1] if self.trace_memory else None
+        self.stages.append({
+            'stage': name,
+            'seconds': round(seconds, 6),
+            'rows': stage['rows'],
+            'rows_per_sec': round(stage['rows'] / seconds, 1) if stage['rows'] and seconds else None,
+            'peak_bytes': peak_bytes,
+            'peak_delta_bytes': peak_bytes - start_bytes if self.trace_memory else None,
+        })
+
+    def report(self, **context):
+        """The JSON document for ``--profile``: run context, per-stage numbers and totals."""
+        import platform
+
+        return {
+            **context,
+            'python': platform.python_version(),
+            'stages': self.stages,
+            'total_seconds': round(sum(stage['seconds'] for stage in self.stages), 6),
+            'peak_bytes': max((stage['peak_bytes'] or 0 for stage in self.stages), default=0),
+        }
+
+
+# 13. Stable record ids: derived from who the player is, not from the export row order
+STABLE_ID_PREFIX = "p_"
+COMBINING_MARK_RE = re.compile(r"[\u0300-\u036f]")
+NON_ALNUM_RE = re.compile(r"[^a-z0-9]+")
+
+
+def normalize_key(value):
+    """``normalizeSchoolKey`` from school_category_rules.js: accents folded, lowercase,
+    '&' read as 'and', anything else non-alphanumeric collapsed to single spaces."""
+    if is_missing(value):
+        return ""
+    return _normalize_text(str(value))
+
+
+@lru_cache(maxsize=1 << 17)
+def _normalize_text(text):
+    if not text.isascii():
+        text = COMBINING_MARK_RE.sub("", unicodedata.normalize("NFD", text))
+    return NON_ALNUM_RE.sub(" ", text.lower().replace("&", " and ")).strip()
+
+
+def player_identity(team, player, by_name=False):
+    """What makes a player the same player across exports: team id (school and team name
+    when there is none, or with ``by_name``), name and DOB."""
+    dob = "" if is_missing(player['dob']) else str(player['dob']).strip()
+    if by_name or is_missing(team.get('team_id')):
+        team_part = [normalize_key(team['school']), normalize_key(team['team'])]
+    else:
+        team_part = [f"id:{team['team_id']}"]
+    return "\x1f".join(team_part + [normalize_key(player['name']), dob])
+
+
+def assign_stable_ids(teams_json):
+    """Replace row-order record ids with ids hashed from :func:`player_identity`.
+
+    Players sharing an identity (the same child entered twice on a roster) get ``_2``,
+    ``_3``… in export row order. Returns the new TEAMS_DATA and the old → new id map
+    the page uses to move review tags saved under row-order ids; for teams with a team
+    id it also maps the ids their players had when hashed from the team name.
+    """
+    rows = sorted(
+        ((int(RECORD_ID_RE.fullmatch(player['record_id']).group(1)), team_idx, player_idx)
+         for team_idx, team in enumerate(teams_json) for player_idx, player in enumerate(team['players'])),
+    )
+    new_ids = _hashed_ids(teams_json, rows)
+    id_map = {}
+    if any(not is_missing(team.get('team_id')) for team in teams_json):
+        by_name = _hashed_ids(teams_json, rows, by_name=True)
+        id_map.update((by_name[key], new_id) for key, new_id in new_ids.items() if by_name[key] != new_id)
+
+    stable_teams = []
+    for team_idx, team in enumerate(teams_json):
+        players = []
+        for player_idx, player in enumerate(team['players']):
+            id_map[player['record_id']] = new_ids[team_idx, player_idx]
+            players.append({**player, 'record_id': new_ids[team_idx, player_idx]})
+        stable_teams.append({**team, 'players': players})
+    return stable_teams, id_map
+
+
+def _hashed_ids(teams_json, rows, by_name=False):
+    """``{(team index, player index): stable id}`` for ``rows`` in export row order."""
+    ids = {}
+    seen = {}
+    for _, team_idx, player_idx in rows:
+        team = teams_json[team_idx]
+        identity = player_identity(team, team['players'][player_idx], by_name)
+        digest = hashlib.sha1(identity.encode("utf-8")).hexdigest()[:12]
+        seen[digest] = seen.get(digest, 0) + 1
+        suffix = f"_{seen[digest]}" if seen[digest] > 1 else ""
+        ids[team_idx, player_idx] = f"{STABLE_ID_PREFIX}{digest}{suffix}"
+    return ids
+
+
+def render_id_migration_script(id_map):
+    return f"const RECORD_ID_MIGRATION = {script_json(id_map or {}, separators=(',', ':'))};"
+
+
+# 14. Export diff: what changed between two snapshots, and a patch from one to the other
+DIFF_PLAYER_FIELDS = ['name', 'dob', 'jersey', 'grade', 'cert_url', 'waiver_url', 'photo']
+DIFF_TEAM_FIELDS = ['team', 'school', 'gender', 'category']
+
+
+def plain_value(value):
+    """JSON-safe value: NaN from a missing cell becomes None."""
+    return None if is_missing(value) else value
+
+
+def team_key(team):
+    """The :func:`team_group_key` teams are grouped by identifies a team within one TEAMS_DATA."""
+    return plain_value(team_group_key(team))
+
+
+def _players_by_diff_key(team):
+    """Players of one team keyed by name (not DOB, so DOB edits show up as changes)."""
+    keyed = {}
+    seen = {}
+    for player in team['players']:
+        # Player rows always have a name, so the missing-value check can be skipped
+        name = _normalize_text(player['name'])
+        count = seen[name] = seen.get(name, 0) + 1
+        keyed[name, count] = (team, player)
+    return keyed
+
+
+def _player_summary(team, player):
+    return {
+        'record_id': player['record_id'],
+        'school': plain_value(team['school']),
+        'team': plain_value(team['team']),
+        **{field: plain_value(player[field]) for field in DIFF_PLAYER_FIELDS},
+    }
+
+
+def diff_exports(old_teams, new_teams):
+    """Added, removed and changed teams and players between two TEAMS_DATA builds."""
+    old_by_name = {team_key(team): team for team in old_teams}
+    new_by_name = {team_key(team): team for team in new_teams}
+    teams = {
+        'added': [plain_value(team['team']) for name, team in new_by_name.items() if name not in old_by_name],
+        'removed': [plain_value(team['team']) for name, team in old_by_name.items() if name not in new_by_name],
+        'changed': [],
+    }
+    for name, new_team in new_by_name.items():
+        old_team = old_by_name.get(name)
+        changes = old_team and {
+            field: [plain_value(old_team[field]), plain_value(new_team[field])]
+            for field in DIFF_TEAM_FIELDS if plain_value(old_team[field]) != plain_value(new_team[field])
+        }
+        if changes:
+            teams['changed'].append({'team': plain_value(new_team['team']), 'changes': changes})
+
+    # Players are matched within the team of the same key, so a renamed team's players stay put
+    no_players = {'players': []}
+    diff_values = itemgetter(*DIFF_PLAYER_FIELDS)
+    players = {'added': [], 'removed': [], 'changed': []}
+    unchanged = 0
+    for key in old_by_name.keys() | new_by_name.keys():
+        old_team, new_team = old_by_name.get(key, no_players), new_by_name.get(key, no_players)
+        # Most rosters are untouched between two exports; one C-level comparison clears them
+        if old_team['players'] == new_team['players']:
+            unchanged += len(new_team['players'])
+            continue
+        old_players = _players_by_diff_key(old_team)
+        new_players = _players_by_diff_key(new_team)
+        players['added'].extend(_player_summary(*new_players[name]) for name in new_players.keys() - old_players.keys())
+        players['removed'].extend(_player_summary(*old_players[name]) for name in old_players.keys() - new_players.keys())
+        for name in new_players.keys() & old_players.keys():
+            (_, old_player), (new_team, new_player) = old_players[name], new_players[name]
+            if diff_values(old_player) == diff_values(new_player):
+                unchanged += 1
+                continue
+            changes = {
+                field: [plain_value(old_player[field]), plain_value(new_player[field])]
+                for field in DIFF_PLAYER_FIELDS if plain_value(old_player[field]) != plain_value(new_player[field])
+            }
+            if not changes:
+                unchanged += 1
+                continue
+            players['changed'].append({
+                'record_id': new_player['record_id'],
+                'old_record_id': old_player['record_id'],
+                'school': plain_value(new_team['school']),
+                'team': plain_value(new_team['team']),
+                'name': new_player['name'],
+                'changes': changes,
+            })
+    for entries in players.values():
+        entries.sort(key=lambda entry: (str(entry['school']), str(entry['team']), entry['name']))
+
+    return {
+        'summary': {
+            **{f"teams_{kind}": len(entries) for kind, entries in teams.items()},
+            **{f"players_{kind}": len(entries) for kind, entries in players.items()},
+            'players_unchanged': unchanged,
+        },
+        'teams': teams,
+        'players': players,
+    }
+
+
+def _same_record(old, new):
+    # Dict equality, except that NaN from a missing cell equals NaN
+    if old == new:
+        return True
+    if old is None or old.keys() != new.keys():
+        return False
+    return all(value == new[key] or (value != value and new[key] != new[key]) for key, value in old.items())
+
+
+def build_patch(old_teams, new_teams):
+    """Upserts and deletes keyed by stable record id (and :func:`team_key`) that turn the old
+    TEAMS_DATA into the new one; :func:`apply_patch` shows how they are applied.
+
+    ``rosters`` lists the new player order of every team whose membership or order
+    changed; other teams keep their old order. ``source_idx`` follows ``team_order``.
+    """
+    old_by_name = {team_key(team): team for team in old_teams}
+    new_names = [team_key(team) for team in new_teams]
+    old_players = {player['record_id']: player for team in old_teams for player in team['players']}
+    new_players = {player['record_id']: player for team in new_teams for player in team['players']}
+
+    upsert_teams, rosters = [], {}
+    for name, team in zip(new_names, new_teams):
+        fields = {key: value for key, value in team.items() if key not in ('players', 'source_idx')}
+        old_team = old_by_name.get(name)
+        if old_team is None or any(plain_value(old_team.get(key)) != plain_value(value) for key, value in fields.items()):
+            upsert_teams.append(fields)
+        roster = [player['record_id'] for player in team['players']]
+        if old_team is None or roster != [player['record_id'] for player in old_team['players']]:
+            rosters[name] = roster
+
+    kept_names = set(new_names)
+    return {
+        'team_order': new_names,
+        'upsert_teams': upsert_teams,
+        'delete_teams': [name for name in old_by_name if name not in kept_names],
+        'rosters': rosters,
+        'upsert_players': [
+            player for record_id, player in new_players.items()
+            if not _same_record(old_players.get(record_id), player)
+        ],
+        'delete_players': [record_id for record_id in old_players if record_id not in new_players],
+    }
+
+
+def apply_patch(old_teams, patch):
+    """TEAMS_DATA after :func:`build_patch`'s patch (the page applies it the same way)."""
+    players = {player['record_id']: player for team in old_teams for player in team['players']}
+    for record_id in patch['delete_players']:
+        players.pop(record_id, None)
+    players.update((player['record_id'], player) for player in patch['upsert_players'])
+    teams = {team_key(team): team for team in old_teams}
+    upserts = {team_key(team): team for team in patch['upsert_teams']}
+
+    patched = []
+    for source_idx, name in enumerate(patch['team_order']):
+        base = upserts.get(name) or {key: value for key, value in teams[name].items() if key not in ('players', 'source_idx')}
+        roster = patch['rosters'].get(name) or [player['record_id'] for player in teams[name]['players']]
+        patched.append({'source_idx': source_idx, **base, 'players': [players[record_id] for record_id in roster]})
+    return patched
+
+
+def diff_main(argv):
+    parser = argparse.ArgumentParser(
+        prog="create.py diff", description="Compare two registration exports.",
+    )
+    parser.add_argument("old", help="previous export CSV")
+    parser.add_argument("new", help="current export CSV")
+    parser.add_argument("--engine", choices=CSV_ENGINES, default='csv', help="how to read the exports (default: csv)")
+    parser.add_argument("--output", metavar="PATH", help="write the JSON report to PATH instead of stdout")
+    parser.add_argument("--patch", metavar="PATH", help="also write the old → new TEAMS_DATA patch to PATH")
+    args = parser.parse_args(argv)
+
+    old_teams, _ = assign_stable_ids(build_teams(args.old, args.engine))
+    new_teams, _ = assign_stable_ids(build_teams(args.new, args.engine))
+    start = time.perf_counter()
+    report = {'old': args.old, 'new': args.new, **diff_exports(old_teams, new_teams)}
+    patch = build_patch(old_teams, new_teams) if args.patch else None
+    report['diff_seconds'] = round(time.perf_counter() - start, 6)
+
+    if args.patch:
+        with open(args.patch, "w", encoding="utf-8") as f:
+            json.dump(patch, f, ensure_ascii=False, separators=(',', ':'))
+    text = json.dumps(report, ensure_ascii=False, indent=2)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            f.write(text + "\n")
+        print(", ".join(f"{key.replace('_', ' ')}: {value}" for key, value in report['summary'].items()))
+    else:
+        print(text)
+
+
+# 15. --shard-by: one small dashboard per division or school, rendered on a process pool
+SHARD_DIR = "shards"
+SHARD_KEYS = ('category', 'school')
+CATEGORY_CODE_METADATA = school_category_rules.CATEGORY_CODE_METADATA
+CATEGORY_CODE_BY_LABEL = {
+    (normalize_key(meta['category']), normalize_key(meta['gender'])): code
+    for code, meta in CATEGORY_CODE_METADATA.items()
+}
+UNSHARDED_LABEL = "Sin asignar"
+
+
+def category_code(team):
+    """Division code (JM, SRF, ...) of a team, or None when its category/gender is unknown."""
+    return CATEGORY_CODE_BY_LABEL.get((normalize_key(team['category']), normalize_key(team['gender'])))
+
+
+def shard_teams(teams_json, shard_by):
+    """``{name: (label, teams)}`` for one shard key: divisions in CATEGORY_CODE_METADATA
+    order, schools alphabetically, unassigned teams last.
+
+    Teams keep their ``source_idx`` so a player opened in a shard and in the full page
+    are the same record.
+    """
+    shards, order = {}, {}
+    codes = list(CATEGORY_CODE_METADATA)
+    for team in teams_json:
+        if shard_by == 'category':
+            code = category_code(team)
+            meta = CATEGORY_CODE_METADATA.get(code)
+            slug = code.lower() if code else "other"
+            label = f"{code} · {meta['category']} {meta['gender']}" if code else UNSHARDED_LABEL
+            rank = codes.index(code) if code else len(codes)
+        else:
+            school = plain_value(team['school'])
+            slug = normalize_key(school).replace(" ", "-") or "other"
+            label = school or UNSHARDED_LABEL
+            rank = (not school, normalize_key(school))
+        name = f"{shard_by}-{slug}"
+        shards.setdefault(name, (label, []))[1].append(team)
+        order.setdefault(name, rank)
+    return {name: shards[name] for name in sorted(shards, key=order.get)}
+
+
+def render_shard(path, teams_json, data_format='full', id_map=None):
+    """Write one shard page; returns its size in bytes. Runs in the pool's processes."""
+    html = render_dashboard(render_teams_script(teams_json, data_format, id_map))
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(html)
+    return os.path.getsize(path)
+
+
+def render_shard_index(entries):
+    groups = []
+    for shard_by in SHARD_KEYS:
+        rows = [entry for entry in entries if entry['shard_by'] == shard_by]
+        if not rows:
+            continue
+        items = "\n".join(
+            f'        <li><a href="{escape(entry["file"])}">{escape(entry["label"])}</a>'
+            f' <span>{entry["teams"]} equipos · {entry["players"]} jugadores · {entry["bytes"] // 1024} KB</span></li>'
+            for entry in rows
+        )
+        title = "Por categoría" if shard_by == 'category' else "Por escuela"
+        groups.append(f"    <h2>{title}</h2>\n    <ul>\n{items}\n    </ul>")
+    body = "\n".join(groups)
+    return f"""<!DOCTYPE html>
+<html lang="es">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>🏀 Buzzer Beater — Divisiones</title>
+    <style>
+        body {{ background: #0f172a; color: #f1f5f9; font-family: Inter, system-ui, sans-serif; margin: 0 auto; max-width: 720px; padding: 24px; }}
+        h1 {{ color: #f97316; font-size: 1.5rem; }}
+        h2 {{ color: #94a3b8; font-size: 1rem; margin-top: 24px; text-transform: uppercase; }}
+        ul {{ list-style: none; padding: 0; }}
+        li {{ background: #1e293b; border-radius: 14px; margin: 8px 0; padding: 12px 16px; }}
+        a {{ color: #f1f5f9; font-weight: 600; text-decoration: none; }}
+        span {{ color: #94a3b8; display: block; font-size: 0.85rem; }}
+    </style>
+</head>
+<body>
+    <h1>🏀 Buzzer Beater</h1>
+{body}
+</body>
+</html>
+"""
+
+
+def write_shards(out_dir, teams_json, shard_keys, data_format='full', id_map=None, workers=None):
+    """Write one self-contained dashboard per shard plus ``index.html`` linking them.
+
+    Pages are rendered on ``workers`` processes (default: one per core). Each gets only
+    the id-migration entries for its own players. Returns the written paths.
+    """
+    os.makedirs(out_dir, exist_ok=True)
+    entries, jobs = [], []
+    for shard_by in shard_keys:
+        for name, (label, teams) in shard_teams(teams_json, shard_by).items():
+            record_ids = {player['record_id'] for team in teams for player in team['players']}
+            shard_map = None if id_map is None else {
+                old: new for old, new in id_map.items() if new in record_ids
+            }
+            entries.append({
+                'shard_by': shard_by, 'label': label, 'file': f"{name}.html",
+                'teams': len(teams), 'players': len(record_ids),
+            })
+            jobs.append((os.path.join(out_dir, f"{name}.html"), teams, shard_map))
+
+    paths = [path for path, _, _ in jobs]
+    from concurrent.futures import ProcessPoolExecutor
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        sizes = pool.map(render_shard, paths, [teams for _, teams, _ in jobs],
+                         repeat(data_format), [shard_map for _, _, shard_map in jobs])
+        for entry, size in zip(entries, sizes):
+            entry['bytes'] = size
+
+    index_path = os.path.join(out_dir, 'index.html')
+    with open(index_path, "w", encoding="utf-8") as f:
+        f.write(render_shard_index(entries))
+    return paths + [index_path]
+
+
+# 16. School category diagnostics: expected vs registered division codes, computed once per build
+UNKNOWN_SCHOOL = "Unknown School"
+# The school master list (--schools): every school with its id, and the teams it has
+MASTER_COLUMNS = [SCHOOL_ID_COL, SCHOOL_COL]
+
+
+def build_eligibility_rules():
+    """``buildEligibilityRulesByCategory_``: ``{school key: (school, expected codes)}``."""
+    rules = {}
+    for school, raw_codes in school_category_rules.SCHOOL_CATEGORY_RAW_CODES.items():
+        codes = {str(code or "").strip().upper() for code in raw_codes}
+        rules[normalize_key(school)] = (school, sorted(codes & CATEGORY_CODE_METADATA.keys()))
+    return rules
+
+
+def read_school_master(path):
+    """The school master list in one pass: ``{school id: {'school': name, 'teams': {team
+    key: team name}}}``, a team's key being its id, or its name when it has no id.
+    """
+    schema = detect_schema(path)
+    require_columns(schema, MASTER_COLUMNS, "School list")
+    id_idx, name_idx = schema.columns[SCHOOL_ID_COL], schema.columns[SCHOOL_COL]
+    team_id_idx = schema.columns.get(TEAM_ID_COL)
+    team_idx = schema.columns.get('x_studio_teams/x_name')
+    with open(path, newline="", encoding="utf-8-sig") as f:
+        reader = csv.reader(f, delimiter=schema.delimiter)
+        next(reader, None)
+        schools = {}
+        school = None
+        for row in reader:
+            row += [""] * (len(schema.header) - len(row))
+            if row[id_idx]:
+                school = schools.setdefault(row[id_idx], {'school': row[name_idx], 'teams': {}})
+            if school is None:
+                continue
+            team_id = row[team_id_idx] if team_id_idx is not None else ""
+            team = row[team_idx] if team_idx is not None else ""
+            if team_id or team:
+                school['teams'].setdefault(team_id or team, team or team_id)
+    return schools
+
+
+def school_category_diagnostics(teams_json, rules=None, master=None):
+    """Expected, registered, missing and unexpected division codes for every school that has
+    a rule, a team or a ``master`` entry (:func:`read_school_master`), with its team and
+    player counts; schools missing the most codes first, then schools without a rule.
+
+    Teams are hash-joined onto the master list by school id (by school name for teams
+    without one) and then by team id or name; listed teams that have no players in the
+    export are the school's ``empty_teams``.
+    """
+    rules = build_eligibility_rules() if rules is None else rules
+    master = master or {}
+    master_keys = {school_id: normalize_key(school['school']) for school_id, school in master.items()}
+    actual, names, team_counts, players, registered = {}, {}, {}, {}, {}
+    for team in teams_json:
+        school = plain_value(team['school'])
+        key = master_keys.get(team.get('school_id')) or normalize_key(school)
+        if not key:
+            continue
+        names.setdefault(key, school)
+        codes = actual.setdefault(key, set())
+        code = category_code(team)
+        if code:
+            codes.add(code)
+        team_counts[key] = team_counts.get(key, 0) + 1
+        players[key] = players.get(key, 0) + len(team['players'])
+        registered.setdefault(key, set()).update([plain_value(team.get('team_id')), normalize_key(team['team'])])
+
+    empty_teams = {}
+    for school_id, school in master.items():
+        key = master_keys[school_id]
+        names[key] = school['school']
+        seen = registered.get(key, set())
+        empty_teams[key] = [
+            name for listed_key, name in school['teams'].items()
+            if listed_key not in seen and normalize_key(name) not in seen
+        ]
+
+    rows = []
+    for key in rules.keys() | actual.keys() | empty_teams.keys():
+        school, expected = rules.get(key, (None, []))
+        present = actual.get(key, set())
+        empty = empty_teams.get(key, [])
+        rows.append({
+            'school': school or names.get(key) or UNKNOWN_SCHOOL,
+            'has_rule': key in rules,
+            'expected': expected,
+            'actual': sorted(present),
+            'missing': [code for code in expected if code not in present],
+            'extra': sorted(present - set(expected)),
+            'teams': team_counts.get(key, 0) + len(empty),
+            'players': players.get(key, 0),
+            'empty_teams': empty,
+        })
+    rows.sort(key=lambda row: (-len(row['missing']), not row['has_rule'], normalize_key(row['school'])))
+    return rows
+
+
+def render_diagnostics_script(diagnostics):
+    """``null`` when the page was built without diagnostics (shards)."""
+    return f"const SCHOOL_CATEGORY_DIAGNOSTICS = {script_json(diagnostics, separators=(',', ':'))};"
+
+
+# 17. Age eligibility: each player's age on the cutoff date against their category's limits
+def default_age_cutoff():
+    """January 1 of the current year; categories are defined by birth year."""
+    return datetime.date(datetime.date.today().year, 1, 1).isoformat()
+
+
+def load_age_rules(path):
+    """``{category key: (category, min_age, max_age)}`` from a JSON file of per-category
+    limits (see --age-rules); a missing bound is None."""
+    with open(path, encoding="utf-8") as f:
+        limits = json.load(f)
+    return {
+        normalize_key(category): (category, bounds.get('min_age'), bounds.get('max_age'))
+        for category, bounds in limits.items()
+    }
+
+
+def parse_dobs(dobs):
+    """ISO date strings as a ``datetime64[D]`` array; anything else becomes NaT.
+
+    Only full YYYY-MM-DD values reach NumPy, which would otherwise also read '2010' or
+    '2010-05' as dates.
+    """
+    import numpy as np
+
+    # Year 0 is a NumPy date but not a datetime.date one
+    values = [
+        dob if isinstance(dob, str) and ISO_DATE_RE.fullmatch(dob) and not dob.startswith('0000') else 'NaT'
+        for dob in dobs
+    ]
+    try:
+        return np.array(values, dtype='datetime64[D]')
+    except ValueError:
+        # Some value is not a real calendar date (2010-02-30); only then go one by one
+        parsed = []
+        for value in values:
+            try:
+                parsed.append(np.datetime64(value, 'D'))
+            except ValueError:
+                parsed.append(np.datetime64('NaT'))
+        return np.array(parsed, dtype='datetime64[D]')
+
+
+def ages_on(dobs, cutoff):
+    """Whole years between each ``datetime64[D]`` birth date and ``cutoff``; -1 for NaT."""
+    import numpy as np
+
+    cutoff = np.datetime64(cutoff, 'D')
+    years = dobs.astype('datetime64[Y]').astype(np.int64)
+    months = dobs.astype('datetime64[M]')
+    month_of_year = months.astype(np.int64) - years * 12
+    day = (dobs - months.astype('datetime64[D]')).astype(np.int64)
+    cutoff_year = cutoff.astype('datetime64[Y]').astype(np.int64)
+    cutoff_month = cutoff.astype('datetime64[M]')
+    cutoff_month_of_year = cutoff_month.astype(np.int64) - cutoff_year * 12
+    cutoff_day = (cutoff - cutoff_month.astype('datetime64[D]')).astype(np.int64)
+    before_birthday = (month_of_year > cutoff_month_of_year) | (
+        (month_of_year == cutoff_month_of_year) & (day > cutoff_day)
+    )
+    ages = cutoff_year - years - before_birthday
+    return np.where(np.isnat(dobs), -1, ages)
+
+
+AGE_OK, AGE_OVER, AGE_UNDER, AGE_NO_DOB, AGE_NO_RULE = range(5)
+
+
+def apply_age_eligibility(teams_json, cutoff, rules, vectorized=False):
+    """Add ``eligible`` (True/False, None when it cannot be decided) and
+    ``eligibility_reason`` to every player, in place. Returns the count per outcome.
+
+    ``vectorized`` computes ages and limit checks on NumPy arrays (for the pandas engines,
+    which load NumPy anyway); otherwise they run on ``datetime.date`` with the same
+    results. Either way the reason strings are built once per distinct (outcome, age, rule).
+    """
+    team_rules = [rules.get(normalize_key(plain_value(team['category']))) for team in teams_json]
+    players = [player for team in teams_json for player in team['players']]
+    player_rules = [rule for rule, team in zip(team_rules, teams_json) for _ in team['players']]
+    dobs = [player['dob'] for player in players]
+    if vectorized:
+        outcomes, ages = _age_outcomes_vectorized(dobs, player_rules, cutoff)
+    else:
+        outcomes, ages = _age_outcomes(dobs, player_rules, cutoff)
+
+    reasons = {}
+    counts = [0] * 5
+    for player, code, age, rule in zip(players, outcomes, ages, player_rules):
+        key = (code, age, rule)
+        if key not in reasons:
+            reasons[key] = _eligibility(code, age, cutoff, rule)
+        player['eligible'], player['eligibility_reason'] = reasons[key]
+        counts[code] += 1
+    return {
+        'eligible': counts[AGE_OK],
+        'ineligible': counts[AGE_OVER] + counts[AGE_UNDER],
+        'unknown': counts[AGE_NO_DOB] + counts[AGE_NO_RULE],
+    }
+
+
+def _age_outcomes(dobs, player_rules, cutoff):
+    """Outcome code and age (-1 without a valid date) per player, with ``datetime.date``."""
+    on = datetime.date.fromisoformat(cutoff)
+    outcomes, ages = [], []
+    for dob, rule in zip(dobs, player_rules):
+        match = ISO_DATE_RE.fullmatch(dob) if isinstance(dob, str) else None
+        try:
+            born = datetime.date(*map(int, match.groups())) if match else None
+        except ValueError:
+            born = None
+        age = -1 if born is None else on.year - born.year - ((on.month, on.day) < (born.month, born.day))
+        if rule is None:
+            code = AGE_NO_RULE
+        elif age < 0:
+            code = AGE_NO_DOB
+        elif rule[2] is not None and age > rule[2]:
+            code = AGE_OVER
+        elif rule[1] is not None and age < rule[1]:
+            code = AGE_UNDER
+        else:
+            code = AGE_OK
+        outcomes.append(code)
+        ages.append(age)
+    return outcomes, ages
+
+
+def _age_outcomes_vectorized(dobs, player_rules, cutoff):
+    """:func:`_age_outcomes` on whole arrays."""
+    import numpy as np
+
+    min_age = np.array([np.nan if not rule or rule[1] is None else rule[1] for rule in player_rules], dtype=float)
+    max_age = np.array([np.nan if not rule or rule[2] is None else rule[2] for rule in player_rules], dtype=float)
+    has_rule = np.array([rule is not None for rule in player_rules], dtype=bool)
+    ages = ages_on(parse_dobs(dobs), cutoff)
+    outcome = np.select(
+        [~has_rule, ages < 0, ages > max_age, ages < min_age],
+        [AGE_NO_RULE, AGE_NO_DOB, AGE_OVER, AGE_UNDER],
+        AGE_OK,
+    )
+    return outcome.tolist(), ages.tolist()
+
+
+def _eligibility(code, age, cutoff, rule):
+    if code == AGE_NO_RULE:
+        return None, "No age rule for this category"
+    if code == AGE_NO_DOB:
+        return None, "No valid date of birth"
+    if code == AGE_OVER:
+        return False, f"Age {age} on {cutoff}; {rule[0]} allows at most {rule[2]}"
+    if code == AGE_UNDER:
+        return False, f"Age {age} on {cutoff}; {rule[0]} requires at least {rule[1]}"
+    return True, f"Age {age} on {cutoff}"
+
+
+# 18. Duplicate players: the same child registered twice, on one team or across teams/schools
+# A block holds the players sharing a birth date, one folded name word and any numbers in the
+# name. Larger blocks are too unspecific to help (a common name on a common date); their
+# players still meet in the blocks of their other name words.
+DUPLICATE_MAX_BLOCK = 64
+# How close the one differing name word of two same-day entries must be to count as a typo,
+# and how long both must be: shorter words and numbers ('Player 12' / 'Player 13') are
+# different names, not typos
+DUPLICATE_WORD_RATIO = 0.75
+DUPLICATE_MIN_TYPO_LENGTH = 4
+
+
+def _is_subsequence(short, long):
+    remaining = iter(long)
+    return all(word in remaining for word in short)
+
+
+def _same_player(a, b):
+    """Name words of two same-day entries: one name is the other minus some words (a dropped
+    middle name or initial), or the names differ in a single near-identical word (a typo)."""
+    if len(a) > len(b):
+        a, b = b, a
+    if len(a) >= 2 and _is_subsequence(a, b):
+        return True
+    if len(a) != len(b):
+        return False
+    differing = [(x, y) for x, y in zip(a, b) if x != y]
+    if len(differing) != 1:
+        return False
+    x, y = differing[0]
+    if min(len(x), len(y)) < DUPLICATE_MIN_TYPO_LENGTH or not (x.isalpha() and y.isalpha()):
+        return False
+    # Cheap upper bounds first; most non-matches stop there
+    from difflib import SequenceMatcher
+
+    matcher = SequenceMatcher(None, x, y)
+    return (
+        matcher.real_quick_ratio() >= DUPLICATE_WORD_RATIO
+        and matcher.quick_ratio() >= DUPLICATE_WORD_RATIO
+        and matcher.ratio() >= DUPLICATE_WORD_RATIO
+    )
+
+
+def find_duplicate_clusters(teams_json):
+    """Record ids of players that look like the same person, one list per cluster.
+
+    Only pairs inside a (birth date, name word) block are compared, so the work grows with
+    the number of players rather than its square. Matches are merged with union-find, so
+    three registrations of one child form one cluster.
+    """
+    words, record_ids, blocks = [], [], {}
+    for team in teams_json:
+        for player in team['players']:
+            dob = player['dob']
+            if not isinstance(dob, str) or not dob:
+                continue
+            name_words = tuple(word for word in normalize_key(player['name']).split() if len(word) > 1)
+            # Numbers are never typos, so two entries can only match if their numbers agree:
+            # they join the block key of every other word instead of forming blocks of their own
+            numbers = tuple(sorted(word for word in name_words if word.isdigit()))
+            for word in set(name_words):
+                if not word.isdigit():
+                    blocks.setdefault((dob, word, numbers), []).append(len(words))
+            words.append(name_words)
+            record_ids.append(player['record_id'])
+
+    parent = list(range(len(words)))
+
+    def find(i):
+        while parent[i] != i:
+            parent[i] = parent[parent[i]]
+            i = parent[i]
+        return i
+
+    compared = set()
+    for members in blocks.values():
+        if len(members) < 2 or len(members) > DUPLICATE_MAX_BLOCK:
+            continue
+        for pair in combinations(members, 2):
+            if pair in compared:
+                continue
+            compared.add(pair)
+            a, b = pair
+            if _same_player(words[a], words[b]):
+                parent[find(b)] = find(a)
+
+    clusters = {}
+    for i, record_id in enumerate(record_ids):
+        clusters.setdefault(find(i), []).append(record_id)
+    return [cluster for cluster in clusters.values() if len(cluster) > 1]
+
+
+def render_duplicates_script(clusters):
+    """``null`` when the page was built without duplicate detection (shards)."""
+    return f"const DUPLICATE_CLUSTERS = {script_json(clusters, separators=(',', ':'))};"
+
+
+# 19. Roster integrity: jersey conflicts, roster size and missing documents, per team
+ROSTER_SIZE_LIMITS = (5, 15)
+MISSING_JERSEY = '—'
+# Player flag -> the player field that must not be empty
+ROSTER_DOCUMENT_FLAGS = {'missing_cert': 'cert_url', 'missing_waiver': 'waiver_url', 'missing_photo': 'photo'}
+
+
+def apply_roster_checks(teams_json, min_players=ROSTER_SIZE_LIMITS[0], max_players=ROSTER_SIZE_LIMITS[1]):
+    """Add ``roster_flags`` to every team and player and ``roster_summary`` to every team,
+    in place, in one pass per team. Returns how many teams and players were flagged.
+
+    Flags are space-separated words ('' when clean) so every data format can embed them:
+    players get duplicate_jersey, missing_jersey and the ROSTER_DOCUMENT_FLAGS; teams get
+    the union of their players' flags plus too_few_players / too_many_players.
+    """
+    flagged_teams = flagged_players = 0
+    for team in teams_json:
+        players = team['players']
+        jerseys = {}
+        for player in players:
+            jerseys[player['jersey']] = jerseys.get(player['jersey'], 0) + 1
+        counts = dict.fromkeys(['duplicate_jersey', 'missing_jersey', *ROSTER_DOCUMENT_FLAGS], 0)
+        for player in players:
+            flags = []
+            if player['jersey'] == MISSING_JERSEY:
+                flags.append('missing_jersey')
+            elif jerseys[player['jersey']] > 1:
+                flags.append('duplicate_jersey')
+            flags += [flag for flag, field in ROSTER_DOCUMENT_FLAGS.items() if not player.get(field)]
+            for flag in flags:
+                counts[flag] += 1
+            player['roster_flags'] = " ".join(flags)
+            flagged_players += bool(flags)
+
+        size = len(players)
+        team_flags = [flag for flag, count in counts.items() if count]
+        summary = []
+        if size < min_players:
+            team_flags.append('too_few_players')
+            summary.append(f"{size} players (min {min_players})")
+        elif size > max_players:
+            team_flags.append('too_many_players')
+            summary.append(f"{size} players (max {max_players})")
+        shared = sorted((jersey for jersey, count in jerseys.items() if count > 1 and jersey != MISSING_JERSEY), key=_jersey_order)
+        if shared:
+            summary.append("Jersey " + ", ".join(f"#{jersey} ×{jerseys[jersey]}" for jersey in shared))
+        if counts['missing_jersey']:
+            summary.append(f"{counts['missing_jersey']} without jersey")
+        for flag in ROSTER_DOCUMENT_FLAGS:
+            if counts[flag]:
+                summary.append(f"{counts[flag]} {flag.replace('_', ' ')}")
+        team['roster_flags'] = " ".join(team_flags)
+        team['roster_summary'] = "; ".join(summary)
+        flagged_teams += bool(team_flags)
+    return {'teams': flagged_teams, 'players': flagged_players}
+
+
+def _jersey_order(jersey):
+    return (0, int(jersey), '') if jersey.isdigit() else (1, 0, jersey)
+
+
+def render_dashboard(teams_script):
+    return f"""<!DOCTYPE html>
+<html lang="es">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>🏀 Buzzer Beater — Tournament Dashboard</title>
+    <link href="https://cdn.jsdelivr.net/npm/bootstrap@5.3.0/dist/css/bootstrap.min.css" rel="stylesheet">
+    <link rel="preconnect" href="https://fonts.googleapis.com">
+    <link href="https://fonts.googleapis.com/css2?family=Inter:wght@300;400;500;600;700;800&display=swap" rel="stylesheet">
+    <style>
+        :root {{
+            --primary: #f97316;
+            --primary-dark: #ea580c;
+            --primary-light: #fed7aa;
+            --secondary: #1e293b;
+            --accent: #0ea5e9;
+            --accent2: #8b5cf6;
+            --bg: #0f172a;
+            --surface: #1e293b;
+            --surface2: #334155;
+            --border: #334155;
+            --text: #f1f5f9;
+            --text-muted: #94a3b8;
+            --male: #38bdf8;
+            --female: #f472b6;
+            --success: #22c55e;
+            --radius: 14px;
+        }}
+
+        * {{ box-sizing: border-box; margin: 0; padding: 0; }}
+
+        body {{
+            background: var(--bg);
+            color: var(--text);
+            font-family: 'Inter', sans-serif;
+            min-height: 100vh;
+            overflow-x: hidden;
+        }}
+
+        /* Background grid */
+        body::before {{
+            content: '';
+            position: fixed;
+            inset: 0;
+            background-image:
+                linear-gradient(rgba(249,115,22,0.03) 1px, transparent 1px),
+                linear-gradient(90deg, rgba(249,115,22,0.03) 1px, transparent 1px);
+            background-size: 40px 40px;
+            pointer-events: none;
+            z-index: 0;
+        }}
+
+        /* ── HEADER ── */
+        .hero {{
+            position: relative;
+            z-index: 1;
+            background: linear-gradient(135deg, #0f172a 0%, #1e293b 50%, #0c1a2e 100%);
+            border-bottom: 1px solid var(--border);
+            padding: 28px 40px;
+            display: flex;
+            align-items: center;
+            justify-content: space-between;
+            flex-wrap: wrap;
+            gap: 16px;
+        }}
+        .hero::after {{
+            content: '';
+            position: absolute;
+            bottom: -1px;
+            left: 0;
+            right: 0;
+            height: 2px;
+            background: linear-gradient(90deg, transparent, var(--primary), var(--accent), transparent);
+        }}
+        .hero-brand {{
+            display: flex;
+            align-items: center;
+            gap: 16px;
+        }}
+        .hero-icon {{
+            width: 56px; height: 56px;
+            background: linear-gradient(135deg, var(--primary), var(--primary-dark));
+            border-radius: 14px;
+            display: flex; align-items: center; justify-content: center;
+            font-size: 28px;
+            box-shadow: 0 8px 24px rgba(249,115,22,0.35);
+        }}
+        .hero-title {{ font-size: 1.8rem; font-weight: 800; line-height: 1.1; }}
+        .hero-title span {{ color: var(--primary); }}
+        .hero-sub {{ color: var(--text-muted); font-size: 0.85rem; margin-top: 2px; }}
+
+        .hero-stats {{
+            display: flex; gap: 24px; flex-wrap: wrap;
+        }}
+        .stat-pill {{
+            background: rgba(255,255,255,0.05);
+            border: 1px solid var(--border);
+            border-radius: 999px;
+            padding: 8px 18px;
+            display: flex; align-items: center; gap: 8px;
+            font-size: 0.85rem; font-weight: 500;
+        }}
+        .stat-pill .num {{ font-weight: 700; font-size: 1.1rem; color: var(--primary); }}
+
+        /* ── TABS ── */
+        .main-tabs {{
+            position: relative; z-index: 1;
+            display: flex;
+            background: var(--surface);
+            border-bottom: 1px solid var(--border);
+            padding: 0 40px;
+        }}
+        .tab-btn {{
+            background: none; border: none; color: var(--text-muted);
+            padding: 16px 24px;
+            font-family: 'Inter', sans-serif;
+            font-size: 0.9rem; font-weight: 500;
+            cursor: pointer;
+            border-bottom: 2px solid transparent;
+            transition: all 0.2s;
+            display: flex; align-items: center; gap: 8px;
+        }}
+        .tab-btn:hover {{ color: var(--text); }}
+        .tab-btn.active {{ color: var(--primary); border-bottom-color: var(--primary); }}
+        .tab-count {{
+            background: var(--surface2); border-radius: 999px;
+            padding: 2px 8px; font-size: 0.75rem; font-weight: 600;
+        }}
+        .tab-btn.active .tab-count {{
+            background: rgba(249,115,22,0.2); color: var(--primary);
+        }}
+
+        /* ── TOOLBAR ── */
+        .toolbar {{
+            position: relative; z-index: 1;
+            padding: 20px 40px;
+            display: flex; align-items: center; gap: 12px; flex-wrap: wrap;
+        }}
+        .search-box {{
+            flex: 1; min-width: 240px; max-width: 420px;
+            position: relative;
+        }}
+        .search-box input {{
+            width: 100%;
+            background: var(--surface);
+            border: 1px solid var(--border);
+            border-radius: 10px;
+            color: var(--text);
+            padding: 10px 16px 10px 40px;
+            font-family: 'Inter', sans-serif;
+            font-size: 0.9rem;
+            outline: none;
+            transition: border-color 0.2s;
+        }}
+        .search-box input:focus {{ border-color: var(--primary); }}
+        .search-box input::placeholder {{ color: var(--text-muted); }}
+        .search-icon {{
+            position: absolute; left: 13px; top: 50%; transform: translateY(-50%);
+            font-size: 16px; pointer-events: none;
+        }}
+        .filter-btn {{
+            background: var(--surface);
+            border: 1px solid var(--border);
+            border-radius: 10px;
+            color: var(--text-muted);
+            padding: 10px 16px;
+            font-family: 'Inter', sans-serif; font-size: 0.85rem; font-weight: 500;
+            cursor: pointer; transition: all 0.2s;
+        }}
+        .filter-btn:hover, .filter-btn.active {{ border-color: var(--primary); color: var(--primary); }}
+        .filter-btn.gender-m.active {{ border-color: var(--male); color: var(--male); }}
+        .filter-btn.gender-f.active {{ border-color: var(--female); color: var(--female); }}
+
+        /* ── CONTENT ── */
+        .content-area {{
+            position: relative; z-index: 1;
+            padding: 0 40px 40px;
+        }}
+
+        .tab-panel {{ display: none; }}
+        .tab-panel.active {{ display: block; }}
+
+        /* ── TEAM CARDS GRID ── */
+        .teams-grid {{
+            display: grid;
+            grid-template-columns: repeat(auto-fill, minmax(360px, 1fr));
+            gap: 24px;
+            padding-top: 8px;
+        }}
+
+        .team-card {{
+            background: var(--surface);
+            border: 1px solid var(--border);
+            border-radius: var(--radius);
+            overflow: hidden;
+            transition: transform 0.2s, box-shadow 0.2s, border-color 0.2s;
+        }}
+        .team-card:hover {{
+            transform: translateY(-3px);
+            box-shadow: 0 16px 40px rgba(0,0,0,0.4);
+            border-color: var(--primary);
+        }}
+
+        .team-header {{
+            padding: 18px 20px 14px;
+            display: flex; justify-content: space-between; align-items: flex-start;
+            background: linear-gradient(135deg, rgba(249,115,22,0.08), rgba(14,165,233,0.04));
+            border-bottom: 1px solid var(--border);
+        }}
+        .team-name-block {{ flex: 1; }}
+        .team-name {{
+            font-size: 1rem; font-weight: 700; line-height: 1.2;
+            margin-bottom: 4px;
+        }}
+        .team-meta {{ display: flex; gap: 6px; flex-wrap: wrap; margin-top: 6px; }}
+
+        .badge-pill {{
+            padding: 3px 10px; border-radius: 999px; font-size: 0.72rem; font-weight: 600;
+        }}
+        .badge-cat-Publica   {{ background: rgba(34,197,94,0.15); color: #4ade80; }}
+        .badge-cat-Senior    {{ background: rgba(249,115,22,0.15); color: var(--primary); }}
+        .badge-cat-Junior    {{ background: rgba(139,92,246,0.15); color: #a78bfa; }}
+        .badge-cat-Juvenil   {{ background: rgba(14,165,233,0.15); color: var(--accent); }}
+        .badge-cat-Mini      {{ background: rgba(244,114,182,0.15); color: #f472b6; }}
+        .badge-cat-default   {{ background: rgba(100,116,139,0.15); color: var(--text-muted); }}
+
+        .badge-gender {{
+            padding: 3px 10px; border-radius: 999px; font-size: 0.72rem; font-weight: 700;
+        }}
+        .badge-m {{ background: rgba(56,189,248,0.15); color: var(--male); }}
+        .badge-f {{ background: rgba(244,114,182,0.15); color: var(--female); }}
+
+        .player-count {{
+            background: var(--surface2); border-radius: 10px;
+            padding: 6px 12px; text-align: center;
+            font-size: 0.75rem; color: var(--text-muted); min-width: 52px;
+        }}
+        .player-count .num {{ font-size: 1.3rem; font-weight: 800; color: var(--text); display: block; }}
+
+        /* ── PHOTO GRID ── */
+        .players-photo-grid {{
+            display: grid;
+            grid-template-columns: repeat(auto-fill, minmax(80px, 1fr));
+            gap: 8px;
+            padding: 16px;
+        }}
+
+        .player-tile {{
+            position: relative;
+            cursor: pointer;
+        }}
+        .player-tile img, .player-tile .no-photo {{
+            width: 100%;
+            aspect-ratio: 3/4;
+            object-fit: cover;
+            border-radius: 10px;
+            border: 2px solid transparent;
+            transition: border-color 0.2s, transform 0.2s;
+            display: block;
+        }}
+        .no-photo {{
+            background: var(--surface2);
+            display: flex; align-items: center; justify-content: center;
+            font-size: 24px;
+            border: 2px solid var(--border);
+            border-radius: 10px;
+            aspect-ratio: 3/4;
+        }}
+        .player-tile:hover img, .player-tile:hover .no-photo {{
+            border-color: var(--primary);
+            transform: scale(1.04);
+        }}
+        .jersey-num {{
+            position: absolute; top: 4px; left: 4px;
+            background: rgba(15,23,42,0.85);
+            color: var(--text);
+            font-size: 0.65rem; font-weight: 800;
+            padding: 2px 5px; border-radius: 5px;
+            backdrop-filter: blur(4px);
+        }}
+        .player-review-flag {{
+            position: absolute; bottom: 4px; right: 4px;
+            font-size: 0.62rem; font-weight: 700;
+            border-radius: 999px; padding: 2px 6px;
+            border: 1px solid transparent;
+            background: rgba(15,23,42,0.85);
+            color: var(--text-muted);
+        }}
+        .player-review-flag.review {{
+            background: rgba(249,115,22,0.18);
+            color: var(--primary);
+            border-color: rgba(249,115,22,0.4);
+        }}
+        .player-review-flag.correct-review {{
+            background: rgba(34,197,94,0.18);
+            color: #86efac;
+            border-color: rgba(34,197,94,0.4);
+        }}
+        .player-alert-flags {{
+            position: absolute; top: 4px; right: 4px;
+            display: flex; gap: 3px;
+        }}
+        .player-alert-flag {{
+            font-size: 0.62rem; font-weight: 700;
+            border-radius: 999px; padding: 2px 6px;
+            background: rgba(251,113,133,0.2);
+            color: #fb7185;
+            border: 1px solid rgba(251,113,133,0.45);
+        }}
+        .player-alert-flag.jersey {{
+            background: rgba(250,204,21,0.16);
+            color: #facc15;
+            border-color: rgba(250,204,21,0.4);
+        }}
+        .roster-issues {{
+            margin-top: 6px;
+            font-size: 0.72rem;
+            color: #facc15;
+        }}
+        .player-alert-flag.duplicate {{
+            background: rgba(139,92,246,0.22);
+            color: #c4b5fd;
+            border-color: rgba(139,92,246,0.5);
+        }}
+
+        /* ── DOB HOVER TOOLTIP ── */
+        .player-tile .dob-tooltip {{
+            position: absolute;
+            bottom: calc(100% + 8px);
+            left: 50%;
+            transform: translateX(-50%);
+            background: rgba(15,23,42,0.97);
+            border: 1px solid var(--primary);
+            border-radius: 10px;
+            padding: 10px 14px;
+            min-width: 170px;
+            pointer-events: none;
+            opacity: 0;
+            transition: opacity 0.18s;
+            z-index: 1000;
+            backdrop-filter: blur(12px);
+            box-shadow: 0 8px 32px rgba(0,0,0,0.5), 0 0 0 1px rgba(249,115,22,0.2);
+            text-align: center;
+        }}
+        .player-tile:hover .dob-tooltip {{ opacity: 1; }}
+        .player-tile .dob-tooltip::after {{
+            content: '';
+            position: absolute;
+            top: 100%;
+            left: 50%;
+            transform: translateX(-50%);
+            border: 6px solid transparent;
+            border-top-color: var(--primary);
+        }}
+        .tooltip-name {{ font-size: 0.78rem; font-weight: 600; color: var(--text); margin-bottom: 6px; }}
+        .tooltip-label {{ font-size: 0.65rem; color: var(--text-muted); text-transform: uppercase; letter-spacing: 0.06em; margin-bottom: 2px; }}
+        .tooltip-dob {{ font-size: 0.88rem; font-weight: 700; color: var(--primary); }}
+        .tooltip-jersey {{ font-size: 0.7rem; color: var(--text-muted); margin-top: 4px; }}
+        .tooltip-grade {{ font-size: 0.7rem; color: var(--accent); margin-top: 2px; }}
+        .tooltip-docs {{ margin-top: 8px; display: flex; gap: 6px; justify-content: center; flex-wrap: wrap; }}
+        .tooltip-link {{
+            font-size: 0.7rem; font-weight: 600;
+            padding: 3px 8px; border-radius: 6px;
+            text-decoration: none;
+            background: rgba(249,115,22,0.12);
+            color: var(--primary);
+            border: 1px solid rgba(249,115,22,0.25);
+            pointer-events: all;
+            transition: background 0.15s;
+        }}
+        .tooltip-link:hover {{ background: rgba(249,115,22,0.25); }}
+        .tooltip-link.waiver {{
+            background: rgba(14,165,233,0.12);
+            color: var(--accent);
+            border-color: rgba(14,165,233,0.25);
+        }}
+        .tooltip-link.waiver:hover {{ background: rgba(14,165,233,0.25); }}
+
+        /* ── TABLE VIEW ── */
+        .table-wrapper {{
+            background: var(--surface);
+            border: 1px solid var(--border);
+            border-radius: var(--radius);
+            overflow: hidden;
+            margin-top: 8px;
+        }}
+        .table {{ color: var(--text) !important; margin: 0 !important; }}
+        .table thead th {{
+            background: linear-gradient(135deg, rgba(249,115,22,0.1), rgba(14,165,233,0.05)) !important;
+            color: var(--text-muted) !important;
+            border-bottom: 1px solid var(--border) !important;
+            font-size: 0.75rem; font-weight: 700; text-transform: uppercase; letter-spacing: 0.06em;
+            padding: 14px 12px !important;
+            white-space: nowrap;
+        }}
+        .table tbody tr {{
+            border-bottom: 1px solid rgba(51,65,85,0.5) !important;
+            transition: background 0.15s;
+        }}
+        .table tbody tr:hover {{ background: rgba(249,115,22,0.04) !important; }}
+        .table tbody td {{
+            padding: 10px 12px !important;
+            border: none !important;
+            vertical-align: middle;
+            color: var(--text) !important;
+        }}
+        .mini-photo {{
+            width: 38px; height: 48px;
+            object-fit: cover;
+            border-radius: 7px;
+            border: 2px solid var(--border);
+        }}
+        .no-photo-mini {{
+            width: 38px; height: 48px;
+            background: var(--surface2);
+            border-radius: 7px;
+            display: flex; align-items: center; justify-content: center;
+            font-size: 16px;
+            border: 2px solid var(--border);
+        }}
+        .player-name {{ font-weight: 600; font-size: 0.9rem; }}
+        .jersey-badge {{
+            display: inline-block;
+            background: rgba(249,115,22,0.12); color: var(--primary);
+            border-radius: 5px; padding: 1px 6px;
+            font-size: 0.72rem; font-weight: 700;
+            margin-left: 6px;
+        }}
+        .dob-badge {{
+            font-family: monospace; font-size: 0.85rem; font-weight: 600;
+            color: var(--accent);
+        }}
+        .gender-tag {{
+            display: inline-flex; align-items: center; justify-content: center;
+            width: 20px; height: 20px; border-radius: 999px;
+            font-size: 0.65rem; font-weight: 800;
+        }}
+        .male-tag {{ background: rgba(56,189,248,0.2); color: var(--male); }}
+        .female-tag {{ background: rgba(244,114,182,0.2); color: var(--female); }}
+        .category-tag {{
+            padding: 2px 8px; border-radius: 6px;
+            font-size: 0.72rem; font-weight: 600;
+            background: var(--surface2); color: var(--text-muted);
+        }}
+
+        /* DataTables overrides */
+        .dataTables_wrapper .dataTables_length select,
+        .dataTables_wrapper .dataTables_filter input {{
+            background: var(--surface2) !important;
+            border: 1px solid var(--border) !important;
+            color: var(--text) !important;
+            border-radius: 8px !important;
+            padding: 6px 12px !important;
+            font-family: 'Inter', sans-serif;
+        }}
+        .dataTables_wrapper .dataTables_length label,
+        .dataTables_wrapper .dataTables_filter label,
+        .dataTables_wrapper .dataTables_info {{
+            color: var(--text-muted) !important;
+            font-size: 0.85rem;
+        }}
+        .dataTables_wrapper .dataTables_paginate .paginate_button {{
+            color: var(--text-muted) !important;
+            border-radius: 8px !important;
+        }}
+        .dataTables_wrapper .dataTables_paginate .paginate_button.current {{
+            background: var(--primary) !important;
+            border-color: var(--primary) !important;
+            color: white !important;
+        }}
+        .dataTables_wrapper .dataTables_paginate .paginate_button:hover {{
+            background: var(--surface2) !important;
+            border-color: var(--border) !important;
+            color: var(--text) !important;
+        }}
+        .btn-outline-primary {{
+            border-color: var(--primary) !important;
+            color: var(--primary) !important;
+            font-size: 0.72rem !important;
+            padding: 3px 8px !important;
+        }}
+        .btn-outline-primary:hover {{
+            background: var(--primary) !important;
+            color: white !important;
+        }}
+        .doc-cell {{ white-space: nowrap; }}
+        .school-cell {{ font-size: 0.82rem; color: var(--text-muted); }}
+        .team-cell {{ font-size: 0.8rem; }}
+
+        /* ── REVIEW BOARD ── */
+        .review-toolbar {{
+            margin: 8px 0 12px;
+            display: flex;
+            flex-wrap: wrap;
+            gap: 10px;
+            align-items: center;
+        }}
+        .review-search {{
+            min-width: 260px;
+            max-width: 540px;
+            flex: 1 1 340px;
+        }}
+        .review-summary {{
+            display: flex;
+            flex-wrap: wrap;
+            gap: 10px;
+            margin-bottom: 12px;
+        }}
+        .review-pill {{
+            background: rgba(255,255,255,0.05);
+            border: 1px solid var(--border);
+            border-radius: 999px;
+            padding: 6px 12px;
+            font-size: 0.78rem;
+            color: var(--text-muted);
+        }}
+        .review-pill strong {{
+            color: var(--text);
+            margin-left: 6px;
+        }}
+        .review-table tbody td {{
+            font-size: 0.82rem;
+            vertical-align: top;
+        }}
+        .review-note-cell {{
+            max-width: 320px;
+            white-space: pre-wrap;
+            line-height: 1.35;
+            color: var(--text);
+        }}
+        .review-updated-cell {{
+            white-space: nowrap;
+            font-family: monospace;
+            color: var(--text-muted);
+            font-size: 0.76rem;
+        }}
+        .audit-codes {{
+            display: flex;
+            flex-wrap: wrap;
+            gap: 6px;
+        }}
+        .audit-code {{
+            border-radius: 999px;
+            border: 1px solid var(--border);
+            padding: 2px 8px;
+            font-size: 0.71rem;
+            color: var(--text-muted);
+            background: rgba(148,163,184,0.08);
+        }}
+        .audit-code.missing {{
+            color: #facc15;
+            border-color: rgba(250,204,21,0.35);
+            background: rgba(250,204,21,0.12);
+        }}
+        .audit-code.extra {{
+            color: #fb7185;
+            border-color: rgba(251,113,133,0.4);
+            background: rgba(251,113,133,0.13);
+        }}
+        .audit-code.present {{
+            color: #86efac;
+            border-color: rgba(134,239,172,0.4);
+            background: rgba(134,239,172,0.12);
+        }}
+        .review-status-badge {{
+            display: inline-flex;
+            align-items: center;
+            border-radius: 999px;
+            padding: 2px 10px;
+            font-size: 0.72rem;
+            font-weight: 700;
+            border: 1px solid transparent;
+        }}
+        .review-status-badge.none {{
+            color: var(--text-muted);
+            border-color: var(--border);
+            background: rgba(148,163,184,0.08);
+        }}
+        .review-status-badge.review {{
+            color: var(--primary);
+            border-color: rgba(249,115,22,0.35);
+            background: rgba(249,115,22,0.15);
+        }}
+        .review-status-badge.correct-review {{
+            color: #86efac;
+            border-color: rgba(34,197,94,0.4);
+            background: rgba(34,197,94,0.16);
+        }}
+        .review-open-btn {{
+            border: 1px solid rgba(14,165,233,0.35);
+            background: rgba(14,165,233,0.14);
+            color: var(--accent);
+            border-radius: 8px;
+            padding: 4px 10px;
+            font-size: 0.74rem;
+            font-weight: 700;
+            cursor: pointer;
+        }}
+        .review-open-btn:hover {{
+            background: rgba(14,165,233,0.25);
+        }}
+
+        /* ── SCHOOL SIDEBAR ── */
+        .school-filter-list {{
+            display: flex; flex-wrap: wrap; gap: 8px; margin-bottom: 4px;
+        }}
+        .school-tag {{
+            background: var(--surface);
+            border: 1px solid var(--border);
+            border-radius: 8px;
+            padding: 6px 12px;
+            font-size: 0.8rem; font-weight: 500;
+            cursor: pointer;
+            transition: all 0.2s;
+            color: var(--text-muted);
+        }}
+        .school-tag.active {{ border-color: var(--primary); color: var(--primary); background: rgba(249,115,22,0.07); }}
+        .school-tag:hover {{ border-color: var(--primary); color: var(--text); }}
+
+        /* ── MODAL ── */
+        .player-modal-overlay {{
+            display: none;
+            position: fixed; inset: 0; z-index: 2000;
+            background: rgba(0,0,0,0.75);
+            backdrop-filter: blur(6px);
+            align-items: center; justify-content: center;
+        }}
+        .player-modal-overlay.open {{ display: flex; }}
+        .player-modal {{
+            background: var(--surface);
+            border: 1px solid var(--border);
+            border-radius: 20px;
+            width: min(760px, 96vw);
+            max-height: 96vh;
+            overflow-y: auto;
+            box-shadow: 0 32px 80px rgba(0,0,0,0.6);
+            animation: modalIn 0.25s ease;
+        }}
+        @keyframes modalIn {{
+            from {{ opacity: 0; transform: scale(0.94) translateY(10px); }}
+            to   {{ opacity: 1; transform: scale(1) translateY(0); }}
+        }}
+        .modal-photo {{
+            width: 100%;
+            max-height: min(70vh, 760px);
+            object-fit: contain;
+            background: #020617;
+            border-radius: 20px 20px 0 0;
+        }}
+        .modal-media {{
+            position: relative;
+        }}
+        .modal-photo-tags {{
+            position: absolute;
+            top: 10px;
+            left: 10px;
+            right: 52px;
+            display: flex;
+            gap: 6px;
+            flex-wrap: wrap;
+            align-items: center;
+            pointer-events: none;
+            z-index: 5;
+        }}
+        .modal-photo-tags .modal-tag-btn {{
+            pointer-events: auto;
+            background: rgba(15,23,42,0.76);
+            backdrop-filter: blur(4px);
+        }}
+        .modal-no-photo {{
+            height: min(56vh, 520px);
+            background: linear-gradient(135deg, rgba(249,115,22,0.1), rgba(14,165,233,0.05));
+            display: flex; align-items: center; justify-content: center;
+            font-size: 64px; border-radius: 20px 20px 0 0;
+        }}
+        .modal-body-inner {{ padding: 14px 16px 16px; }}
+        .modal-headline {{
+            display: flex;
+            align-items: flex-start;
+            justify-content: space-between;
+            gap: 10px;
+            margin-bottom: 10px;
+        }}
+        .modal-name {{ font-size: 1.08rem; font-weight: 800; margin-bottom: 3px; line-height: 1.15; }}
+        .modal-team {{ color: var(--text-muted); font-size: 0.76rem; }}
+        .modal-nav {{
+            display: flex;
+            align-items: center;
+            justify-content: space-between;
+            gap: 8px;
+            margin-bottom: 10px;
+        }}
+        .modal-nav-meta {{
+            font-size: 0.72rem;
+            color: var(--text-muted);
+            font-weight: 600;
+        }}
+        .modal-nav-btn {{
+            background: var(--surface2);
+            border: 1px solid var(--border);
+            color: var(--text);
+            border-radius: 8px;
+            padding: 5px 9px;
+            font-size: 0.72rem;
+            font-weight: 700;
+            cursor: pointer;
+        }}
+        .modal-nav-btn:hover {{ border-color: var(--primary); color: var(--primary); }}
+        .modal-nav-btn:disabled {{
+            opacity: 0.45;
+            cursor: not-allowed;
+            border-color: var(--border);
+            color: var(--text-muted);
+        }}
+        .modal-quick-info {{
+            display: flex;
+            flex-wrap: wrap;
+            gap: 6px;
+            margin-bottom: 10px;
+        }}
+        .modal-chip {{
+            border-radius: 999px;
+            border: 1px solid var(--border);
+            background: rgba(148,163,184,0.12);
+            color: var(--text);
+            font-size: 0.72rem;
+            font-weight: 700;
+            padding: 4px 10px;
+            line-height: 1.2;
+        }}
+        .modal-chip.dob {{
+            border-color: rgba(249,115,22,0.34);
+            background: rgba(249,115,22,0.16);
+            color: var(--primary);
+        }}
+        .modal-chip.grade {{
+            border-color: rgba(14,165,233,0.34);
+            background: rgba(14,165,233,0.16);
+            color: var(--accent);
+        }}
+        .modal-chip.age-ok {{
+            border-color: rgba(34,197,94,0.4);
+            background: rgba(34,197,94,0.16);
+            color: #86efac;
+        }}
+        .modal-chip.age-out {{
+            border-color: rgba(251,113,133,0.45);
+            background: rgba(251,113,133,0.16);
+            color: #fb7185;
+        }}
+        .modal-chip.duplicate {{
+            border-color: rgba(139,92,246,0.5);
+            background: rgba(139,92,246,0.18);
+            color: #c4b5fd;
+        }}
+        .modal-chip.status-review {{
+            border-color: rgba(249,115,22,0.35);
+            background: rgba(249,115,22,0.16);
+            color: var(--primary);
+        }}
+        .modal-chip.status-correct-review {{
+            border-color: rgba(34,197,94,0.4);
+            background: rgba(34,197,94,0.16);
+            color: #86efac;
+        }}
+        .modal-docs {{
+            display: flex;
+            gap: 8px;
+            flex-wrap: wrap;
+            margin-bottom: 10px;
+        }}
+        .modal-doc-btn {{
+            text-align: center;
+            background: rgba(249,115,22,0.12);
+            border: 1px solid rgba(249,115,22,0.25);
+            color: var(--primary); border-radius: 10px;
+            padding: 7px 10px; text-decoration: none;
+            font-weight: 700; font-size: 0.74rem;
+            transition: background 0.15s;
+        }}
+        .modal-doc-btn:hover {{ background: rgba(249,115,22,0.22); color: var(--primary); }}
+        .modal-doc-btn.waiver {{
+            background: rgba(14,165,233,0.12);
+            border-color: rgba(14,165,233,0.25);
+            color: var(--accent);
+        }}
+        .modal-doc-btn.waiver:hover {{ background: rgba(14,165,233,0.22); }}
+        .modal-review-box {{
+            border: 1px solid var(--border);
+            border-radius: 12px;
+            background: rgba(148,163,184,0.06);
+            padding: 10px;
+        }}
+        .modal-review-title {{
+            font-size: 0.66rem;
+            text-transform: uppercase;
+            letter-spacing: 0.07em;
+            color: var(--text-muted);
+            margin-bottom: 7px;
+        }}
+        .modal-tag-btn {{
+            background: var(--surface2);
+            border: 1px solid var(--border);
+            color: var(--text);
+            border-radius: 999px;
+            padding: 5px 10px;
+            font-size: 0.72rem;
+            font-weight: 700;
+            cursor: pointer;
+            line-height: 1.2;
+        }}
+        .modal-tag-btn:hover {{
+            border-color: var(--primary);
+            color: var(--primary);
+        }}
+        .modal-tag-btn.active {{
+            border-color: var(--text-muted);
+            color: var(--text);
+            background: rgba(148,163,184,0.16);
+        }}
+        .modal-tag-btn.active.review {{
+            border-color: rgba(249,115,22,0.4);
+            background: rgba(249,115,22,0.18);
+            color: var(--primary);
+        }}
+        .modal-tag-btn.active.correct-review {{
+            border-color: rgba(34,197,94,0.44);
+            background: rgba(34,197,94,0.2);
+            color: #86efac;
+        }}
+        .modal-review-row-wrap.hidden {{
+            display: none;
+        }}
+        .modal-review-row {{
+            display: grid;
+            grid-template-columns: 1fr auto;
+            gap: 8px;
+            align-items: end;
+        }}
+        .modal-review-note {{
+            width: 100%;
+            min-height: 56px;
+            resize: vertical;
+            background: var(--surface2);
+            border: 1px solid var(--border);
+            border-radius: 8px;
+            color: var(--text);
+            padding: 8px 10px;
+            font-size: 0.76rem;
+            line-height: 1.3;
+            font-family: inherit;
+        }}
+        .modal-review-save {{
+            background: rgba(34,197,94,0.16);
+            border: 1px solid rgba(34,197,94,0.38);
+            color: #86efac;
+            border-radius: 8px;
+            height: 36px;
+            padding: 0 12px;
+            font-size: 0.74rem;
+            font-weight: 700;
+            cursor: pointer;
+        }}
+        .modal-review-save:hover {{
+            background: rgba(34,197,94,0.25);
+        }}
+        .modal-review-meta {{
+            margin-top: 6px;
+            font-size: 0.7rem;
+            color: var(--text-muted);
+        }}
+        .modal-close {{
+            position: absolute; top: 16px; right: 16px;
+            width: 32px; height: 32px;
+            background: rgba(0,0,0,0.5); border: none; border-radius: 50%;
+            color: white; font-size: 18px; cursor: pointer;
+            display: flex; align-items: center; justify-content: center;
+            transition: background 0.15s;
+        }}
+        .modal-close:hover {{ background: rgba(249,115,22,0.5); }}
+        .modal-inner-wrap {{ position: relative; }}
+
+        /* ── EMPTY STATE ── */
+        .empty-state {{
+            text-align: center; padding: 60px 20px; color: var(--text-muted);
+        }}
+        .empty-state .icon {{ font-size: 48px; margin-bottom: 12px; }}
+
+        /* ── RESPONSIVE ── */
+        @media (max-width: 700px) {{
+            .hero {{ padding: 20px; }}
+            .content-area, .toolbar, .main-tabs {{ padding-left: 16px; padding-right: 16px; }}
+            .teams-grid {{ grid-template-columns: 1fr; }}
+            .modal-review-row {{ grid-template-columns: 1fr; }}
+            .modal-review-save {{ width: 100%; }}
+        }}
+    </style>
+</head>
+<body>
+
+<!-- ══ HEADER ══ -->
+<div class="hero">
+    <div class="hero-brand">
+        <div class="hero-icon">🏀</div>
+        <div>
+            <div class="hero-title">Buzzer Beater <span>Tournament</span></div>
+            <div class="hero-sub">Player Eligibility &amp; Documents Dashboard</div>
+        </div>
+    </div>
+    <div class="hero-stats" id="heroStats"></div>
+</div>
+
+<!-- ══ TABS ══ -->
+<div class="main-tabs">
+    <button class="tab-btn active" onclick="switchTab('teams', this)">
+        🏟️ Teams &amp; Players
+        <span class="tab-count" id="teamsCount">—</span>
+    </button>
+    <button class="tab-btn" onclick="switchTab('review', this)">
+        📝 Review Board
+        <span class="tab-count" id="reviewCount">—</span>
+    </button>
+</div>
+
+<!-- ══ TEAMS FILTERS ══ -->
+<div id="teamsFilters">
+    <div class="toolbar">
+        <div class="search-box">
+            <span class="search-icon">🔍</span>
+            <input type="text" id="mainSearch" placeholder="Search player, school, team…" oninput="applyFilters()">
+        </div>
+        <button class="filter-btn gender-m" id="filterM" onclick="toggleGender('Masculino')">♂ Masculino</button>
+        <button class="filter-btn gender-f" id="filterF" onclick="toggleGender('Femenino')">♀ Femenino</button>
+        <button class="filter-btn" id="filterAll" onclick="clearFilters()" style="display:none">✕ Clear</button>
+    </div>
+
+    <div style="padding: 0 40px 16px; position:relative; z-index:1;" id="schoolTagArea">
+        <div class="school-filter-list" id="schoolTags"></div>
+    </div>
+</div>
+
+<!-- ══ CONTENT ══ -->
+<div class="content-area">
+    <!-- TEAMS PANEL -->
+    <div class="tab-panel active" id="panel-teams">
+        <div class="teams-grid" id="teamsGrid"></div>
+        <div class="empty-state" id="noTeams" style="display:none">
+            <div class="icon">🔍</div>
+            <div>No teams match your search.</div>
+        </div>
+    </div>
+
+    <!-- REVIEW PANEL -->
+    <div class="tab-panel" id="panel-review">
+        <div class="review-toolbar">
+            <div class="search-box review-search">
+                <span class="search-icon">🗂️</span>
+                <input type="text" id="reviewSearch" placeholder="Search player, team, school, or note…" oninput="renderReviewBoard()">
+            </div>
+            <button class="filter-btn review-filter active" onclick="setReviewFilter('all', this)">All</button>
+            <button class="filter-btn review-filter" onclick="setReviewFilter('review', this)">Review</button>
+            <button class="filter-btn review-filter" onclick="setReviewFilter('correct_review', this)">Correct Review</button>
+            <button class="filter-btn review-filter" onclick="setReviewFilter('flagged', this)">Tagged</button>
+            <button class="filter-btn review-filter" onclick="setReviewFilter('duplicates', this)">Duplicates</button>
+            <button class="filter-btn review-filter" onclick="setReviewFilter('roster', this)">Roster Issues</button>
+            <button class="filter-btn review-filter" onclick="setReviewFilter('schools', this)">School Categories</button>
+        </div>
+
+        <div class="review-summary" id="reviewSummary"></div>
+
+        <div class="table-wrapper" id="schoolAuditTable" style="display:none">
+            <table class="table review-table">
+                <thead>
+                    <tr>
+                        <th>School</th>
+                        <th>Status</th>
+                        <th>Teams</th>
+                        <th>Expected</th>
+                        <th>Present</th>
+                        <th>Missing</th>
+                    </tr>
+                </thead>
+                <tbody id="schoolAuditRows"></tbody>
+            </table>
+        </div>
+
+        <div class="table-wrapper" id="playerReviewTable">
+            <table class="table review-table">
+                <thead>
+                    <tr>
+                        <th>Player</th>
+                        <th>DOB</th>
+                        <th>School</th>
+                        <th>Team</th>
+                        <th>Status</th>
+                        <th>Note</th>
+                        <th>Updated</th>
+                        <th>Open</th>
+                    </tr>
+                </thead>
+                <tbody id="reviewRows"></tbody>
+            </table>
+        </div>
+
+        <div class="empty-state" id="noReviewRows" style="display:none">
+            <div class="icon">📝</div>
+            <div>No review records match this filter.</div>
+        </div>
+    </div>
+</div>
+
+<!-- ══ PLAYER MODAL ══ -->
+<div class="player-modal-overlay" id="playerModal" onclick="closeModal(event)">
+    <div class="player-modal">
+        <div class="modal-inner-wrap">
+            <button class="modal-close" onclick="document.getElementById('playerModal').classList.remove('open')">✕</button>
+            <div id="modalContent"></div>
+        </div>
+    </div>
+</div>
+
+<!-- Scripts -->
+<script>
+{teams_script}
+
+const REVIEW_STORAGE_KEY = 'bb_review_state_v1';
+let reviewState = loadReviewState();
+let genderFilter = null;
+let schoolFilter = null;
+let activeTab = 'teams';
+let reviewFilter = 'all';
+
+let visibleRecords = [];
+let reviewRecords = [];
+let modalSequence = [];
+let modalSequencePos = -1;
+let currentPlayerRef = null;
+
+window.addEventListener('DOMContentLoaded', () => {{
+    TEAMS_READY.then(() => {{
+        buildSchoolTags();
+        applyFilters();
+        renderReviewBoard();
+        updateHeroStats();
+    }}, err => {{
+        document.getElementById('noTeams').style.display = 'block';
+        document.getElementById('noTeams').lastElementChild.textContent = `Could not load team data (${{err.message}}).`;
+    }});
+}});
+
+function loadReviewState() {{
+    try {{
+        const raw = localStorage.getItem(REVIEW_STORAGE_KEY);
+        if (!raw) return {{}};
+        const parsed = JSON.parse(raw);
+        return parsed && typeof parsed === 'object' ? migrateReviewState(parsed) : {{}};
+    }} catch (err) {{
+        return {{}};
+    }}
+}}
+
+function migrateReviewState(state) {{
+    // Tags saved under old record ids (row-order player_0001…, or ids hashed from a team
+    // name before the export had team ids) move to the current ids once.
+    let moved = false;
+    Object.keys(state).forEach(key => {{
+        const target = RECORD_ID_MIGRATION[key];
+        if (!target || target === key) return;
+        if (!state[target]) state[target] = state[key];
+        delete state[key];
+        moved = true;
+    }});
+    if (moved) localStorage.setItem(REVIEW_STORAGE_KEY, JSON.stringify(state));
+    return state;
+}}
+
+function persistReviewState() {{
+    localStorage.setItem(REVIEW_STORAGE_KEY, JSON.stringify(reviewState));
+}}
+
+function getPlayerKey(player) {{
+    return player && player.record_id ? player.record_id : '';
+}}
+
+// Other registrations of the same child, from DUPLICATE_CLUSTERS (find_duplicate_clusters).
+let duplicateIndex = null;
+function getDuplicateEntries(player) {{
+    if (!DUPLICATE_CLUSTERS || !player) return [];
+    if (!duplicateIndex) {{
+        const byId = new Map(ALL_PLAYERS.map(base => [base.record_id, base]));
+        duplicateIndex = new Map();
+        DUPLICATE_CLUSTERS.forEach(ids => {{
+            const members = ids.map(id => byId.get(id)).filter(Boolean);
+            members.forEach(member => duplicateIndex.set(member.record_id, members));
+        }});
+    }}
+    const members = duplicateIndex.get(player.record_id) || [];
+    return members.filter(member => member.record_id !== player.record_id);
+}}
+
+function getReviewEntry(player) {{
+    const key = getPlayerKey(player);
+    if (!key || !reviewState[key]) {{
+        return {{ status: '', note: '', updated_at: '' }};
+    }}
+    return {{
+        status: reviewState[key].status || '',
+        note: reviewState[key].note || '',
+        updated_at: reviewState[key].updated_at || '',
+    }};
+}}
+
+function setReviewEntry(player, status, note) {{
+    const key = getPlayerKey(player);
+    if (!key) return;
+    const cleanStatus = status || '';
+    const cleanNote = (note || '').trim();
+
+    if (!cleanStatus && !cleanNote) {{
+        delete reviewState[key];
+    }} else {{
+        reviewState[key] = {{
+            status: cleanStatus,
+            note: cleanNote,
+            updated_at: new Date().toISOString(),
+        }};
+    }}
+    persistReviewState();
+}}
+
+function statusLabel(status) {{
+    if (status === 'review') return 'Review';
+    if (status === 'correct_review') return 'Correct Review';
+    return 'No Tag';
+}}
+
+function statusShort(status) {{
+    if (status === 'review') return 'Review';
+    if (status === 'correct_review') return 'Correct';
+    return '';
+}}
+
+function statusClass(status) {{
+    if (status === 'review') return 'review';
+    if (status === 'correct_review') return 'correct-review';
+    return 'none';
+}}
+
+function formatUpdated(ts) {{
+    if (!ts) return '—';
+    const d = new Date(ts);
+    if (Number.isNaN(d.getTime())) return ts;
+    return d.toLocaleString();
+}}
+
+function updateHeroStats() {{
+    const totalTeams = TEAMS_DATA.length;
+    const totalPlayers = TEAMS_DATA.reduce((s, t) => s + t.players.length, 0);
+    const schools = [...new Set(TEAMS_DATA.map(t => t.school))].length;
+    const withPhotos = TEAMS_DATA.reduce((s, t) => s + t.players.filter(p => p.photo).length, 0);
+    const withCert = TEAMS_DATA.reduce((s, t) => s + t.players.filter(p => p.cert_url).length, 0);
+    const tagged = Object.values(reviewState).filter(v => (v.status || '').length > 0).length;
+    const reviewOnly = Object.values(reviewState).filter(v => v.status === 'review').length;
+    const correctOnly = Object.values(reviewState).filter(v => v.status === 'correct_review').length;
+
+    document.getElementById('heroStats').innerHTML = `
+        <div class="stat-pill"><span class="num">${{totalTeams}}</span> Teams</div>
+        <div class="stat-pill"><span class="num">${{totalPlayers}}</span> Players</div>
+        <div class="stat-pill"><span class="num">${{schools}}</span> Schools</div>
+        <div class="stat-pill"><span class="num">${{withCert}}</span> 📋 Cert Links</div>
+        <div class="stat-pill"><span class="num">${{withPhotos}}</span> 📷 Photos</div>
+        <div class="stat-pill"><span class="num">${{tagged}}</span> 🏷️ Tagged</div>
+        <div class="stat-pill"><span class="num">${{reviewOnly}}</span> ⚠️ Review</div>
+        <div class="stat-pill"><span class="num">${{correctOnly}}</span> ✅ Correct</div>
+    `;
+    document.getElementById('teamsCount').textContent = totalTeams;
+    document.getElementById('reviewCount').textContent = tagged;
+}}
+
+// ── SCHOOL TAGS ──
+function buildSchoolTags() {{
+    const schools = [...new Set(TEAMS_DATA.map(t => t.school))].sort();
+    const container = document.getElementById('schoolTags');
+    container.innerHTML = '';
+    schools.forEach(school => {{
+        const tag = document.createElement('button');
+        tag.className = 'school-tag';
+        tag.textContent = school;
+        tag.onclick = () => toggleSchool(school, tag);
+        container.appendChild(tag);
+    }});
+}}
+
+function toggleSchool(school, el) {{
+    if (schoolFilter === school) {{
+        schoolFilter = null;
+        document.querySelectorAll('.school-tag').forEach(t => t.classList.remove('active'));
+    }} else {{
+        schoolFilter = school;
+        document.querySelectorAll('.school-tag').forEach(t => {{
+            t.classList.toggle('active', t.textContent === school);
+        }});
+    }}
+    applyFilters();
+}}
+
+// ── GENDER FILTER ──
+function toggleGender(g) {{
+    if (genderFilter === g) {{
+        genderFilter = null;
+    }} else {{
+        genderFilter = g;
+    }}
+    document.getElementById('filterM').classList.toggle('active', genderFilter === 'Masculino');
+    document.getElementById('filterF').classList.toggle('active', genderFilter === 'Femenino');
+    document.getElementById('filterAll').style.display = genderFilter ? 'block' : 'none';
+    applyFilters();
+}}
+
+function clearFilters() {{
+    genderFilter = null;
+    schoolFilter = null;
+    document.getElementById('mainSearch').value = '';
+    document.getElementById('filterM').classList.remove('active');
+    document.getElementById('filterF').classList.remove('active');
+    document.getElementById('filterAll').style.display = 'none';
+    document.querySelectorAll('.school-tag').forEach(t => t.classList.remove('active'));
+    applyFilters();
+}}
+
+// ── SEARCH ──
+// Same folding as normalize_key in dashboard.py / normalizeSchoolKey: "Rolon" finds "Rolón".
+function foldSearchText(value) {{
+    return String(value || '')
+        .normalize('NFD')
+        .replace(/[\\u0300-\\u036f]/g, '')
+        .toLowerCase()
+        .replace(/&/g, ' and ')
+        .replace(/[^a-z0-9]+/g, ' ')
+        .trim();
+}}
+
+function buildSearchIndex(teams) {{
+    const postings = new Map();
+    teams.forEach(team => {{
+        [team.team, team.school, ...team.players.map(p => p.name)].forEach(text => {{
+            foldSearchText(text).split(' ').filter(Boolean).forEach(token => {{
+                if (!postings.has(token)) postings.set(token, []);
+                const list = postings.get(token);
+                if (list[list.length - 1] !== team.source_idx) list.push(team.source_idx);
+            }});
+        }});
+    }});
+    const tokens = [...postings.keys()].sort();
+    return {{ tokens, teams: tokens.map(token => postings.get(token)) }};
+}}
+
+// source_idx of the teams where every query word starts some word of the team,
+// school or a player name; null when the query is empty.
+function searchTeams(query) {{
+    const words = foldSearchText(query).split(' ').filter(Boolean);
+    if (!words.length) return null;
+    const {{ tokens, teams }} = SEARCH_INDEX;
+    let result = null;
+    for (const word of words) {{
+        let lo = 0;
+        let hi = tokens.length;
+        while (lo < hi) {{
+            const mid = (lo + hi) >> 1;
+            if (tokens[mid] < word) lo = mid + 1; else hi = mid;
+        }}
+        const found = new Set();
+        for (let i = lo; i < tokens.length && tokens[i].startsWith(word); i += 1) {{
+            teams[i].forEach(sourceIdx => {{
+                if (!result || result.has(sourceIdx)) found.add(sourceIdx);
+            }});
+        }}
+        result = found;
+        if (!result.size) break;
+    }}
+    return result;
+}}
+
+function getFilteredTeams() {{
+    const matches = searchTeams(document.getElementById('mainSearch').value);
+    return TEAMS_DATA.filter(team => {{
+        if (genderFilter && team.gender !== genderFilter) return false;
+        if (schoolFilter && team.school !== schoolFilter) return false;
+        if (matches && !matches.has(team.source_idx)) return false;
+        return true;
+    }});
+}}
+
+// ── APPLY FILTERS ──
+function applyFilters() {{
+    renderTeamsGrid(getFilteredTeams());
+}}
+
+function switchTab(tab, btn) {{
+    activeTab = tab;
+    document.querySelectorAll('.tab-btn').forEach(b => b.classList.remove('active'));
+    document.querySelectorAll('.tab-panel').forEach(p => p.classList.remove('active'));
+    btn.classList.add('active');
+    document.getElementById('panel-' + tab).classList.add('active');
+    document.getElementById('teamsFilters').style.display = tab === 'teams' ? 'block' : 'none';
+    if (tab === 'review') {{
+        renderReviewBoard();
+    }}
+}}
+
+function setReviewFilter(filter, btn) {{
+    reviewFilter = filter;
+    document.querySelectorAll('.review-filter').forEach(b => b.classList.remove('active'));
+    btn.classList.add('active');
+    renderReviewBoard();
+}}
+
+function openModalByVisiblePos(pos) {{
+    openRecordFromSequence(visibleRecords, pos);
+}}
+
+function openModalByReviewPos(pos) {{
+    openRecordFromSequence(reviewRecords, pos);
+}}
+
+function openRecordFromSequence(sequence, pos) {{
+    if (!sequence || sequence.length === 0 || pos < 0 || pos >= sequence.length) {{
+        return;
+    }}
+
+    modalSequence = sequence.map(item => ({{
+        team_source_idx: item.team_source_idx,
+        player_idx: item.player_idx,
+    }}));
+    modalSequencePos = pos;
+
+    const ref = modalSequence[pos];
+    const team = TEAM_BY_SOURCE_IDX[ref.team_source_idx];
+    if (!team || !team.players || !team.players[ref.player_idx]) {{
+        return;
+    }}
+
+    currentPlayerRef = ref;
+    openModal(team.players[ref.player_idx], team.team);
+}}
+
+function goPrevRecord() {{
+    if (modalSequencePos <= 0) return;
+    openRecordFromSequence(modalSequence, modalSequencePos - 1);
+}}
+
+function goNextRecord() {{
+    if (modalSequencePos < 0 || modalSequencePos >= modalSequence.length - 1) return;
+    openRecordFromSequence(modalSequence, modalSequencePos + 1);
+}}
+
+function handleImgErr(img) {{
+    if (!img) return;
+    img.outerHTML = '<div class="no-photo">🏀</div>';
+}}
+
+function handleModalImgErr(img) {{
+    if (!img) return;
+    const fallback = img.dataset.fallback || '';
+    const fallbackUsed = img.dataset.fallbackUsed === '1';
+    if (!fallbackUsed && fallback && img.src !== fallback) {{
+        img.dataset.fallbackUsed = '1';
+        img.src = fallback;
+        return;
+    }}
+    img.outerHTML = '<div class="modal-no-photo">🏀</div>';
+}}
+
+// ── RENDER TEAMS GRID ──
+function renderTeamsGrid(teams) {{
+    const grid = document.getElementById('teamsGrid');
+    const empty = document.getElementById('noTeams');
+    visibleRecords = [];
+
+    if (teams.length === 0) {{
+        grid.innerHTML = '';
+        empty.style.display = 'block';
+        return;
+    }}
+    empty.style.display = 'none';
+
+    grid.innerHTML = teams.map((team) => {{
+        const catClass = 'badge-cat-' + (team.category || 'default');
+        const gClass = team.gender === 'Masculino' ? 'badge-m' : 'badge-f';
+        const gSymbol = team.gender === 'Masculino' ? '♂' : '♀';
+
+        const playerTiles = team.players.map((p, pi) => {{
+            const visiblePos = visibleRecords.push({{
+                team_source_idx: team.source_idx,
+                player_idx: pi,
+            }}) - 1;
+            const review = getReviewEntry(p);
+            const reviewClass = statusClass(review.status);
+            const reviewFlag = review.status
+                ? `<div class="player-review-flag ${{reviewClass}}">${{statusShort(review.status)}}</div>`
+                : '';
+            const photoHtml = p.photo
+                ? `<img src="${{p.photo}}" alt="${{p.name}}" loading="lazy" onerror="handleImgErr(this)">`
+                : `<div class="no-photo">🏀</div>`;
+
+            const certLink = p.cert_url ? `<a href="${{p.cert_url}}" target="_blank" class="tooltip-link" onclick="event.stopPropagation()">📋 Cert</a>` : '';
+            const waiverLink = p.waiver_url ? `<a href="${{p.waiver_url}}" target="_blank" class="tooltip-link waiver" onclick="event.stopPropagation()">✍️ Waiver</a>` : '';
+            const reviewText = review.status ? `<div class="tooltip-grade">${{statusLabel(review.status)}}</div>` : '';
+            const duplicates = getDuplicateEntries(p);
+            const rosterFlags = (p.roster_flags || '').split(' ');
+            const alertFlags = [
+                rosterFlags.includes('duplicate_jersey') || rosterFlags.includes('missing_jersey')
+                    ? '<span class="player-alert-flag jersey">#</span>' : '',
+                p.eligible === false ? '<span class="player-alert-flag">AGE</span>' : '',
+                duplicates.length ? '<span class="player-alert-flag duplicate">DUP</span>' : '',
+            ].join('');
+            const ageText = p.eligible === false ? `<div class="tooltip-grade">${{escHtml(p.eligibility_reason)}}</div>` : '';
+
+            return `
+            <div class="player-tile" onclick="openModalByVisiblePos(${{visiblePos}})">
+                ${{photoHtml}}
+                <div class="jersey-num">#${{p.jersey}}</div>
+                ${{reviewFlag}}
+                ${{alertFlags ? `<div class="player-alert-flags">${{alertFlags}}</div>` : ''}}
+                <div class="dob-tooltip">
+                    <div class="tooltip-name">${{p.name}}</div>
+                    <div class="tooltip-label">Date of Birth</div>
+                    <div class="tooltip-jersey">Jersey #${{p.jersey}}</div>
+                    <div class="tooltip-grade">Grade: ${{p.grade}}</div>
+                    ${{reviewText}}
+                    ${{ageText}}
+                    <div class="tooltip-docs">${{certLink}} ${{waiverLink}}</div>
+                </div>
+            </div>`;
+        }}).join('');
+
+        return `
+        <div class="team-card">
+            <div class="team-header">
+                <div class="team-name-block">
+                    <div class="team-name">${{team.team}}</div>
+                    <div class="team-meta">
+                        <span class="badge-pill badge-cat-${{team.category || 'default'}}">${{team.category}}</span>
+                        <span class="badge-gender ${{gClass}}">${{gSymbol}} ${{team.gender}}</span>
+                    </div>
+                    ${{team.roster_summary ? `<div class="roster-issues">⚠️ ${{escHtml(team.roster_summary)}}</div>` : ''}}
+                </div>
+                <div class="player-count">
+                    <span class="num">${{team.players.length}}</span>
+                    Players
+                </div>
+            </div>
+            <div class="players-photo-grid">${{playerTiles}}</div>
+        </div>`;
+    }}).join('');
+}}
+
+function renderReviewBoard() {{
+    const q = document.getElementById('reviewSearch').value.toLowerCase().trim();
+    const schoolsView = reviewFilter === 'schools';
+    document.getElementById('schoolAuditTable').style.display = schoolsView ? 'block' : 'none';
+    document.getElementById('playerReviewTable').style.display = schoolsView ? 'none' : 'block';
+    if (schoolsView) {{
+        renderSchoolCategoryView(q);
+        return;
+    }}
+
+    let rows = ALL_PLAYERS.map(base => {{
+        const entry = reviewState[base.record_id] || {{}};
+        return {{
+            record_id: base.record_id,
+            name: base.name,
+            dob: base.dob,
+            dob_display: base.dob_display,
+            school: base.school,
+            team: base.team,
+            team_source_idx: base.team_source_idx,
+            player_idx: base.player_idx,
+            status: entry.status || '',
+            note: entry.note || '',
+            updated_at: entry.updated_at || '',
+        }};
+    }});
+
+    if (reviewFilter === 'review') {{
+        rows = rows.filter(r => r.status === 'review');
+    }} else if (reviewFilter === 'correct_review') {{
+        rows = rows.filter(r => r.status === 'correct_review');
+    }} else if (reviewFilter === 'flagged') {{
+        rows = rows.filter(r => !!r.status);
+    }} else if (reviewFilter === 'duplicates') {{
+        rows = rows.filter(r => getDuplicateEntries(r).length > 0);
+    }} else if (reviewFilter === 'roster') {{
+        // roster_flags are precomputed by create.py (apply_roster_checks)
+        rows = rows.filter(r => !!TEAM_BY_SOURCE_IDX[r.team_source_idx].players[r.player_idx].roster_flags);
+    }}
+
+    if (q) {{
+        rows = rows.filter(r => {{
+            const bag = (r.name + ' ' + r.school + ' ' + r.team + ' ' + r.note + ' ' + statusLabel(r.status)).toLowerCase();
+            return bag.includes(q);
+        }});
+    }}
+
+    const rank = {{ review: 0, correct_review: 1, '': 2 }};
+    rows.sort((a, b) => {{
+        const rd = (rank[a.status || ''] ?? 99) - (rank[b.status || ''] ?? 99);
+        if (rd !== 0) return rd;
+        const sd = a.school.localeCompare(b.school);
+        if (sd !== 0) return sd;
+        const td = a.team.localeCompare(b.team);
+        if (td !== 0) return td;
+        return a.name.localeCompare(b.name);
+    }});
+
+    reviewRecords = rows.map(r => ({{
+        team_source_idx: r.team_source_idx,
+        player_idx: r.player_idx,
+    }}));
+
+    const totalTagged = Object.values(reviewState).filter(v => (v.status || '').length > 0).length;
+    const totalReview = Object.values(reviewState).filter(v => v.status === 'review').length;
+    const totalCorrect = Object.values(reviewState).filter(v => v.status === 'correct_review').length;
+    document.getElementById('reviewSummary').innerHTML = `
+        <div class="review-pill">Players <strong>${{ALL_PLAYERS.length}}</strong></div>
+        <div class="review-pill">Tagged <strong>${{totalTagged}}</strong></div>
+        <div class="review-pill">Review <strong>${{totalReview}}</strong></div>
+        <div class="review-pill">Correct Review <strong>${{totalCorrect}}</strong></div>
+        <div class="review-pill">Visible Rows <strong>${{rows.length}}</strong></div>
+    `;
+
+    const tbody = document.getElementById('reviewRows');
+    const empty = document.getElementById('noReviewRows');
+    if (rows.length === 0) {{
+        tbody.innerHTML = '';
+        empty.lastElementChild.textContent = 'No review records match this filter.';
+        empty.style.display = 'block';
+        return;
+    }}
+    empty.style.display = 'none';
+
+    tbody.innerHTML = rows.map((r, idx) => `
+        <tr>
+            <td><strong>${{escHtml(r.name)}}</strong></td>
+            <td class="dob-cell"><span class="dob-badge">${{escHtml(r.dob_display || r.dob || '—')}}</span></td>
+            <td class="school-cell">${{escHtml(r.school)}}</td>
+            <td class="team-cell">${{escHtml(r.team)}}</td>
+            <td><span class="review-status-badge ${{statusClass(r.status)}}">${{statusLabel(r.status)}}</span></td>
+            <td class="review-note-cell">${{r.note ? escHtml(r.note) : '<span style="color:var(--text-muted)">—</span>'}}</td>
+            <td class="review-updated-cell">${{formatUpdated(r.updated_at)}}</td>
+            <td><button class="review-open-btn" onclick="openModalByReviewPos(${{idx}})">Open</button></td>
+        </tr>
+    `).join('');
+}}
+
+function schoolAuditStatus(r) {{
+    if (!r.has_rule) return '<span class="review-status-badge review">Rule Missing</span>';
+    if (r.teams === 0) return '<span class="review-status-badge review">No Teams</span>';
+    if (r.players === 0) return '<span class="review-status-badge review">No Players</span>';
+    if (r.missing.length) return `<span class="review-status-badge review">Missing ${{r.missing.length}}</span>`;
+    if (r.extra.length) return `<span class="review-status-badge none">Unexpected ${{r.extra.length}}</span>`;
+    return `<span class="review-status-badge none">Empty Teams ${{r.empty_teams.length}}</span>`;
+}}
+
+// Rows come precomputed from create.py (school_category_diagnostics); this only renders them.
+function renderSchoolCategoryView(q) {{
+    let rows = SCHOOL_CATEGORY_DIAGNOSTICS || [];
+    if (q) {{
+        rows = rows.filter(r => {{
+            const bag = `${{r.school}} ${{r.expected.join(' ')}} ${{r.actual.join(' ')}} ${{r.missing.join(' ')}} ${{r.extra.join(' ')}} ${{r.empty_teams.join(' ')}}`.toLowerCase();
+            return bag.includes(q);
+        }});
+    }}
+
+    document.getElementById('reviewSummary').innerHTML = `
+        <div class="review-pill">Schools Audited <strong>${{rows.length}}</strong></div>
+        <div class="review-pill">Missing Categories <strong>${{rows.filter(r => r.missing.length > 0).length}}</strong></div>
+        <div class="review-pill">Missing Codes <strong>${{rows.reduce((sum, r) => sum + r.missing.length, 0)}}</strong></div>
+        <div class="review-pill">No Rule Set <strong>${{rows.filter(r => !r.has_rule).length}}</strong></div>
+        <div class="review-pill">No Teams <strong>${{rows.filter(r => r.teams === 0).length}}</strong></div>
+        <div class="review-pill">No Players <strong>${{rows.filter(r => r.players === 0).length}}</strong></div>
+        <div class="review-pill">Complete Schools <strong>${{rows.filter(r => r.has_rule && !r.missing.length && !r.extra.length).length}}</strong></div>
+    `;
+
+    reviewRecords = [];
+    const flagged = rows.filter(r => r.missing.length > 0 || !r.has_rule || r.extra.length > 0 || r.players === 0 || r.empty_teams.length > 0);
+    const tbody = document.getElementById('schoolAuditRows');
+    const empty = document.getElementById('noReviewRows');
+    if (flagged.length === 0) {{
+        tbody.innerHTML = '';
+        empty.lastElementChild.textContent = SCHOOL_CATEGORY_DIAGNOSTICS
+            ? 'All schools with rules are complete. No missing categories found.'
+            : 'School category diagnostics are not included in this page.';
+        empty.style.display = 'block';
+        return;
+    }}
+    empty.style.display = 'none';
+
+    const codes = (list, className, none) => list.length
+        ? list.map(code => `<span class="audit-code ${{className(code)}}">${{escHtml(code)}}</span>`).join('')
+        : `<span class="audit-code">${{none}}</span>`;
+    tbody.innerHTML = flagged.map(r => {{
+        const emptyTeams = r.empty_teams.map(name => `<span class="audit-code missing">${{escHtml(name)}}</span>`).join('');
+        return `
+        <tr>
+            <td><strong>${{escHtml(r.school)}}</strong></td>
+            <td>${{schoolAuditStatus(r)}}</td>
+            <td>${{r.teams}} teams · ${{r.players}} players<div class="audit-codes">${{emptyTeams}}</div></td>
+            <td><div class="audit-codes">${{codes(r.expected, () => '', 'No configured rule')}}</div></td>
+            <td><div class="audit-codes">${{codes(r.actual, code => r.expected.includes(code) ? 'present' : 'extra', 'No categories loaded')}}</div></td>
+            <td><div class="audit-codes">${{codes(r.missing, () => 'missing', 'None missing')}}</div></td>
+        </tr>`;
+    }}).join('');
+}}
+
+// ── MODAL ──
+function openModal(playerData, teamName) {{
+    const p = typeof playerData === 'string' ? JSON.parse(playerData) : playerData;
+    const review = getReviewEntry(p);
+    const totalInSequence = modalSequence.length || 1;
+    const displayPos = modalSequencePos >= 0 ? modalSequencePos + 1 : 1;
+    const team = currentPlayerRef ? TEAM_BY_SOURCE_IDX[currentPlayerRef.team_source_idx] : null;
+    const teamLine = team && team.school ? `${{teamName}} | ${{team.school}}` : teamName;
+    const modalPhoto = p.photo_full || p.photo;
+
+    const photoHtml = modalPhoto
+        ? `<img src="${{modalPhoto}}" data-fallback="${{p.photo || ''}}" data-fallback-used="0" alt="${{p.name}}" class="modal-photo" onerror="handleModalImgErr(this)">`
+        : `<div class="modal-no-photo">🏀</div>`;
+
+    const certBtn = p.cert_url ? `<a href="${{p.cert_url}}" target="_blank" class="modal-doc-btn">📋 Birth Certificate</a>` : '';
+    const certPreviewBtn = p.cert_preview ? `<a href="${{p.cert_preview}}" target="_blank" class="modal-doc-btn">🔎 Preview Certificate</a>` : '';
+    const waiverBtn = p.waiver_url ? `<a href="${{p.waiver_url}}" target="_blank" class="modal-doc-btn waiver">✍️ Waiver</a>` : '';
+    const waiverPreviewBtn = p.waiver_preview ? `<a href="${{p.waiver_preview}}" target="_blank" class="modal-doc-btn waiver">🔎 Preview Waiver</a>` : '';
+    const reviewMeta = review.updated_at ? `Last saved: ${{formatUpdated(review.updated_at)}}` : 'No review saved yet.';
+    const statusChipClass = review.status ? `status-${{statusClass(review.status)}}` : '';
+    const statusChip = review.status
+        ? `<span class="modal-chip ${{statusChipClass}}">${{statusLabel(review.status)}}</span>`
+        : '';
+    const duplicateChips = getDuplicateEntries(p).map(other =>
+        `<span class="modal-chip duplicate">Also registered: ${{escHtml(other.name)}} · ${{escHtml(other.team)}} (${{escHtml(other.school)}})</span>`
+    ).join('');
+    const ageChip = p.eligibility_reason
+        ? `<span class="modal-chip ${{p.eligible === false ? 'age-out' : p.eligible ? 'age-ok' : ''}}">${{escHtml(p.eligibility_reason)}}</span>`
+        : '';
+
+    document.getElementById('modalContent').innerHTML = `
+        <div class="modal-media">
+            ${{photoHtml}}
+            <div class="modal-photo-tags">
+                <input type="hidden" id="modalReviewStatus" value="">
+                <button class="modal-tag-btn review" id="tagBtnReview" onclick="setModalStatus('review', true)">⚠️ Review</button>
+                <button class="modal-tag-btn correct-review" id="tagBtnCorrect" onclick="setModalStatus('correct_review', true)">✅ Correct Review</button>
+                <button class="modal-tag-btn" id="tagBtnClear" onclick="setModalStatus('', true)">Clear</button>
+            </div>
+        </div>
+        <div class="modal-body-inner">
+            <div class="modal-nav">
+                <button class="modal-nav-btn" onclick="goPrevRecord()" ${{modalSequencePos <= 0 ? 'disabled' : ''}}>← Previous</button>
+                <div class="modal-nav-meta">Record ${{displayPos}} of ${{totalInSequence}}</div>
+                <button class="modal-nav-btn" onclick="goNextRecord()" ${{modalSequencePos >= totalInSequence - 1 ? 'disabled' : ''}}>Next →</button>
+            </div>
+            <div class="modal-headline">
+                <div>
+                    <div class="modal-name">${{escHtml(p.name)}}</div>
+                    <div class="modal-team">${{escHtml(teamLine)}}</div>
+                </div>
+            </div>
+            <div class="modal-quick-info">
+                <span class="modal-chip dob">DOB: ${{escHtml(p.dob_display || p.dob || '—')}}</span>
+                <span class="modal-chip">Jersey #${{escHtml(p.jersey || '—')}}</span>
+                <span class="modal-chip grade">Grade: ${{escHtml(p.grade || '—')}}</span>
+                ${{ageChip}}
+                ${{statusChip}}
+                ${{duplicateChips}}
+            </div>
+            <div class="modal-docs">${{certBtn}} ${{certPreviewBtn}} ${{waiverBtn}} ${{waiverPreviewBtn}}</div>
+            <div class="modal-review-box">
+                <div class="modal-review-title">Review Note</div>
+                <div id="modalReviewRowWrap" class="modal-review-row-wrap">
+                <div class="modal-review-row">
+                    <textarea id="modalReviewNote" class="modal-review-note" placeholder="Add note (optional)"></textarea>
+                    <button class="modal-review-save" onclick="saveCurrentReview()">Save Note</button>
+                </div>
+                </div>
+                <div class="modal-review-meta" id="modalReviewMeta">${{reviewMeta}}</div>
+            </div>
+        </div>
+    `;
+    document.getElementById('modalReviewStatus').value = review.status || '';
+    document.getElementById('modalReviewNote').value = review.note || '';
+    updateModalTagButtons(review.status || '');
+    updateReviewNoteVisibility(review.status || '');
+    document.getElementById('playerModal').classList.add('open');
+}}
+
+function updateModalTagButtons(status) {{
+    const reviewBtn = document.getElementById('tagBtnReview');
+    const correctBtn = document.getElementById('tagBtnCorrect');
+    const clearBtn = document.getElementById('tagBtnClear');
+    if (!reviewBtn || !correctBtn || !clearBtn) return;
+
+    reviewBtn.classList.toggle('active', status === 'review');
+    correctBtn.classList.toggle('active', status === 'correct_review');
+    clearBtn.classList.toggle('active', !status);
+}}
+
+function setModalStatus(status, autoSave = false) {{
+    const statusEl = document.getElementById('modalReviewStatus');
+    if (!statusEl) return;
+    statusEl.value = status || '';
+    updateModalTagButtons(statusEl.value);
+    updateReviewNoteVisibility(statusEl.value);
+    if (autoSave) {{
+        saveCurrentReview();
+    }}
+}}
+
+function updateReviewNoteVisibility(status) {{
+    const wrap = document.getElementById('modalReviewRowWrap');
+    const noteEl = document.getElementById('modalReviewNote');
+    const metaEl = document.getElementById('modalReviewMeta');
+    if (!wrap || !noteEl || !metaEl) return;
+
+    const showNote = status === 'review';
+    wrap.classList.toggle('hidden', !showNote);
+    noteEl.disabled = !showNote;
+    noteEl.placeholder = showNote ? 'Add note (required for review)' : '';
+
+    if (!showNote) {{
+        noteEl.value = '';
+        if (metaEl.textContent.trim() === '' || metaEl.textContent.includes('No review saved yet.')) {{
+            metaEl.textContent = 'Notes are only available when status is Review.';
+        }}
+    }}
+}}
+
+function saveCurrentReview() {{
+    if (!currentPlayerRef) return;
+    const team = TEAM_BY_SOURCE_IDX[currentPlayerRef.team_source_idx];
+    if (!team || !team.players || !team.players[currentPlayerRef.player_idx]) return;
+    const player = team.players[currentPlayerRef.player_idx];
+
+    const statusEl = document.getElementById('modalReviewStatus');
+    const noteEl = document.getElementById('modalReviewNote');
+    if (!statusEl || !noteEl) return;
+
+    const status = statusEl.value;
+    const note = status === 'review' ? noteEl.value : '';
+    setReviewEntry(player, status, note);
+
+    const updated = getReviewEntry(player);
+    const meta = updated.updated_at ? `Last saved: ${{formatUpdated(updated.updated_at)}}` : 'No review saved yet.';
+    document.getElementById('modalReviewMeta').textContent = meta;
+    updateModalTagButtons(updated.status || '');
+    updateReviewNoteVisibility(updated.status || '');
+
+    if (activeTab === 'teams') {{
+        applyFilters();
+    }}
+    renderReviewBoard();
+    updateHeroStats();
+}}
+
+function closeModal(e) {{
+    if (e.target === document.getElementById('playerModal')) {{
+        document.getElementById('playerModal').classList.remove('open');
+    }}
+}}
+
+function escHtml(str) {{
+    return String(str)
+        .replace(/&/g, '&amp;')
+        .replace(/</g, '&lt;')
+        .replace(/>/g, '&gt;')
+        .replace(/"/g, '&quot;')
+        .replace(/'/g, '&#39;');
+}}
+</script>
+</body>
+</html>
+"""
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Generate the Buzzer Beater tournament dashboard.")
+    parser.add_argument(
+        "--output", default=OUTPUT_HTML, metavar="PATH",
+        help=f"dashboard HTML to write (default: {OUTPUT_HTML})",
+    )
+    parser.add_argument(
+        "--split", metavar="DIR",
+        help="write a cacheable app shell (index.html, app.<hash>.css/js) and a content-hashed "
+             "data.<hash>.json into DIR instead of one self-contained HTML file",
+    )
+    parser.add_argument(
+        "--publish-root", metavar="DIR",
+        help="with --split, the directory Netlify publishes, whose _headers gets the cache rules "
+             "for the split DIR's path under it (default: the current directory when DIR is "
+             "inside it, else DIR itself)",
+    )
+    parser.add_argument(
+        "--emit-table", metavar="PATH",
+        help="also write the flat all-players HTML table to PATH (skipped by default)",
+    )
+    parser.add_argument(
+        "--format", choices=DATA_FORMATS, default="full",
+        help="TEAMS_DATA embedding: 'full' pretty-printed records (default), 'compact' "
+             "minified records with Drive file ids instead of full URLs, or 'columnar' "
+             "one array per field with players pointing at teams by index",
+    )
+    parser.add_argument(
+        "--engine", choices=CSV_ENGINES, default='csv',
+        help="how to read the export: the stdlib csv module (default, fastest start), pandas' "
+             "C parser, or pandas' pyarrow parser (needs pyarrow installed)",
+    )
+    parser.add_argument(
+        "--workers", type=int, default=1, metavar="N",
+        help="extract school blocks on N processes (default: 1, no pool); with --shard-by, "
+             "also the number of processes rendering shards (default there: one per core)",
+    )
+    parser.add_argument(
+        "--stream", action="store_true",
+        help="with --engine pandas, read the export in chunks so parsing memory stays flat on very "
+             "large exports (the csv engine always streams)",
+    )
+    parser.add_argument(
+        "--chunksize", type=int, default=STREAM_CHUNKSIZE, metavar="ROWS",
+        help=f"rows per chunk with --stream (default: {STREAM_CHUNKSIZE})",
+    )
+    parser.add_argument(
+        "--shard-by", action="append", choices=SHARD_KEYS, metavar="KEY",
+        help="also write one dashboard per division code ('category') or per 'school' plus an "
+             "index page into --shard-dir; repeat to get both",
+    )
+    parser.add_argument(
+        "--shard-dir", default=SHARD_DIR, metavar="DIR",
+        help=f"where --shard-by writes its pages (default: {SHARD_DIR})",
+    )
+    parser.add_argument(
+        "--age-cutoff", default=default_age_cutoff(), metavar="YYYY-MM-DD",
+        help="date on which --age-rules checks player ages "
+             "(default: January 1 of this year)",
+    )
+    parser.add_argument(
+        "--age-rules", metavar="PATH",
+        help='JSON {"<category>": {"min_age": N, "max_age": N}} with the age limits of each '
+             "category; players are only checked for age when this is given",
+    )
+    parser.add_argument(
+        "--schools", nargs="?", const=SCHOOLS_CSV, metavar="PATH",
+        help=f"join the school master list (default PATH: {SCHOOLS_CSV}) so schools without "
+             "teams or players show up under School Categories",
+    )
+    parser.add_argument(
+        "--roster-size", nargs=2, type=int, default=list(ROSTER_SIZE_LIMITS), metavar=("MIN", "MAX"),
+        help=f"flag teams with fewer than MIN or more than MAX players (default: {ROSTER_SIZE_LIMITS[0]} "
+             f"{ROSTER_SIZE_LIMITS[1]})",
+    )
+    parser.add_argument(
+        "--cache-dir", default=CACHE_DIR, metavar="DIR",
+        help=f"build cache location (default: {CACHE_DIR}); unchanged runs are skipped and "
+             "only changed school blocks are re-extracted",
+    )
+    parser.add_argument("--no-cache", action="store_true", help="rebuild everything and leave the cache alone")
+    parser.add_argument(
+        "--id-map", metavar="PATH",
+        help="also write the old (row-order) → new (stable) record id map as JSON to PATH",
+    )
+    parser.add_argument(
+        "--id-migration", action="store_true",
+        help="embed the old → new record id map so the page moves review tags saved under old "
+             "ids; only needed for the first build after the ids change",
+    )
+    parser.add_argument(
+        "--profile", nargs="?", const="-", metavar="PATH",
+        help="time each stage and track its peak memory with tracemalloc, and write the numbers "
+             "as JSON to PATH (stdout without PATH); implies --no-cache",
+    )
+    args = parser.parse_args(argv)
+    if args.profile and (args.stream or args.workers > 1):
+        parser.error("--profile times the serial pipeline; drop --stream/--workers")
+    if args.workers < 1:
+        parser.error("--workers must be at least 1")
+    if not 0 <= args.roster_size[0] <= args.roster_size[1]:
+        parser.error("--roster-size needs 0 <= MIN <= MAX")
+    try:
+        args.age_cutoff = datetime.date.fromisoformat(args.age_cutoff).isoformat()
+    except ValueError:
+        parser.error(f"--age-cutoff must be a YYYY-MM-DD date, got {args.age_cutoff!r}")
+    if args.publish_root is not None and not args.split:
+        parser.error("--publish-root only applies with --split")
+    if args.split:
+        try:
+            split_url_prefix(args.split, os.curdir if args.publish_root is None else args.publish_root)
+        except ValueError as err:
+            if args.publish_root is not None:
+                parser.error(f"--split: {err}")
+            args.publish_root = args.split
+        else:
+            args.publish_root = os.curdir if args.publish_root is None else args.publish_root
+    if args.workers > 1 and args.stream:
+        parser.error("--stream and --workers are alternatives; pick one")
+    if args.engine == 'pyarrow':
+        if args.stream:
+            parser.error("--stream reads in chunks, which the pyarrow engine does not support")
+        if importlib.util.find_spec('pyarrow') is None:
+            parser.error("--engine pyarrow needs the pyarrow package (pip install pyarrow)")
+    return args
+
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    if argv[:1] == ["diff"]:
+        return diff_main(argv[1:])
+    args = parse_args(argv)
+    if args.profile == "-":
+        # stdout carries only the JSON report; the run summary goes to stderr
+        with redirect_stdout(sys.stderr):
+            report = build_dashboard(args)
+        print(json.dumps(report, indent=2))
+    else:
+        build_dashboard(args)
+
+
+def build_dashboard(args):
+    """One generator run for parsed arguments; returns the profile report for ``--profile -``."""
+    profile = StageProfile(enabled=bool(args.profile))
+    cache = None
+    if not args.no_cache and not args.profile:
+        options = {
+            'format': args.format, 'output': args.output, 'split': args.split, 'emit_table': args.emit_table,
+            'publish_root': args.publish_root, 'id_map': args.id_map, 'id_migration': args.id_migration,
+            'shard_by': args.shard_by, 'shard_dir': args.shard_dir, 'age_cutoff': args.age_cutoff,
+            'age_rules': file_hash(args.age_rules) if args.age_rules else None,
+            'roster_size': args.roster_size, 'schools': file_hash(args.schools) if args.schools else None,
+        }
+        cache = BuildCache(args.cache_dir, INPUT_CSV, options)
+        if cache.is_fresh():
+            print(f"Dashboard up to date ({INPUT_CSV} unchanged since the last build).")
+            return
+    if args.stream and args.engine == 'pandas':
+        teams_json = stream_teams_json(INPUT_CSV, args.chunksize)
+    elif cache:
+        teams_json = cache.build_teams(args.engine, args.workers)
+    elif args.workers > 1:
+        teams_json = parallel_teams_json(INPUT_CSV, args.engine, args.workers)
+    else:
+        teams_json = build_teams(INPUT_CSV, args.engine, profile)
+    players = sum(len(team['players']) for team in teams_json)
+    with profile("Assign stable ids", rows=players):
+        teams_json, id_map = assign_stable_ids(teams_json)
+    page_id_map = id_map if args.id_migration else None
+    with profile("School category diagnostics", rows=len(teams_json)):
+        master = read_school_master(args.schools) if args.schools else None
+        diagnostics = school_category_diagnostics(teams_json, master=master)
+    eligibility = None
+    if args.age_rules:
+        with profile("Age eligibility", rows=players):
+            eligibility = apply_age_eligibility(
+                teams_json, args.age_cutoff, load_age_rules(args.age_rules), vectorized=args.engine != 'csv',
+            )
+    with profile("Roster checks", rows=players):
+        roster = apply_roster_checks(teams_json, *args.roster_size)
+    with profile("Duplicate detection", rows=players):
+        duplicates = find_duplicate_clusters(teams_json)
+
+    outputs = []
+    if args.id_map:
+        with open(args.id_map, "w", encoding="utf-8") as f:
+            json.dump(id_map, f, ensure_ascii=False, indent=2)
+        outputs.append(args.id_map)
+    if args.emit_table:
+        with profile("Write player table", rows=players):
+            write_player_table(teams_json, args.emit_table)
+        outputs.append(args.emit_table)
+
+    if args.split:
+        with profile("Write split files", rows=players):
+            data_name = write_split_dashboard(
+                args.split, teams_json, args.format, page_id_map, diagnostics, duplicates, args.publish_root,
+            )
+        outputs += [os.path.join(args.split, name) for name in ('index.html', data_name)]
+        print(f"Dashboard generated in {args.split}/ (data: {data_name}).")
+    else:
+        with profile("Render template", rows=players):
+            html_template = render_dashboard(render_teams_script(teams_json, args.format, page_id_map, diagnostics, duplicates))
+        with profile("Write file", rows=players):
+            with open(args.output, "w", encoding="utf-8") as f:
+                f.write(html_template)
+        outputs.append(args.output)
+        print("Dashboard generated.")
+
+    if args.shard_by:
+        shard_keys = list(dict.fromkeys(args.shard_by))
+        with profile("Write shards", rows=players):
+            shard_paths = write_shards(
+                args.shard_dir, teams_json, shard_keys, args.format, page_id_map,
+                args.workers if args.workers > 1 else None,
+            )
+        outputs += shard_paths
+        print(f"Shards: {len(shard_paths) - 1} pages in {args.shard_dir}/ (by {', '.join(shard_keys)}).")
+
+    if cache:
+        cache.save(outputs)
+    if cache and cache.stats:
+        print(f"School blocks re-extracted: {cache.stats['rebuilt']}/{cache.stats['blocks']}")
+    print(f"Teams: {len(teams_json)}")
+    print(f"Players: {players}")
+    print(f"Players with photos: {sum(1 for t in teams_json for p in t['players'] if p['photo'])}")
+    print(f"Schools missing categories: {sum(1 for row in diagnostics if row['missing'])}")
+    print(
+        f"Schools without players: {sum(1 for row in diagnostics if not row['players'])} "
+        f"({sum(1 for row in diagnostics if not row['teams'])} without teams)"
+    )
+    print(f"Roster issues: {roster['teams']} teams, {roster['players']} players")
+    print(f"Possible duplicate players: {sum(len(cluster) for cluster in duplicates)} in {len(duplicates)} groups")
+    if eligibility:
+        print(f"Age eligibility on {args.age_cutoff}: " + ", ".join(f"{count} {label}" for label, count in eligibility.items()))
+    for label, info in parse_cache_stats().items():
+        print(f"{label} parse cache: {info.hits} hits, {info.misses} misses ({info.currsize}/{info.maxsize} entries)")
+
+    if args.profile:
+        report = profile.report(
+            input=INPUT_CSV, input_bytes=os.path.getsize(INPUT_CSV), engine=args.engine,
+            format=args.format, teams=len(teams_json), players=players,
+        )
+        if args.profile == "-":
+            return report
+        with open(args.profile, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+        print(f"Profile written to {args.profile}")
@@ -0,0 +1,28 @@
+import os
+import sys
+
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+import create  # noqa: E402
+
+FIXTURE_EXPORT = os.path.join(ROOT, "tests", "fixtures", "export.csv")
+
+
+@pytest.fixture
+def export_path():
+    return FIXTURE_EXPORT
+
+
+@pytest.fixture
+def export_text():
+    with open(FIXTURE_EXPORT, encoding="utf-8") as f:
+        return f.read()
+
+
+@pytest.fixture
+def reference():
+    """The csv engine's TEAMS_DATA for the fixture export, which every other path must match."""
+    return create.build_teams(FIXTURE_EXPORT, 'csv')
@@ -0,0 +1,518 @@
+"""create.py on a small fixture export: engine parity, diff patches, data formats, the split
+layout, shards, record ids, duplicate players, roster checks, school diagnostics, the search
+index, export detection and age eligibility."""
+import csv
+import io
+import json
+import os
+import re
+import shutil
+import subprocess
+import tracemalloc
+
+import pytest
+
+import create
+
+CUTOFF = '2026-01-01'
+AGE_LIMITS = {
+    'Mini': {'max_age': 11},
+    'Juvenil': {'min_age': 12, 'max_age': 14},
+    'Junior': {'min_age': 14, 'max_age': 16},
+    'Senior': {'min_age': 15, 'max_age': 18},
+}
+
+
+def canonical(teams_json):
+    """TEAMS_DATA as a comparable string; NaN from a missing cell equals NaN."""
+    return json.dumps(create.json_safe(teams_json), ensure_ascii=False, sort_keys=True)
+
+
+def write_export(path, text):
+    with open(path, "w", encoding="utf-8", newline="") as f:
+        f.write(text)
+    return str(path)
+
+
+def edit_rows(text, edit):
+    """The export with ``edit(rows)`` applied to its data rows (the header stays first)."""
+    rows = list(csv.reader(io.StringIO(text)))
+    out = io.StringIO()
+    writer = csv.writer(out, lineterminator="\n")
+    writer.writerow(rows[0])
+    writer.writerows(edit(rows[1:]))
+    return out.getvalue()
+
+
+def players_by_name(teams_json):
+    return {player['name']: player for team in teams_json for player in team['players']}
+
+
+needs_node = pytest.mark.skipif(shutil.which('node') is None, reason="needs node to run the page's scripts")
+
+
+def page_teams(teams_json, data_format):
+    """TEAMS_DATA and ALL_PLAYERS as the page decodes them, with player views read into
+    plain records and missing values (null, NaN) as ''."""
+    fields = json.dumps(list(teams_json[0]['players'][0]))
+    script = create.render_teams_script(teams_json, data_format) + f"""
+const fields = {fields};
+const blank = value => (value === null || value === undefined || Number.isNaN(value) ? '' : value);
+const plain = p => Object.fromEntries(fields.map(field => [field, blank(p[field])]));
+process.stdout.write(JSON.stringify({{
+    teams: TEAMS_DATA.map(team => ({{ ...team, players: team.players.map(plain) }})),
+    allPlayers: ALL_PLAYERS.map(p => [p.record_id, p.team, p.team_source_idx, p.player_idx]),
+}}));
+"""
+    out = subprocess.run(['node', '-'], input=script, capture_output=True, text=True, encoding="utf-8", check=True)
+    return json.loads(out.stdout)
+
+
+def with_blanks(teams_json):
+    """``json_safe`` TEAMS_DATA with null player values as '', as :func:`page_teams` reads them."""
+    return [
+        {**team, 'players': [{key: '' if value is None else value for key, value in p.items()} for p in team['players']]}
+        for team in create.json_safe(teams_json)
+    ]
+
+
+# Engines: every way of building TEAMS_DATA gives the csv engine's result
+@pytest.mark.parametrize('build', [
+    lambda path: create.build_teams(path, 'pandas'),
+    lambda path: create.stream_teams_json(path, 4),
+    lambda path: create.parallel_teams_json(path, 'csv', 2),
+    lambda path: create.parallel_teams_json(path, 'pandas', 1),
+], ids=['pandas', 'stream', 'workers', 'blocks-pandas'])
+def test_engines_match_csv_engine(export_path, reference, build):
+    assert canonical(build(export_path)) == canonical(reference)
+
+
+def test_reference_shape(reference):
+    assert [team['team_id'] for team in reference] == [
+        '__export__.x_team_11', '__export__.x_team_12', '__export__.x_team_21',
+        '__export__.x_team_22', '__export__.x_team_31',
+    ]
+    # The staff-only row adds no player; the school name is forward filled
+    assert [len(team['players']) for team in reference] == [3, 2, 3, 2, 2]
+    assert reference[1]['school'] == 'Colegio San José'
+    assert [team['source_idx'] for team in reference] == list(range(5))
+
+
+@pytest.mark.parametrize('engine', ['csv', 'pandas'])
+def test_block_cache_cold_and_warm(tmp_path, export_path, reference, engine):
+    cache_dir = str(tmp_path / "cache")
+    cold = create.BuildCache(cache_dir, export_path, {'engine': engine})
+    assert canonical(cold.build_teams(engine)) == canonical(reference)
+    assert cold.stats == {'blocks': 3, 'rebuilt': 3}
+    cold.save([])
+
+    warm = create.BuildCache(cache_dir, export_path, {'engine': engine})
+    assert canonical(warm.build_teams(engine)) == canonical(reference)
+    assert warm.stats == {'blocks': 3, 'rebuilt': 0}
+
+
+def test_block_cache_rebuilds_only_changed_school(tmp_path, export_text, reference):
+    cache_dir = str(tmp_path / "cache")
+    path = write_export(tmp_path / "export.csv", export_text)
+    cache = create.BuildCache(cache_dir, path, {})
+    cache.build_teams()
+    cache.save([])
+
+    write_export(tmp_path / "export.csv", export_text.replace('Kevin Morales Reyes', 'Kevin Morales Rivera'))
+    cache = create.BuildCache(cache_dir, path, {})
+    teams_json = cache.build_teams()
+    assert cache.stats == {'blocks': 3, 'rebuilt': 1}
+    assert canonical(teams_json) == canonical(create.build_teams(path))
+
+
+@pytest.mark.parametrize('engine', ['csv', 'pandas'])
+def test_profiled_build_times_each_stage(export_path, reference, engine):
+    profile = create.StageProfile()
+    try:
+        teams_json = create.build_teams(export_path, engine, profile)
+    finally:
+        tracemalloc.stop()
+    assert canonical(teams_json) == canonical(reference)
+    stages = {stage['stage']: stage for stage in profile.stages}
+    assert {'Load CSV', 'Extract links', 'Format DOB', 'Build data structure'} <= stages.keys()
+    assert stages['Extract links']['rows'] == 12
+    assert all(stage['peak_bytes'] >= stage['peak_delta_bytes'] >= 0 for stage in profile.stages)
+    report = profile.report(engine=engine)
+    assert report['total_seconds'] == pytest.approx(sum(stage['seconds'] for stage in profile.stages))
+
+
+# Diff and patch
+def test_patch_round_trip(tmp_path, export_text):
+    def edit(rows):
+        rows = [row for row in rows if row[10] != 'Javieris Cruz Ramos']
+        for row in rows:
+            if row[10] == 'Ektor Vargas Santiago':
+                row[12] = '99'
+            if row[4] == 'Ponce - Publica - Masculino':
+                row[4] = 'Ponce - Publica - Varones'
+        rows.append([''] * 10 + ['Nuevo Jugador Vega', '2008-01-15', '4', '', '12th Grade', ''])
+        return rows
+
+    old_teams, _ = create.assign_stable_ids(create.build_teams(write_export(tmp_path / "old.csv", export_text)))
+    new_teams, _ = create.assign_stable_ids(
+        create.build_teams(write_export(tmp_path / "new.csv", edit_rows(export_text, edit)))
+    )
+    patch = create.build_patch(old_teams, new_teams)
+    # The page receives the patch as JSON
+    patch = json.loads(json.dumps(create.json_safe(patch)))
+    assert canonical(create.apply_patch(old_teams, patch)) == canonical(new_teams)
+    assert len(patch['delete_players']) == 1
+    assert [player['name'] for player in patch['upsert_players']] == ['Ektor Vargas Santiago', 'Nuevo Jugador Vega']
+    assert [team['team'] for team in patch['upsert_teams']] == ['Ponce - Publica - Varones']
+
+    # The rename is a team change; the renamed team's players stay matched
+    report = create.diff_exports(old_teams, new_teams)
+    assert report['summary']['players_added'] == 1
+    assert report['summary']['players_removed'] == 1
+    assert report['teams']['changed'] == [{
+        'team': 'Ponce - Publica - Varones',
+        'changes': {'team': ['Ponce - Publica - Masculino', 'Ponce - Publica - Varones']},
+    }]
+    assert report['players']['changed'][0]['changes'] == {'jersey': ['27', '99']}
+
+
+def test_patch_between_identical_exports_is_empty(export_path):
+    teams_json, _ = create.assign_stable_ids(create.build_teams(export_path))
+    again, _ = create.assign_stable_ids(create.build_teams(export_path))
+    patch = create.build_patch(teams_json, again)
+    assert patch['upsert_teams'] == patch['upsert_players'] == patch['delete_players'] == []
+    assert patch['rosters'] == {}
+    assert create.diff_exports(teams_json, again)['summary']['players_unchanged'] == 12
+
+
+# Data formats: the page reads the same TEAMS_DATA from every embedding
+@needs_node
+def test_compact_format_decodes_to_full_records(reference, age_rules):
+    create.apply_age_eligibility(reference, CUTOFF, age_rules)
+    create.apply_roster_checks(reference)
+    full, compact = page_teams(reference, 'full'), page_teams(reference, 'compact')
+    assert compact == full
+    assert compact['teams'] == with_blanks(reference)
+    payload = create.teams_payload(reference, 'compact')
+    # URLs become file ids; repeated eligibility reasons a table index
+    assert 'cert_url' not in payload['teams'][0]['players'][0]
+    assert payload['teams'][0]['players'][1]['photo_id'] == '=cert_id'
+    assert len(payload['tables']['eligibility_reason']) < 12
+    assert len(json.dumps(payload)) < len(json.dumps(create.json_safe(reference)))
+
+
+@needs_node
+def test_columnar_format_decodes_to_full_records(reference, age_rules):
+    create.apply_age_eligibility(reference, CUTOFF, age_rules)
+    create.apply_roster_checks(reference)
+    columnar = page_teams(reference, 'columnar')
+    # ALL_PLAYERS are the columnar player views themselves, with the team fields read through
+    assert columnar == page_teams(reference, 'full')
+    assert columnar['allPlayers'][3] == ['player_0004', 'San José - Mini - Femenino', 1, 0]
+    payload = create.teams_payload(reference, 'columnar')
+    assert payload['players']['team'] == [0, 0, 0, 1, 1, 2, 2, 2, 3, 3, 4, 4]
+    # Low-cardinality columns are a value table plus codes
+    assert payload['players']['photo_id']['values'] == ['=cert_id', None]
+    assert create._decoded_column(payload['players']['photo_id'])[4] is None
+
+
+# Split layout: deltas patch the decoded records in every format
+@pytest.mark.parametrize('data_format', ['full', 'compact', 'columnar'])
+def test_split_delta_chain(tmp_path, export_text, data_format):
+    out_dir = tmp_path / "site"
+    renamed = export_text.replace('Kevin Morales Reyes', 'Kevin Morales Rivera')
+    data_files = []
+    for i, text in enumerate([export_text, renamed]):
+        teams_json, _ = create.assign_stable_ids(create.build_teams(write_export(tmp_path / f"{i}.csv", text)))
+        data_files.append(create.write_split_dashboard(str(out_dir), teams_json, data_format))
+
+    def decoded(name):
+        return create.decoded_teams(json.loads((out_dir / name).read_text(encoding="utf-8")), data_format)
+
+    versions = json.loads((out_dir / create.SPLIT_VERSIONS).read_text(encoding="utf-8"))
+    assert versions['format'] == data_format
+    [(old_version, delta)] = versions['deltas'].items()
+    assert data_files == [f"data.{old_version}.json", f"data.{delta['to']}.json"]
+    patch = json.loads((out_dir / delta['file']).read_text(encoding="utf-8"))
+    assert [player['name'] for player in patch['upsert_players']] == ['Kevin Morales Rivera']
+    assert canonical(create.apply_patch(decoded(data_files[0]), patch)) == canonical(decoded(data_files[1]))
+
+
+def test_split_headers_live_at_publish_root(tmp_path, reference):
+    (tmp_path / "_headers").write_text("/*\n  X-Frame-Options: DENY\n", encoding="utf-8")
+    for _ in range(2):
+        create.write_split_dashboard(str(tmp_path / "site"), reference, publish_root=str(tmp_path))
+    headers = (tmp_path / "_headers").read_text(encoding="utf-8")
+    assert headers.startswith("/*\n  X-Frame-Options: DENY\n# create.py --split /site/\n")
+    assert headers.count("/site/app.*") == 1
+    assert not (tmp_path / "site" / "_headers").exists()
+
+    create.write_split_dashboard(str(tmp_path / "alone"), reference)
+    assert (tmp_path / "alone" / "_headers").read_text(encoding="utf-8").splitlines()[1] == "/app.*"
+    with pytest.raises(ValueError, match="not inside"):
+        create.write_split_dashboard(str(tmp_path / "out"), reference, publish_root=str(tmp_path / "site"))
+
+
+def test_decoded_teams_rebuild_dropped_fields(reference):
+    teams_json = create.json_safe(reference)
+    for data_format in ('compact', 'columnar'):
+        payload = create.json_safe(create.teams_payload(reference, data_format))
+        players = players_by_name(create.decoded_teams(payload, data_format))
+        assert players.keys() == players_by_name(teams_json).keys()
+        for name, player in players_by_name(teams_json).items():
+            assert players[name]['cert_url'] == player['cert_url']
+            assert players[name]['waiver_preview'] == player['waiver_preview']
+            if player['dob_display']:
+                assert players[name]['dob_display'] == player['dob_display']
+
+
+# Shards
+def test_write_shards(tmp_path, reference):
+    teams_json, id_map = create.assign_stable_ids(reference)
+    paths = create.write_shards(str(tmp_path), teams_json, ['category', 'school'], id_map=id_map, workers=1)
+    names = [os.path.basename(path) for path in paths]
+    assert names == [
+        'category-jm.html', 'category-jrf.html', 'category-mf.html', 'category-pm.html', 'category-srm.html',
+        'school-academia-lares.html', 'school-colegio-san-jose.html', 'school-escuela-ponce-and-artes.html',
+        'index.html',
+    ]
+    index = (tmp_path / "index.html").read_text(encoding="utf-8")
+    assert all(f'href="{name}"' in index for name in names[:-1])
+    assert '<a href="school-academia-lares.html">Academia Lares</a> <span>2 equipos · 5 jugadores' in index
+
+    # A shard embeds only its teams, and only its players' id migrations
+    shard = (tmp_path / "school-academia-lares.html").read_text(encoding="utf-8")
+    assert '"team": "Lares - Juvenil - Masculino"' in shard
+    assert '"team": "Ponce - Publica - Masculino"' not in shard
+    migration = json.loads(re.search(r"const RECORD_ID_MIGRATION = (.*);", shard).group(1))
+    lares_ids = {player['record_id'] for team in teams_json[2:4] for player in team['players']}
+    assert set(migration.values()) == lares_ids
+    assert migration == {old: new for old, new in id_map.items() if new in lares_ids}
+
+
+# Stable record ids
+def test_record_ids_survive_reordering(tmp_path, export_text):
+    def move_last_school_first(rows):
+        return rows[11:] + rows[:11]
+
+    teams_json, _ = create.assign_stable_ids(create.build_teams(write_export(tmp_path / "a.csv", export_text)))
+    reordered, _ = create.assign_stable_ids(
+        create.build_teams(write_export(tmp_path / "b.csv", edit_rows(export_text, move_last_school_first)))
+    )
+    ids = {name: player['record_id'] for name, player in players_by_name(teams_json).items()}
+    assert {name: player['record_id'] for name, player in players_by_name(reordered).items()} == ids
+    assert all(record_id.startswith(create.STABLE_ID_PREFIX) for record_id in ids.values())
+
+
+def test_record_ids_follow_team_id_across_renames(tmp_path, export_text):
+    renamed = export_text.replace('Lares - Juvenil - Masculino', 'Lares - Juvenil - Varones')
+    teams_json, _ = create.assign_stable_ids(create.build_teams(write_export(tmp_path / "a.csv", export_text)))
+    after, id_map = create.assign_stable_ids(create.build_teams(write_export(tmp_path / "b.csv", renamed)))
+    before_ids = [player['record_id'] for player in teams_json[2]['players']]
+    assert [player['record_id'] for player in after[2]['players']] == before_ids
+    # Review state saved under row-order and name-based ids moves to the same ids
+    assert id_map['player_0006'] == before_ids[0]
+    assert before_ids[0] in id_map.values()
+
+
+def test_repeated_player_gets_suffix(reference):
+    teams_json, _ = create.assign_stable_ids(reference)
+    first, second = (player['record_id'] for player in teams_json[2]['players'][1:])
+    assert second == f"{first}_2"
+
+
+# Duplicate players
+def test_duplicate_clusters(reference):
+    names = {player['record_id']: player['name'] for team in reference for player in team['players']}
+    clusters = [[names[record_id] for record_id in cluster] for cluster in create.find_duplicate_clusters(reference)]
+    assert clusters == [
+        ['Derek Y Santiago Pérez', 'Derek Santiago Perez'],
+        ['Gabriel Torres Díaz', 'Gabriel Torres Díaz'],
+        ['Javieris Cruz Ramos', 'Javierys Cruz Ramos'],
+    ]
+
+
+def test_duplicate_clusters_need_a_near_identical_name():
+    def team(*players):
+        return {'players': [
+            {'record_id': f"p{i}", 'name': name, 'dob': dob} for i, (name, dob) in enumerate(players)
+        ]}
+
+    assert create.find_duplicate_clusters([team(
+        ('Player 12', '2010-01-01'), ('Player 13', '2010-01-01'),
+        ('Leo Paz Rosa', '2010-01-01'), ('Leo Pas Rosa', '2010-01-01'),
+        ('Carla Ortiz', '2010-01-01'), ('Carla Ortiz', '2010-01-02'),
+    )]) == []
+    # Three registrations of one child form one cluster
+    assert create.find_duplicate_clusters([team(
+        ('Ana Ruiz', '2010-01-01'), ('Ana Maria Ruiz', '2010-01-01'), ('Ana Maria Ruis', '2010-01-01'),
+    )]) == [['p0', 'p1', 'p2']]
+
+
+# Roster integrity
+def test_roster_checks(reference):
+    assert create.apply_roster_checks(reference, min_players=3, max_players=15) == {'teams': 5, 'players': 7}
+    senior, mini, juvenil, _, ponce = reference
+    assert [player['roster_flags'] for player in senior['players']] == [
+        'duplicate_jersey', '', 'duplicate_jersey missing_waiver',
+    ]
+    assert senior['roster_flags'] == 'duplicate_jersey missing_waiver'
+    assert senior['roster_summary'] == 'Jersey #5 ×2; 1 missing waiver'
+    # A blank jersey is missing, not shared
+    assert mini['players'][1]['roster_flags'] == 'missing_jersey missing_cert missing_waiver missing_photo'
+    assert mini['roster_summary'].startswith('2 players (min 3); 1 without jersey')
+    assert juvenil['roster_summary'] == 'Jersey #12 ×2; 1 missing cert; 1 missing waiver; 1 missing photo'
+    assert ponce['roster_flags'] == 'too_few_players'
+
+    create.apply_roster_checks(reference, min_players=0, max_players=2)
+    assert senior['roster_flags'].endswith('too_many_players')
+    assert ponce['roster_flags'] == ponce['roster_summary'] == ''
+
+
+# School master list and division diagnostics
+MASTER_CSV = """id,x_name,x_studio_teams/id,x_studio_teams/x_name
+__export__.x_school_1_aaaa,Colegio San José de Lares,__export__.x_team_11,San José - Senior - Masculino
+,,__export__.x_team_13,San José - Junior - Femenino
+__export__.x_school_2_bbbb,Academia Lares,,Lares - Junior - Femenino
+__export__.x_school_9_zzzz,Academia Nueva,,
+"""
+
+
+def test_school_master_join(tmp_path, reference):
+    master = create.read_school_master(write_export(tmp_path / "schools.csv", MASTER_CSV))
+    assert master['__export__.x_school_1_aaaa']['teams'] == {
+        '__export__.x_team_11': 'San José - Senior - Masculino',
+        '__export__.x_team_13': 'San José - Junior - Femenino',
+    }
+    rows = {row['school']: row for row in create.school_category_diagnostics(reference, {}, master)}
+    # Teams join by school id, so the renamed school keeps its teams and players
+    assert rows['Colegio San José de Lares']['actual'] == ['MF', 'SRM']
+    assert rows['Colegio San José de Lares']['players'] == 5
+    assert rows['Colegio San José de Lares']['teams'] == 3
+    assert rows['Colegio San José de Lares']['empty_teams'] == ['San José - Junior - Femenino']
+    # A listed team without an id matches by name
+    assert rows['Academia Lares']['empty_teams'] == []
+    assert rows['Academia Nueva'] == {
+        'school': 'Academia Nueva', 'has_rule': False, 'expected': [], 'actual': [], 'missing': [],
+        'extra': [], 'teams': 0, 'players': 0, 'empty_teams': [],
+    }
+    assert rows['Escuela Ponce & Artes']['teams'] == 1
+
+
+def test_school_category_diagnostics(reference):
+    rules = {
+        create.normalize_key('Colegio San José'): ('Colegio San José', ['MF', 'SRF', 'SRM']),
+        create.normalize_key('Academia Lares'): ('Academia Lares', ['JM', 'JRF']),
+        create.normalize_key('Colegio Sin Equipos'): ('Colegio Sin Equipos', ['MM']),
+    }
+    rows = create.school_category_diagnostics(reference, rules)
+    # Most missing codes first, then schools without a rule
+    assert [(row['school'], row['missing'], row['extra']) for row in rows] == [
+        ('Colegio San José', ['SRF'], []),
+        ('Colegio Sin Equipos', ['MM'], []),
+        ('Academia Lares', [], []),
+        ('Escuela Ponce & Artes', [], ['PM']),
+    ]
+    assert rows[0]['players'] == 5 and rows[1]['teams'] == 0
+    assert not rows[3]['has_rule']
+    script = create.render_diagnostics_script(rows)
+    assert json.loads(script.removeprefix('const SCHOOL_CATEGORY_DIAGNOSTICS = ').rstrip(';')) == rows
+
+
+def test_eligibility_rules_keep_known_codes():
+    rules = create.build_eligibility_rules()
+    schools = create.school_category_rules.SCHOOL_CATEGORY_RAW_CODES
+    assert rules.keys() == {create.normalize_key(school) for school in schools}
+    for school, codes in rules.values():
+        assert codes == sorted(codes) and set(codes) <= create.CATEGORY_CODE_METADATA.keys()
+
+
+# Search index
+def test_search_index(reference):
+    index = create.build_search_index(reference)
+    assert index['tokens'] == sorted(index['tokens'])
+    postings = dict(zip(index['tokens'], index['teams']))
+    # Accents are folded the way the page folds the query; each team is listed once
+    assert postings['jose'] == [0, 1]
+    assert postings['gabriel'] == [2]
+    assert 'josé' not in postings
+
+    def search(prefix):
+        return sorted({t for token, teams in postings.items() if token.startswith(prefix) for t in teams})
+
+    assert search('javier') == [3, 4]
+    assert search('ponce') == [4]
+    script = create.render_teams_script(reference)
+    assert f"const SEARCH_INDEX = {create.script_json(index, separators=(',', ':'))};" in script
+
+
+# Export detection
+def friendly_export(export_text, delimiter):
+    friendly = {aliases[0]: aliases[-1] for aliases in create.EXPORT_COLUMN_ALIASES.values()}
+    friendly[create.WAIVER_HTML_COL] = 'x_studio_teams/x_studio_players/x_studio_waiver_html'
+    rows = list(csv.reader(io.StringIO(export_text)))
+    rows[0] = [friendly.get(name, name).upper() for name in rows[0]]
+    out = io.StringIO()
+    csv.writer(out, delimiter=delimiter, lineterminator="\n").writerows(rows)
+    return "\ufeff" + out.getvalue()
+
+
+@pytest.mark.parametrize('delimiter', [';', '\t'])
+def test_detects_delimiter_and_aliases(tmp_path, export_text, reference, delimiter):
+    path = write_export(tmp_path / "export.csv", friendly_export(export_text, delimiter))
+    schema = create.detect_schema(path)
+    assert schema.delimiter == delimiter
+    assert schema.columns[create.SCHOOL_COL] == 0
+    assert schema.columns[create.WAIVER_HTML_COL] == len(schema.header) - 1
+    create.require_columns(schema)
+    for engine in ('csv', 'pandas'):
+        assert canonical(create.build_teams(path, engine)) == canonical(reference)
+
+
+def test_sniffing_ignores_delimiters_inside_quotes():
+    assert create.sniff_delimiter('a,b,c\n"x;y;z;w",2,3\n') == ','
+    assert create.sniff_delimiter('a;b;c\n"x,y,z,w";2;3\n') == ';'
+
+
+def test_missing_column_is_reported_by_canonical_name(tmp_path, export_text):
+    path = write_export(tmp_path / "export.csv", export_text.replace(create.DOB_COL, 'Birthday', 1))
+    with pytest.raises(ValueError, match=create.DOB_COL):
+        create.require_columns(create.detect_schema(path))
+
+
+# Age eligibility
+@pytest.fixture
+def age_rules(tmp_path):
+    path = tmp_path / "ages.json"
+    path.write_text(json.dumps(AGE_LIMITS), encoding="utf-8")
+    return create.load_age_rules(str(path))
+
+
+@pytest.mark.parametrize('vectorized', [False, True], ids=['stdlib', 'numpy'])
+def test_age_eligibility(reference, age_rules, vectorized):
+    counts = create.apply_age_eligibility(reference, CUTOFF, age_rules, vectorized=vectorized)
+    players = players_by_name(reference)
+    assert players['Derek Y Santiago Pérez']['eligible'] is True
+    assert players['Derek Y Santiago Pérez']['eligibility_reason'] == f"Age 16 on {CUTOFF}"
+    assert players['Derek Santiago Perez']['eligible'] is False
+    assert players['Derek Santiago Perez']['eligibility_reason'] == f"Age 16 on {CUTOFF}; Juvenil allows at most 14"
+    assert players['María Colón Vega']['eligible'] is True
+    # Partial and missing dates cannot be checked; Publica has no rule
+    assert players['Luis Rivera Ortiz']['eligibility_reason'] == "No valid date of birth"
+    assert players['Sofía Reyes Nieves']['eligible'] is None
+    assert players['Kevin Morales Reyes']['eligibility_reason'] == "No age rule for this category"
+    assert counts['ineligible'] == 1
+
+
+def test_age_paths_agree(export_path, age_rules):
+    stdlib, vectorized = create.build_teams(export_path), create.build_teams(export_path)
+    assert (create.apply_age_eligibility(stdlib, CUTOFF, age_rules)
+            == create.apply_age_eligibility(vectorized, CUTOFF, age_rules, vectorized=True))
+    assert canonical(stdlib) == canonical(vectorized)
+
+
+def test_partial_dates_do_not_depend_on_other_rows():
+    alone = create.parse_dobs(['2010-05', '2010'])
+    mixed = create.parse_dobs(['2010-05', '2010', '2009-12-09', '2010-02-30'])
+    assert list(map(str, alone)) == ['NaT', 'NaT']
+    assert list(map(str, mixed)) == ['NaT', 'NaT', '2009-12-09', 'NaT']